@@ -0,0 +1,35 @@
+"""
+Times convoy-heavy adjudication: random positions on a synthetic board with a sea lane every third
+column where most troops next to a lane are convoyed, and single convoys across large blocks of
+transporting fleets. Each timing is the best of five runs.
+
+    python -m benchmarks.bench_convoys [repeats]
+"""
+import sys
+import timeit
+
+from benchmarks.synthetic import convoy_position, grid_position
+from pydip.turn.resolve import resolve_turn
+
+
+def main(repeats=20):
+    grids = [grid_position(seed, sea_every=3, occupancy=0.8, convoy_ratio=0.9) for seed in range(10)]
+    elapsed = min(timeit.repeat(lambda: [resolve_turn(*position) for position in grids], number=repeats, repeat=5))
+    unit_count = sum(len(commands) for _, commands in grids) // len(grids)
+    print('convoy-heavy 24x12 grid, ~{} units: {:8.3f} ms/position'.format(
+        unit_count,
+        elapsed / (repeats * len(grids)) * 1e3,
+    ))
+
+    for length, width in ((10, 3), (40, 3), (40, 10)):
+        position = convoy_position(length, width)
+        elapsed = min(timeit.repeat(lambda: resolve_turn(*position), number=max(1, repeats // 4), repeat=5))
+        print('convoy across {:>2} x {:>2} fleets:        {:8.3f} ms/position'.format(
+            length,
+            width,
+            elapsed / max(1, repeats // 4) * 1e3,
+        ))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
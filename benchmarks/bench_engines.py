@@ -0,0 +1,59 @@
+"""
+Compares resolve_turn's engines on the DATC cases, random positions on a large synthetic board, and
+single chains of dependent moves. Every engine must agree with the recursive one on each position.
+
+    python -m benchmarks.bench_engines [repeats]
+"""
+import sys
+import timeit
+
+from benchmarks.datc import datc_positions
+from benchmarks.synthetic import chain_position, grid_position
+from pydip.turn.resolve import resolve_turn
+
+
+ENGINES = ['recursive', 'scc', 'iterative']
+
+
+def _time_engines(label, positions, repeats):
+    expected = [resolve_turn(game_map, commands, engine='recursive') for game_map, commands in positions]
+    print('{} ({} positions, {} repeats)'.format(label, len(positions), repeats))
+    for engine in ENGINES:
+        results = [resolve_turn(game_map, commands, engine=engine) for game_map, commands in positions]
+        assert results == expected, 'engine {} disagrees with recursive engine'.format(engine)
+        elapsed = timeit.timeit(
+            lambda: [resolve_turn(game_map, commands, engine=engine) for game_map, commands in positions],
+            number=repeats,
+        )
+        print('  {:<10} {:8.3f} ms/position'.format(engine, elapsed / (repeats * len(positions)) * 1e3))
+
+
+def _deepest_chains(lengths):
+    print('chain of dependent moves')
+    for length in lengths:
+        game_map, commands = chain_position(length)
+        timings = []
+        for engine in ENGINES:
+            try:
+                elapsed = timeit.timeit(lambda: resolve_turn(game_map, commands, engine=engine), number=1)
+                timings.append('{:8.3f} ms'.format(elapsed * 1e3))
+            except RecursionError:
+                timings.append('{:>11}'.format('RecursionError'))
+        print('  {:>6} units  {}'.format(length, '  '.join(
+            '{}: {}'.format(engine, timing) for engine, timing in zip(ENGINES, timings)
+        )))
+
+
+def main(repeats=20):
+    datc = [(game_map, commands) for _, game_map, commands in datc_positions()]
+    _time_engines('DATC cases', datc, repeats)
+
+    grids = [grid_position(seed) for seed in range(10)]
+    unit_count = sum(len(commands) for _, commands in grids) // len(grids)
+    _time_engines('24x12 grid, ~{} units'.format(unit_count), grids, max(1, repeats // 4))
+
+    _deepest_chains([100, 1000, 10000])
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,94 @@
+"""
+Compares re-resolving a turn after a single order changes, with IncrementalAdjudicator, against a
+full resolve_turn of the changed orders. Each unit's order is changed in turn (a hold becomes a
+move, anything else becomes a hold) and then changed back, on random full-board positions on the
+vanilla map and on random positions on a large synthetic board. The incremental retreat maps must
+agree with resolve_turn for every change.
+
+    python -m benchmarks.bench_incremental [repeats]
+"""
+import sys
+import timeit
+
+from benchmarks.positions import full_board_position
+from benchmarks.synthetic import grid_position
+from pydip.player.command.command import HoldCommand, MoveCommand
+from pydip.player.helpers import unit_can_enter
+from pydip.turn.incremental import IncrementalAdjudicator
+from pydip.turn.resolve import resolve_turn
+
+
+def _alternative_command(game_map, command):
+    """ Returns a hold for command's unit, or a move for it if command is already a hold """
+    if not isinstance(command, HoldCommand):
+        return HoldCommand(command.player, command.unit)
+    for destination in sorted(game_map.adjacency[command.unit.position]):
+        if unit_can_enter(game_map, command.unit, game_map.name_map[destination]):
+            return MoveCommand(command.player, command.unit, destination)
+    return command
+
+
+def _changes(game_map, commands):
+    """ Returns each order changed and then restored, as a list of commands passed to change_command """
+    changes = []
+    for command in commands:
+        changes.append(_alternative_command(game_map, command))
+        changes.append(command)
+    return changes
+
+
+def _changed_turns(commands, changes):
+    """ Returns the full list of commands after each change, for resolve_turn """
+    current = { command.unit.position: command for command in commands }
+    turns = []
+    for change in changes:
+        current[change.unit.position] = change
+        turns.append(list(current.values()))
+    return turns
+
+
+def _time_changes(label, positions, repeats):
+    workloads = []
+    for game_map, commands in positions:
+        changes = _changes(game_map, commands)
+        workloads.append((game_map, commands, changes, _changed_turns(commands, changes)))
+    change_count = sum(len(changes) for _, _, changes, _ in workloads)
+
+    cone_sizes = []
+    for game_map, commands, changes, turns in workloads:
+        adjudicator = IncrementalAdjudicator(game_map, commands)
+        for change, turn in zip(changes, turns):
+            assert adjudicator.change_command(change) == resolve_turn(game_map, turn)
+            cone_sizes.append(len(adjudicator.last_cone) / len(commands))
+
+    def run_incremental():
+        for game_map, commands, changes, _ in workloads:
+            adjudicator = IncrementalAdjudicator(game_map, commands)
+            for change in changes:
+                adjudicator.change_command(change)
+
+    def run_full():
+        for game_map, _, _, turns in workloads:
+            for turn in turns:
+                resolve_turn(game_map, turn)
+
+    incremental = min(timeit.repeat(run_incremental, number=1, repeat=repeats)) / change_count * 1e3
+    full = min(timeit.repeat(run_full, number=1, repeat=repeats)) / change_count * 1e3
+    print('{} ({} positions, {} changes)'.format(label, len(positions), change_count))
+    print('  resolve_turn  {:8.4f} ms/change'.format(full))
+    print('  incremental   {:8.4f} ms/change  x{:.1f}, re-resolving {:.1%} of orders on average'.format(
+        incremental,
+        full / incremental,
+        sum(cone_sizes) / len(cone_sizes),
+    ))
+
+
+def main(repeats=5):
+    _time_changes('full board', [full_board_position(seed) for seed in range(20)], repeats)
+    grids = [grid_position(seed) for seed in range(3)]
+    unit_count = sum(len(commands) for _, commands in grids) // len(grids)
+    _time_changes('24x12 grid, ~{} units'.format(unit_count), grids, repeats)
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,136 @@
+"""
+Memory benchmark for holding many candidate orders, as a bot searching over order sets would.
+
+For each full 34 supply centre position, generates every legal hold, move and support order for
+every unit, building each order from scratch as an order parser would (so each has its own Unit
+arguments). Measures the memory allocated per order, with tracemalloc, when they are held as:
+  * unslotted:    objects with the same attributes as Commands and Units, but an instance __dict__
+                  and no interning, as Commands and Units were before they used __slots__
+  * commands:     Command objects
+  * order batch:  rows of an OrderBatch (pydip.turn.order_batch)
+  * encoded:      a binary record per position (pydip.turn.encoding)
+
+    python -m benchmarks.bench_memory [position count]
+"""
+import sys
+import tracemalloc
+
+from benchmarks.positions import full_board_position
+from pydip.player.command.command import HoldCommand, MoveCommand, SupportCommand
+from pydip.player.helpers import unit_can_enter, unit_can_support
+from pydip.player.unit import Unit
+from pydip.turn.encoding import encode_commands
+from pydip.turn.order_batch import OrderBatch
+
+
+def candidate_orders(game_map, commands):
+    """
+    Returns (Player, command class, unit type, position, destination, supported unit or None) for
+    every legal hold, move and support order available to the units ordered in commands
+    """
+    units = { command.unit.position: (command.player, command.unit) for command in commands }
+    orders = []
+    for position, (player, unit) in sorted(units.items()):
+        orders.append((player, HoldCommand, unit.unit_type, position, None, None))
+        for destination in sorted(game_map.adjacency[position]):
+            territory = game_map.name_map[destination]
+            if unit_can_enter(game_map, unit, territory):
+                orders.append((player, MoveCommand, unit.unit_type, position, destination, None))
+            for other_position, (_, other_unit) in units.items():
+                if other_position == position or not unit_can_support(game_map, unit, territory):
+                    continue
+                if destination == other_position or unit_can_enter(game_map, other_unit, territory):
+                    orders.append((player, SupportCommand, unit.unit_type, position, destination, other_unit))
+    return orders
+
+
+def _build_command(player, command_class, unit_type, position, destination, supported_unit):
+    unit = Unit(unit_type, position)
+    if command_class is HoldCommand:
+        return HoldCommand(player, unit)
+    if command_class is MoveCommand:
+        return MoveCommand(player, unit, destination)
+    return SupportCommand(player, unit, Unit(supported_unit.unit_type, supported_unit.position), destination)
+
+
+class _UnslottedUnit:
+    """ A unit with an instance __dict__ """
+
+    def __init__(self, unit_type, position):
+        self.unit_type = unit_type
+        self.position = position
+
+
+class _UnslottedCommand:
+    """ A hold, move or support with an instance __dict__, holding the attributes its Command would """
+
+    def __init__(self, player, unit, destination, supported_unit=None):
+        self.player = player
+        self.unit = unit
+        self.destination = destination
+        if supported_unit is not None:
+            self.supported_unit = supported_unit
+
+
+def _build_unslotted_command(player, command_class, unit_type, position, destination, supported_unit):
+    unit = _UnslottedUnit(unit_type, position)
+    if command_class is HoldCommand:
+        return _UnslottedCommand(player, unit, position)
+    if command_class is MoveCommand:
+        return _UnslottedCommand(player, unit, destination)
+    supported_unit = _UnslottedUnit(supported_unit.unit_type, supported_unit.position)
+    return _UnslottedCommand(player, unit, destination, supported_unit)
+
+
+def _measure(build):
+    """ Returns (value built, bytes allocated by build and still held) """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        value = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, after - before
+
+
+def main(position_count=20):
+    positions = [full_board_position(seed) for seed in range(position_count)]
+    candidates = [(game_map, candidate_orders(game_map, commands)) for game_map, commands in positions]
+    order_count = sum(len(orders) for _, orders in candidates)
+
+    _, unslotted_bytes = _measure(lambda: [
+        [_build_unslotted_command(*order) for order in orders]
+        for _, orders in candidates
+    ])
+
+    commands, command_bytes = _measure(lambda: [
+        [_build_command(*order) for order in orders]
+        for _, orders in candidates
+    ])
+
+    def build_batches():
+        batches = []
+        for (game_map, _), position_commands in zip(candidates, commands):
+            batches.append(OrderBatch.from_commands(game_map, position_commands))
+        return batches
+    _, batch_bytes = _measure(build_batches)
+
+    _, encoded_bytes = _measure(lambda: [
+        encode_commands(game_map, position_commands)
+        for (game_map, _), position_commands in zip(candidates, commands)
+    ])
+
+    print('{} positions, {} candidate orders'.format(position_count, order_count))
+    measurements = (
+        ('unslotted', unslotted_bytes),
+        ('commands', command_bytes),
+        ('order batch', batch_bytes),
+        ('encoded', encoded_bytes),
+    )
+    for label, allocated in measurements:
+        print('  {:<12} {:10d} bytes, {:7.1f} bytes/order'.format(label, allocated, allocated / order_count))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Micro-benchmark for strength calculations on full 34 supply centre positions.
+
+Compares the support counting in pydip.turn.resolve against the previous approach of filtering
+and materialising the support list on every query. Both are run against an already resolved
+context, which isolates the cost of the strength queries themselves.
+
+    python -m benchmarks.bench_strength [position count] [repeats]
+"""
+import sys
+import timeit
+
+from benchmarks.positions import full_board_position
+from pydip.player.command.command import MoveCommand
+from pydip.turn.command_map import CommandMap
+from pydip.turn.resolve import ResolutionContext, _resolve, _run_steps, _support_count_steps, resolve_turn
+
+
+def _filtered_support_count(context, source, destination):
+    supporters = context.command_map.get_supports(source, destination)
+    supporters = filter(lambda c: _resolve(context, c), supporters)
+    return len(list(supporters))
+
+
+def _layered_support_count(context, source, destination):
+    return _run_steps(context, _support_count_steps(context, source, destination))
+
+
+def _resolved_context(game_map, commands):
+    command_map = CommandMap(game_map, commands)
+    context = ResolutionContext(game_map, command_map)
+    for command in commands:
+        _resolve(context, command)
+    return context
+
+
+def _query_all(count_function, context, queries):
+    for source, destination in queries:
+        count_function(context, source, destination)
+
+
+def main(position_count=20, repeats=200):
+    positions = [full_board_position(seed) for seed in range(position_count)]
+    contexts = []
+    for game_map, commands in positions:
+        queries = [
+            (command.unit.position, command.destination)
+            for command in commands if isinstance(command, MoveCommand)
+        ]
+        contexts.append((_resolved_context(game_map, commands), queries))
+
+    print('{} positions of 34 units, {} repeats'.format(position_count, repeats))
+    for label, count_function in (('filter + list', _filtered_support_count), ('support counts', _layered_support_count)):
+        elapsed = timeit.timeit(
+            lambda: [_query_all(count_function, context, queries) for context, queries in contexts],
+            number=repeats,
+        )
+        query_count = sum(len(queries) for _, queries in contexts) * repeats
+        print('  {:<16} {:8.3f} ms total, {:6.3f} us/query'.format(label, elapsed * 1e3, elapsed / query_count * 1e6))
+
+    elapsed = timeit.timeit(lambda: [resolve_turn(*position) for position in positions], number=max(1, repeats // 10))
+    print('  {:<16} {:8.3f} ms/position'.format('resolve_turn', elapsed / (max(1, repeats // 10) * position_count) * 1e3))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
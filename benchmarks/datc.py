@@ -0,0 +1,72 @@
+"""
+Replays the DATC test cases in pydip/test/datc_tests as benchmark input. Each case is run once,
+with the adjudication entry points wrapped so that every call they receive is recorded and can
+be timed again in isolation afterwards.
+"""
+import importlib
+import pkgutil
+
+from benchmarks.phases import PHASES, phase_function
+import pydip.test.adjustment_helper
+import pydip.test.datc_tests
+import pydip.test.retreat_helper
+import pydip.test.turn_helper
+import pydip.turn.adjustment
+import pydip.turn.resolve
+import pydip.turn.retreat
+
+
+def datc_calls():
+    """
+    Returns phase name -> [(case name, args)], holding the arguments of every call made to the
+    function for each of the PHASES while running the DATC test cases, in the order they were made.
+    """
+    calls = { phase: [] for phase in PHASES }
+    modules = [
+        pydip.turn.resolve,
+        pydip.turn.retreat,
+        pydip.turn.adjustment,
+        pydip.test.turn_helper,
+        pydip.test.retreat_helper,
+        pydip.test.adjustment_helper,
+    ] + _datc_modules()
+    functions = { phase: phase_function(phase) for phase in PHASES }
+
+    for case_module in _datc_modules():
+        for case in sorted(dir(case_module)):
+            if not case.startswith('test_'):
+                continue
+
+            patches = []
+            for module in modules:
+                for phase, (_, name) in PHASES.items():
+                    if getattr(module, name, None) is functions[phase]:
+                        patches.append((module, name, functions[phase]))
+                        setattr(module, name, _recorder(calls[phase], case, functions[phase]))
+            try:
+                getattr(case_module, case)()
+            finally:
+                for module, name, function in patches:
+                    setattr(module, name, function)
+
+    return calls
+
+
+def datc_positions():
+    """ Returns (case name, game_map, Command[]) for every turn resolved by the DATC test cases """
+    return [(case, game_map, list(commands)) for case, (game_map, commands) in datc_calls()['resolve_turn']]
+
+
+def _recorder(calls, case, function):
+    def record(*args):
+        calls.append((case, args))
+        return function(*args)
+    return record
+
+
+def _datc_modules():
+    return [
+        importlib.import_module('{}.{}'.format(pydip.test.datc_tests.__name__, module_info.name))
+        for module_info in pkgutil.iter_modules(pydip.test.datc_tests.__path__)
+        if module_info.name.startswith('test_')
+    ]
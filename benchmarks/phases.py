@@ -0,0 +1,80 @@
+"""
+The adjudication phases timed by the benchmark suite, and a way of producing input for every phase
+from a single movement turn.
+"""
+import pydip.turn.adjustment
+import pydip.turn.resolve
+import pydip.turn.retreat
+from pydip.map.map import OwnershipMap
+from pydip.player.command.retreat_command import RetreatDisbandCommand, RetreatMoveCommand
+from pydip.player.player import Player
+from pydip.turn.command_map import CommandMap
+from pydip.turn.resolve import ResolutionContext, _resolve
+
+
+""" String -> (module, String), each phase and the module and name of its function """
+PHASES = {
+    'resolve_turn':          (pydip.turn.resolve, 'resolve_turn'),
+    'compute_retreats':      (pydip.turn.resolve, 'compute_retreats'),
+    'resolve_retreats':      (pydip.turn.retreat, 'resolve_retreats'),
+    'calculate_adjustments': (pydip.turn.adjustment, 'calculate_adjustments'),
+}
+
+
+def phase_function(phase):
+    module, name = PHASES[phase]
+    return getattr(module, name)
+
+
+def phase_inputs(game_map, commands, ownership_map):
+    """
+    Plays a movement turn through to adjustments, returning phase name -> arguments for each of the
+    PHASES. Every dislodged unit retreats to the first of its options in alphabetical order (so that
+    retreats into the same territory bounce), or disbands if it has none.
+    """
+    command_map = CommandMap(game_map, commands)
+    context = ResolutionContext(game_map, command_map)
+    resolutions = { command.unit.position: _resolve(context, command) for command in commands }
+    retreat_map = pydip.turn.resolve.compute_retreats(game_map, command_map, commands, resolutions)
+
+    retreat_commands = _retreat_commands(game_map, retreat_map)
+    player_units = pydip.turn.retreat.resolve_retreats(retreat_map, retreat_commands)
+    player_units = player_units.with_units({
+        player_name: () for player_name in ownership_map.owned_territories if player_name not in player_units
+    })
+
+    return {
+        'resolve_turn':          (game_map, commands),
+        'compute_retreats':      (game_map, command_map, commands, resolutions),
+        'resolve_retreats':      (retreat_map, retreat_commands),
+        'calculate_adjustments': (ownership_map, player_units),
+    }
+
+
+def occupation_ownership_map(supply_map, commands):
+    """ Returns an OwnershipMap where every player owns, as home centres, the supply centres its units start in """
+    owned_territories = { command.player.name: set() for command in commands }
+    for command in commands:
+        province = supply_map.game_map.relevant_name_for_territory(command.unit.position)
+        if province in supply_map.supply_centers:
+            owned_territories[command.player.name].add(province)
+    home_territories = { player_name: set(owned) for player_name, owned in owned_territories.items() }
+    return OwnershipMap(supply_map, owned_territories, home_territories)
+
+
+def _retreat_commands(game_map, retreat_map):
+    commands = []
+    for player_name, units in sorted(retreat_map.items()):
+        retreating = sorted((unit for unit, options in units.items() if options is not None), key=lambda u: u.position)
+        if len(retreating) == 0:
+            continue
+        player = Player(player_name, game_map, [
+            { 'territory_name': unit.position, 'unit_type': unit.unit_type } for unit in retreating
+        ])
+        for unit in player.units:
+            options = units[unit]
+            if len(options) > 0:
+                commands.append(RetreatMoveCommand(retreat_map, player, unit, min(options)))
+            else:
+                commands.append(RetreatDisbandCommand(retreat_map, player, unit))
+    return commands
@@ -0,0 +1,161 @@
+"""
+Generators for realistic positions on the vanilla map, shared by the benchmarks in this directory.
+"""
+import random
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.command import HoldCommand, MoveCommand, SupportCommand
+from pydip.player.helpers import unit_can_enter
+from pydip.player.player import Player
+from pydip.player.unit import UnitTypes
+
+
+"""
+String -> [[order]], standard Spring 1901 openings for each power. Each order is a tuple of the
+unit's position followed by either:
+  * nothing, to hold
+  * a destination, to move
+  * 'supports', a supported unit's position and destination, to support
+"""
+OPENINGS = {
+    'Austria': [
+        [('Vienna', 'Galicia'), ('Budapest', 'Serbia'), ('Trieste Coast', 'Albania Coast')],
+        [('Vienna', 'Trieste'), ('Budapest', 'Serbia'), ('Trieste Coast', 'Albania Coast')],
+        [('Vienna', 'Budapest'), ('Budapest', 'Serbia'), ('Trieste Coast', 'Venice Coast')],
+    ],
+    'England': [
+        [('London Coast', 'North Sea'), ('Edinburgh Coast', 'Norwegian Sea'), ('Liverpool', 'Yorkshire')],
+        [('London Coast', 'English Channel'), ('Edinburgh Coast', 'North Sea'), ('Liverpool', 'Yorkshire')],
+        [('London Coast', 'North Sea'), ('Edinburgh Coast', 'Norwegian Sea'), ('Liverpool', 'Edinburgh')],
+    ],
+    'France': [
+        [('Paris', 'Burgundy'), ('Marseilles', 'Spain'), ('Brest Coast', 'Mid-Atlantic Ocean')],
+        [('Paris', 'Picardy'), ('Marseilles', 'Burgundy'), ('Brest Coast', 'English Channel')],
+        [('Paris', 'Gascony'), ('Marseilles', 'supports', 'Paris', 'Burgundy'), ('Brest Coast', 'Mid-Atlantic Ocean')],
+    ],
+    'Germany': [
+        [('Berlin', 'Kiel'), ('Munich', 'Ruhr'), ('Kiel Coast', 'Denmark Coast')],
+        [('Berlin', 'Kiel'), ('Munich', 'Burgundy'), ('Kiel Coast', 'Holland Coast')],
+        [('Berlin', 'Prussia'), ('Munich', 'Silesia'), ('Kiel Coast', 'Denmark Coast')],
+    ],
+    'Italy': [
+        [('Venice', 'Tyrolia'), ('Rome', 'Venice'), ('Naples Coast', 'Ionian Sea')],
+        [('Venice',), ('Rome', 'Apulia'), ('Naples Coast', 'Ionian Sea')],
+        [('Venice', 'Piedmont'), ('Rome', 'Tuscany'), ('Naples Coast', 'Tyrrhenian Sea')],
+    ],
+    'Russia': [
+        [('Moscow', 'Ukraine'), ('Warsaw', 'Galicia'), ('Sevastopol Coast', 'Black Sea'),
+         ('St. Petersburg South Coast', 'Gulf of Bothnia')],
+        [('Moscow', 'St. Petersburg'), ('Warsaw', 'Ukraine'), ('Sevastopol Coast', 'Rumania Coast'),
+         ('St. Petersburg South Coast', 'Gulf of Bothnia')],
+        [('Moscow', 'Sevastopol'), ('Warsaw', 'Silesia'), ('Sevastopol Coast', 'Black Sea'),
+         ('St. Petersburg South Coast', 'Finland Coast')],
+    ],
+    'Turkey': [
+        [('Constantinople', 'Bulgaria'), ('Smyrna', 'Constantinople'), ('Ankara Coast', 'Black Sea')],
+        [('Constantinople', 'Bulgaria'), ('Smyrna', 'Armenia'), ('Ankara Coast', 'Black Sea')],
+        [('Constantinople', 'Bulgaria'), ('Smyrna', 'Armenia'), ('Ankara Coast', 'Constantinople Coast')],
+    ],
+}
+
+
+def opening_positions(count=50, seed=0, game_map=None):
+    """
+    Returns [(game_map, Command[])] for count Spring 1901 positions, each combining one of the
+    OPENINGS for every power. The first positions give every power the same opening in turn, and
+    the rest are chosen at random.
+    """
+    rng = random.Random(seed)
+    game_map = game_map or vanilla_dip.generate_map()
+    powers = sorted(OPENINGS)
+    choices = [{ power: index for power in powers } for index in range(len(OPENINGS[powers[0]]))]
+    while len(choices) < count:
+        choices.append({ power: rng.randrange(len(OPENINGS[power])) for power in powers })
+    return [_opening_position(game_map, choice) for choice in choices[:count]]
+
+
+def _opening_position(game_map, choice):
+    starting_units = vanilla_dip.generate_starting_player_units()
+    players = {
+        power: Player(power, game_map, [
+            { 'territory_name': unit.position, 'unit_type': unit.unit_type } for unit in starting_units[power]
+        ])
+        for power in sorted(OPENINGS)
+    }
+    units = { unit.position: (player, unit) for player in players.values() for unit in player.units }
+
+    commands = []
+    for power, index in sorted(choice.items()):
+        for order in OPENINGS[power][index]:
+            player, unit = units[order[0]]
+            if len(order) == 1:
+                commands.append(HoldCommand(player, unit))
+            elif len(order) == 2:
+                commands.append(MoveCommand(player, unit, order[1]))
+            else:
+                commands.append(SupportCommand(player, unit, units[order[2]][1], order[3]))
+    return game_map, commands
+
+
+def full_board_position(seed, game_map=None, support_ratio=0.5, fleet_ratio=0.4):
+    """
+    Returns (game_map, Command[]) for a random, legal position with one unit on each of the
+    34 supply centres. Home centres go to their owners and neutral centres are dealt out in turn.
+    Every unit first picks a hold or a move; afterwards roughly support_ratio of them switch to
+    supporting a neighbouring unit's order instead.
+    """
+    rng = random.Random(seed)
+    game_map = game_map or vanilla_dip.generate_map()
+    players = _full_board_players(rng, game_map, fleet_ratio)
+    units = [(player, unit) for player in players for unit in player.units]
+
+    orders = dict()
+    for player, unit in units:
+        destinations = [
+            name for name in sorted(game_map.adjacency[unit.position])
+            if unit_can_enter(game_map, unit, game_map.name_map[name])
+        ]
+        if destinations and rng.random() < 0.6:
+            orders[unit] = MoveCommand(player, unit, rng.choice(destinations))
+        else:
+            orders[unit] = HoldCommand(player, unit)
+
+    movements = dict(orders)
+    for player, unit in units:
+        if rng.random() >= support_ratio:
+            continue
+        candidates = list(_legal_supports(player, unit, movements))
+        if candidates:
+            orders[unit] = rng.choice(candidates)
+
+    return game_map, [orders[unit] for _, unit in units]
+
+
+def _full_board_players(rng, game_map, fleet_ratio):
+    supply_centers = vanilla_dip.generate_supply_center_map().supply_centers
+    home_territories = vanilla_dip.generate_home_territories()
+    owners = { territory: player for player, territories in home_territories.items() for territory in territories }
+    player_names = sorted(home_territories.keys())
+    for index, territory in enumerate(sorted(supply_centers - owners.keys())):
+        owners[territory] = player_names[index % len(player_names)]
+
+    configurations = { name: [] for name in player_names }
+    for territory_name in sorted(supply_centers):
+        coasts = game_map.name_map[territory_name].coasts
+        if coasts and rng.random() < fleet_ratio:
+            configuration = { 'territory_name': rng.choice(coasts).name, 'unit_type': UnitTypes.FLEET }
+        else:
+            configuration = { 'territory_name': territory_name, 'unit_type': UnitTypes.TROOP }
+        configurations[owners[territory_name]].append(configuration)
+
+    return [Player(name, game_map, configurations[name]) for name in player_names]
+
+
+def _legal_supports(player, unit, movements):
+    for supported_unit, movement in movements.items():
+        if supported_unit == unit:
+            continue
+        try:
+            yield SupportCommand(player, unit, supported_unit, movement.destination)
+        except AssertionError:
+            continue
@@ -0,0 +1,176 @@
+"""
+Benchmark suite for adjudication. Times each of the PHASES (resolve_turn, compute_retreats,
+resolve_retreats and calculate_adjustments) on:
+  * datc:           every call made while running the DATC test cases
+  * openings:       standard Spring 1901 openings on the vanilla map
+  * full_board:     random positions with a unit on each of the 34 vanilla supply centres
+  * large_board_N:  random positions of N units on a synthetic grid board
+  * support_web:    grid positions where most units support another unit's order
+  * convoy_chain:   single convoys across large blocks of transporting fleets
+  * circular:       many rings of troops, each moving one step around its ring
+  * dependency_chain: one long line of troops, each following the one ahead
+
+Each scenario is timed in a fresh interpreter, as the garbage left behind by earlier scenarios
+noticeably changes the timings of later ones. Each timing is the best of several runs, per call
+of the phase's function. Results are compared with the baselines in benchmarks/baselines.json,
+flagging any phase which has become slower by more than the threshold. Baselines depend on the
+machine they were recorded on, so record them afresh (with --save) before comparing on a
+different machine.
+
+    python -m benchmarks.suite [--scenario NAME ...] [--repeat N] [--threshold RATIO] [--save]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from benchmarks.datc import datc_calls
+from benchmarks.phases import PHASES, occupation_ownership_map, phase_function, phase_inputs
+from benchmarks.positions import full_board_position, opening_positions
+from benchmarks.synthetic import (
+    chain_position,
+    convoy_position,
+    grid_position,
+    grid_supply_center_map,
+    large_board_position,
+    rotation_position,
+)
+from pydip.map.map import SupplyCenterMap
+from pydip.map.predefined import vanilla_dip
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+
+def _vanilla_scenario(positions):
+    ownership_map = vanilla_dip.generate_starting_ownership_map()
+    return _phase_calls(phase_inputs(game_map, commands, ownership_map) for game_map, commands in positions)
+
+
+def _grid_scenario(positions):
+    return _phase_calls(
+        phase_inputs(game_map, commands, occupation_ownership_map(grid_supply_center_map(game_map), commands))
+        for game_map, commands in positions
+    )
+
+
+def _centreless_scenario(positions):
+    return _phase_calls(
+        phase_inputs(game_map, commands, occupation_ownership_map(SupplyCenterMap(game_map, set()), commands))
+        for game_map, commands in positions
+    )
+
+
+def _phase_calls(inputs):
+    calls = { phase: [] for phase in PHASES }
+    for phase_arguments in inputs:
+        for phase, arguments in phase_arguments.items():
+            calls[phase].append(arguments)
+    return calls
+
+
+""" String -> (() -> String -> args[]), each scenario and a function building its calls for every phase """
+SCENARIOS = {
+    'datc': lambda: {
+        phase: [arguments for _, arguments in calls]
+        for phase, calls in datc_calls().items()
+    },
+    'openings': lambda: _vanilla_scenario(opening_positions(50)),
+    'full_board': lambda: _vanilla_scenario(full_board_position(seed) for seed in range(20)),
+    'large_board_200': lambda: _grid_scenario(large_board_position(200, seed) for seed in range(5)),
+    'large_board_1000': lambda: _grid_scenario(large_board_position(1000, seed) for seed in range(2)),
+    'support_web': lambda: _grid_scenario(
+        grid_position(seed, support_ratio=0.8, convoy_ratio=0.1) for seed in range(5)
+    ),
+    'convoy_chain': lambda: _centreless_scenario([convoy_position(40, 3), convoy_position(20, 10)]),
+    'circular': lambda: _centreless_scenario([rotation_position(12, ring_count=20)]),
+    'dependency_chain': lambda: _centreless_scenario([chain_position(100)]),
+}
+
+
+def time_scenario(calls, repeat):
+    """ Returns phase name -> best time in milliseconds per call, for every phase with calls """
+    timings = dict()
+    for phase, arguments_list in calls.items():
+        if len(arguments_list) == 0:
+            continue
+        function = phase_function(phase)
+        number = max(1, 200 // len(arguments_list))
+        elapsed = min(timeit.repeat(
+            lambda: [function(*arguments) for arguments in arguments_list],
+            number=number,
+            repeat=repeat,
+        ))
+        timings[phase] = elapsed / (number * len(arguments_list)) * 1e3
+    return timings
+
+
+def time_scenario_in_subprocess(scenario, repeat):
+    """ Runs time_scenario for scenario in a new interpreter, returning its timings """
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.suite', '--time-scenario', scenario, '--repeat', str(repeat)],
+        check=True,
+        stdout=subprocess.PIPE,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ).stdout
+    return json.loads(output)
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return dict()
+    with open(BASELINE_PATH) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baselines(baselines):
+    with open(BASELINE_PATH, 'w') as baseline_file:
+        json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='scenario to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per timing; the best is kept')
+    parser.add_argument('--threshold', type=float, default=1.5, help='slowdown against baseline reported as a regression')
+    parser.add_argument('--save', action='store_true', help='record these timings as the new baselines')
+    parser.add_argument('--time-scenario', choices=sorted(SCENARIOS), help=argparse.SUPPRESS)
+    options = parser.parse_args(arguments)
+
+    if options.time_scenario is not None:
+        print(json.dumps(time_scenario(SCENARIOS[options.time_scenario](), options.repeat)))
+        return 0
+
+    baselines = load_baselines()
+    regressions = []
+    for scenario in options.scenario or list(SCENARIOS):
+        timings = time_scenario_in_subprocess(scenario, options.repeat)
+        print(scenario)
+        for phase, milliseconds in timings.items():
+            baseline = baselines.get(scenario, dict()).get(phase)
+            if baseline is None:
+                comparison = ''
+            else:
+                ratio = milliseconds / baseline
+                comparison = '  baseline {:9.4f} ms  x{:.2f}'.format(baseline, ratio)
+                if ratio > options.threshold:
+                    comparison += '  REGRESSION'
+                    regressions.append((scenario, phase))
+            print('  {:<22} {:9.4f} ms{}'.format(phase, milliseconds, comparison))
+        if options.save:
+            baselines[scenario] = timings
+
+    if options.save:
+        save_baselines(baselines)
+        print('baselines saved to {}'.format(BASELINE_PATH))
+    elif len(regressions) > 0:
+        print('{} regression(s) beyond x{:.2f}'.format(len(regressions), options.threshold))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,247 @@
+"""
+Synthetic maps and positions larger than the vanilla board, shared by the benchmarks in this
+directory. Territory names encode their grid coordinates, so generated positions are reproducible
+from their arguments alone.
+"""
+import math
+import random
+
+from pydip.map.map import Map, SupplyCenterMap
+from pydip.map.territory import LandTerritory
+from pydip.player.command.command import (
+    ConvoyMoveCommand,
+    ConvoyTransportCommand,
+    HoldCommand,
+    MoveCommand,
+    SupportCommand,
+)
+from pydip.player.player import Player
+from pydip.player.unit import UnitTypes
+from pydip.test.position_helper import chain_position
+
+
+def convoy_position(length, width=3):
+    """
+    Returns (game_map, Command[]) for a troop convoyed across a length x width block of sea, every
+    territory of which holds a fleet ordered to transport it. Land territories 'West' and 'East'
+    border the first and last columns of the block.
+    """
+    seas = [[_cell_name(x, y) for y in range(width)] for x in range(length)]
+    descriptors = [{ 'name': 'West', 'coasts': ['West Coast'] }, { 'name': 'East', 'coasts': ['East Coast'] }]
+    descriptors.extend({ 'name': sea } for column in seas for sea in column)
+
+    adjacencies = [('West Coast', sea) for sea in seas[0]] + [('East Coast', sea) for sea in seas[-1]]
+    for x in range(length):
+        for y in range(width):
+            if x + 1 < length:
+                adjacencies.append((seas[x][y], seas[x + 1][y]))
+            if y + 1 < width:
+                adjacencies.append((seas[x][y], seas[x][y + 1]))
+    game_map = Map(descriptors, adjacencies)
+
+    army = Player('Army', game_map, [{ 'territory_name': 'West', 'unit_type': UnitTypes.TROOP }])
+    navy = Player('Navy', game_map, [
+        { 'territory_name': sea, 'unit_type': UnitTypes.FLEET } for column in seas for sea in column
+    ])
+    troop = army.units[0]
+    commands = [ConvoyMoveCommand(army, troop, 'East')]
+    commands.extend(ConvoyTransportCommand(navy, fleet, troop, 'East') for fleet in navy.units)
+    return game_map, commands
+
+
+def rotation_position(length, ring_count=1):
+    """
+    Returns (game_map, Command[]) for ring_count separate rings of length land territories, each
+    territory holding a troop moving to the next territory around its ring. Every ring is a
+    circular movement which only succeeds as a whole, so each is one cycle of dependencies.
+    """
+    assert length >= 3
+    rings = [['Ring {} {}'.format(ring, index) for index in range(length)] for ring in range(ring_count)]
+    game_map = Map(
+        [{ 'name': name, 'coasts': [] } for ring in rings for name in ring],
+        [(ring[index], ring[(index + 1) % length]) for ring in rings for index in range(length)],
+    )
+    player = Player('Player', game_map, [
+        { 'territory_name': name, 'unit_type': UnitTypes.TROOP } for ring in rings for name in ring
+    ])
+    units = { unit.position: unit for unit in player.units }
+    return game_map, [
+        MoveCommand(player, units[ring[index]], ring[(index + 1) % length])
+        for ring in rings
+        for index in range(length)
+    ]
+
+
+def grid_map(width, height, sea_every=4):
+    """
+    Returns a Map laid out as a width x height grid. Every sea_every-th column is a lane of sea;
+    the rest are land territories with a single coast. Land is adjacent to orthogonally
+    neighbouring land, and coasts to orthogonally neighbouring sea, so troops can be convoyed
+    across each sea lane.
+    """
+    descriptors = []
+    adjacencies = []
+    for x in range(width):
+        for y in range(height):
+            if _is_sea(x, sea_every):
+                descriptors.append({ 'name': _cell_name(x, y) })
+            else:
+                descriptors.append({ 'name': _cell_name(x, y), 'coasts': [_coast_name(x, y)] })
+
+    for x in range(width):
+        for y in range(height):
+            for neighbour_x, neighbour_y in ((x + 1, y), (x, y + 1)):
+                if neighbour_x >= width or neighbour_y >= height:
+                    continue
+                sea, neighbour_sea = _is_sea(x, sea_every), _is_sea(neighbour_x, sea_every)
+                if sea and neighbour_sea:
+                    adjacencies.append((_cell_name(x, y), _cell_name(neighbour_x, neighbour_y)))
+                elif sea:
+                    adjacencies.append((_cell_name(x, y), _coast_name(neighbour_x, neighbour_y)))
+                elif neighbour_sea:
+                    adjacencies.append((_coast_name(x, y), _cell_name(neighbour_x, neighbour_y)))
+                else:
+                    adjacencies.append((_cell_name(x, y), _cell_name(neighbour_x, neighbour_y)))
+
+    return Map(descriptors, adjacencies)
+
+
+def grid_position(seed, width=24, height=12, sea_every=4, player_count=7,
+                  occupancy=0.6, support_ratio=0.4, convoy_ratio=0.3):
+    """
+    Returns (game_map, Command[]) for a random position on grid_map(width, height, sea_every).
+    A random occupancy fraction of the cells hold a unit (troops on land, fleets at sea), each
+    owned by one of player_count players. Troops next to a sea lane convoy across it with probability
+    convoy_ratio, and every fleet on their route is ordered to transport them. Other troops hold
+    or move, fleets hold, and roughly support_ratio of all units then switch to supporting a
+    neighbouring unit's order instead, giving a dense web of supports and convoys.
+    """
+    rng = random.Random(seed)
+    game_map = grid_map(width, height, sea_every)
+    player_names = ['Player {}'.format(index) for index in range(player_count)]
+
+    configurations = { name: [] for name in player_names }
+    cells = [(x, y) for x in range(width) for y in range(height)]
+    for x, y in sorted(rng.sample(cells, round(occupancy * len(cells)))):
+        unit_type = UnitTypes.FLEET if _is_sea(x, sea_every) else UnitTypes.TROOP
+        configurations[rng.choice(player_names)].append({
+            'territory_name': _cell_name(x, y),
+            'unit_type': unit_type,
+        })
+    players = [Player(name, game_map, configurations[name]) for name in player_names]
+    units = { unit.position: (player, unit) for player in players for unit in player.units }
+
+    orders = dict()
+    for position, (player, unit) in sorted(units.items()):
+        if unit.unit_type == UnitTypes.FLEET or position in orders:
+            continue
+        route = _convoy_route(rng, units, position, width, height, sea_every) if rng.random() < convoy_ratio else None
+        if route is not None:
+            fleet_positions, destination = route
+            orders[position] = ConvoyMoveCommand(player, unit, destination)
+            for fleet_position in fleet_positions:
+                fleet_player, fleet = units[fleet_position]
+                orders[fleet_position] = ConvoyTransportCommand(fleet_player, fleet, unit, destination)
+            continue
+
+        destinations = sorted(
+            name for name in game_map.adjacency[position]
+            if not _is_sea(_cell_coordinates(name)[0], sea_every)
+        )
+        if destinations and rng.random() < 0.6:
+            orders[position] = MoveCommand(player, unit, rng.choice(destinations))
+        else:
+            orders[position] = HoldCommand(player, unit)
+    for position, (player, unit) in units.items():
+        if position not in orders:
+            orders[position] = HoldCommand(player, unit)
+
+    movements = dict(orders)
+    for position, (player, unit) in sorted(units.items()):
+        if isinstance(orders[position], ConvoyTransportCommand) or rng.random() >= support_ratio:
+            continue
+        candidates = list(_legal_supports(game_map, player, unit, units, movements))
+        if candidates:
+            orders[position] = rng.choice(candidates)
+
+    return game_map, [orders[position] for position in sorted(units)]
+
+
+def large_board_position(unit_count, seed, occupancy=0.6, **kwargs):
+    """
+    Returns grid_position for a board twice as wide as it is high, sized so that it holds
+    unit_count units at the given occupancy. Other keyword arguments are passed to grid_position.
+    """
+    height = max(2, round(math.sqrt(unit_count / occupancy / 2)))
+    width = max(2, round(unit_count / occupancy / height))
+    return grid_position(seed, width=width, height=height, occupancy=unit_count / (width * height), **kwargs)
+
+
+def grid_supply_center_map(game_map, every=3):
+    """ Returns a SupplyCenterMap for a grid_map, with every land cell whose x + y is divisible by every as a centre """
+    supply_centers = set()
+    for name, territory in game_map.name_map.items():
+        if isinstance(territory, LandTerritory) and name.startswith('Cell '):
+            x, y = _cell_coordinates(name)
+            if (x + y) % every == 0:
+                supply_centers.add(name)
+    return SupplyCenterMap(game_map, supply_centers)
+
+
+def _convoy_route(rng, units, position, width, height, sea_every):
+    """
+    Picks a destination across an adjacent sea lane, returning (fleet positions, destination) if
+    fleets are in place to carry the troop there, and None otherwise.
+    """
+    x, y = _cell_coordinates(position)
+    lanes = [
+        direction for direction in (-1, 1)
+        if 0 <= x + 2 * direction < width and _is_sea(x + direction, sea_every)
+    ]
+    if not lanes:
+        return None
+    direction = rng.choice(lanes)
+    landing_y = min(max(y + rng.choice((-1, 0, 1)), 0), height - 1)
+
+    lane_x = x + direction
+    fleet_positions = { _cell_name(lane_x, y), _cell_name(lane_x, landing_y) }
+    if not all(fleet_position in units for fleet_position in fleet_positions):
+        return None
+    return sorted(fleet_positions), _cell_name(x + 2 * direction, landing_y)
+
+
+def _legal_supports(game_map, player, unit, units, movements):
+    """ Yields every legal support for the order of a unit within two steps of unit """
+    x, y = _cell_coordinates(unit.position)
+    for neighbour_x in range(x - 2, x + 3):
+        for neighbour_y in range(y - 2, y + 3):
+            neighbour = _cell_name(neighbour_x, neighbour_y)
+            if neighbour not in units or neighbour == unit.position:
+                continue
+            if abs(neighbour_x - x) + abs(neighbour_y - y) > 2:
+                continue
+            _, supported_unit = units[neighbour]
+            movement = movements[neighbour]
+            if isinstance(movement, ConvoyTransportCommand):
+                continue
+            try:
+                yield SupportCommand(player, unit, supported_unit, movement.destination)
+            except AssertionError:
+                continue
+
+
+def _is_sea(x, sea_every):
+    return x % sea_every == sea_every - 1
+
+
+def _cell_name(x, y):
+    return 'Cell {},{}'.format(x, y)
+
+
+def _coast_name(x, y):
+    return 'Cell {},{} Coast'.format(x, y)
+
+
+def _cell_coordinates(name):
+    x, y = name.split(' ')[1].split(',')
+    return int(x), int(y)
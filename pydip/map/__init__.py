@@ -1,2 +1,4 @@
-from pydip.map.map import Map, SupplyCenterMap, OwnershipMap
+from pydip.map.map import Map, FrozenMap, SupplyCenterMap, FrozenSupplyCenterMap, OwnershipMap
+from pydip.map.compiled_map import CompiledMap
+from pydip.map.compiled_ownership import CompiledOwnership
 from pydip.map.territory import CoastTerritory, LandTerritory, SeaTerritory
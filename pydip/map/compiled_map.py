@@ -0,0 +1,203 @@
+from pydip.map.territory import CoastTerritory, LandTerritory, SeaTerritory
+
+
+""" int, distance given by distances_to_province for territories which cannot reach the province """
+UNREACHABLE_DISTANCE = 0xFF
+
+
+class CompiledMap:
+    """
+    Integer-indexed view of a Map, intended for hot paths in adjudication.
+
+    Every territory is given a dense integer id (in the order territories
+    appear in the Map's name_map, so a LandTerritory always precedes its
+    coasts). Each territory also has a province id: the id of the
+    LandTerritory that owns it for coasts, and its own id otherwise.
+    Adjacency is stored as one bitset (a Python int) per territory id.
+    """
+
+    """ String[], territory names indexed by territory id """
+    names = None
+
+    """ String -> int, territory name to territory id """
+    territory_ids = None
+
+    """ int[], province id for each territory id """
+    province_ids = None
+
+    """ String -> int, territory name to province id """
+    province_ids_by_name = None
+
+    """ String -> String, territory name to the name of its province (see Map.relevant_name_for_territory) """
+    relevant_names = None
+
+    """ int[], bitset of adjacent territory ids for each territory id """
+    adjacency = None
+
+    """ int[], bitset of every territory id sharing a province with each territory id """
+    province_masks = None
+
+    """ int, bitset of the ids of every LandTerritory """
+    land_mask = None
+
+    """ int, bitset of the ids of every SeaTerritory """
+    sea_mask = None
+
+    """ int, bitset of the ids of every CoastTerritory """
+    coast_mask = None
+
+    """ int, bitset of the ids of every LandTerritory with at least one coast, which troops can be convoyed to and from """
+    convoy_mask = None
+
+    """ String -> String frozenset, territory name to the sea territories adjacent to any coast of its province """
+    coastal_seas = None
+
+    """ String -> String frozenset, sea territory name to the sea territories adjacent to it """
+    sea_neighbours = None
+
+    """ (bool, String) -> bytes, distances_to_province results by (fleet, province name), filled in as needed """
+    _distances = None
+
+    """ int[], bitset of every territory a troop can reach in one step from each territory id, for distances """
+    _troop_steps = None
+
+    def __init__(self, game_map):
+        self.names = list(game_map.name_map.keys())
+        self.territory_ids = { name: territory_id for territory_id, name in enumerate(self.names) }
+
+        self.relevant_names = { name: territory.province_name for name, territory in game_map.name_map.items() }
+        self.province_ids = [self.territory_ids[self.relevant_names[name]] for name in self.names]
+        self.province_ids_by_name = { name: self.province_ids[self.territory_ids[name]] for name in self.names }
+
+        self.adjacency = [0] * len(self.names)
+        for name, adjacent_names in game_map.adjacency.items():
+            territory_id = self.territory_ids[name]
+            for adjacent_name in adjacent_names:
+                self.adjacency[territory_id] |= 1 << self.territory_ids[adjacent_name]
+
+        masks_by_province = dict()
+        for territory_id, province_id in enumerate(self.province_ids):
+            masks_by_province[province_id] = masks_by_province.get(province_id, 0) | (1 << territory_id)
+        self.province_masks = [masks_by_province[province_id] for province_id in self.province_ids]
+
+        self._setup_type_masks(game_map)
+        self._setup_convoy_index(game_map)
+
+    def _setup_type_masks(self, game_map):
+        self.land_mask = self.sea_mask = self.coast_mask = self.convoy_mask = 0
+        for territory_id, name in enumerate(self.names):
+            territory = game_map.name_map[name]
+            if isinstance(territory, LandTerritory):
+                self.land_mask |= 1 << territory_id
+                if len(territory.coasts) > 0:
+                    self.convoy_mask |= 1 << territory_id
+            elif isinstance(territory, SeaTerritory):
+                self.sea_mask |= 1 << territory_id
+            elif isinstance(territory, CoastTerritory):
+                self.coast_mask |= 1 << territory_id
+
+    def _setup_convoy_index(self, game_map):
+        seas_by_province = dict()
+        for name, territory in game_map.name_map.items():
+            seas = seas_by_province.setdefault(territory.province_name, set())
+            if isinstance(territory, CoastTerritory):
+                seas |= {
+                    adjacent_name for adjacent_name in game_map.adjacency[name]
+                    if isinstance(game_map.name_map[adjacent_name], SeaTerritory)
+                }
+        seas_by_province = { province: frozenset(seas) for province, seas in seas_by_province.items() }
+        self.coastal_seas = { name: seas_by_province[self.relevant_names[name]] for name in self.names }
+
+        self.sea_neighbours = {
+            name: frozenset(
+                adjacent_name for adjacent_name in game_map.adjacency[name]
+                if isinstance(game_map.name_map[adjacent_name], SeaTerritory)
+            )
+            for name, territory in game_map.name_map.items()
+            if isinstance(territory, SeaTerritory)
+        }
+
+    def province_id(self, territory_name):
+        return self.province_ids_by_name[territory_name]
+
+    def distances_to_province(self, province_name, fleet):
+        """
+        Returns, as bytes indexed by territory id, the fewest moves needed to reach province_name
+        from each territory, or UNREACHABLE_DISTANCE where it cannot be reached. Troops may pass
+        through every province, land or sea, as if convoyed; fleets only through sea and coastal
+        territories, arriving at any coast of the province. Each table is computed by a
+        breadth-first search the first time it is needed, and cached.
+        """
+        if self._distances is None:
+            self._distances = dict()
+        distances = self._distances.get((fleet, province_name))
+        if distances is None:
+            province_mask = self.province_masks[self.territory_ids[province_name]]
+            if fleet:
+                fleet_mask = self.sea_mask | self.coast_mask
+                distances = self._breadth_first_distances(
+                    province_mask & fleet_mask,
+                    [adjacent & fleet_mask for adjacent in self.adjacency],
+                )
+            else:
+                distances = self._breadth_first_distances(province_mask, self._get_troop_steps())
+            self._distances[(fleet, province_name)] = distances
+        return distances
+
+    def distance_to_nearest(self, territory_name, province_names, fleet):
+        """ Returns the fewest moves needed to reach any of province_names from territory_name (see distances_to_province) """
+        territory_id = self.territory_ids[territory_name]
+        return min(
+            (self.distances_to_province(province_name, fleet)[territory_id] for province_name in province_names),
+            default=UNREACHABLE_DISTANCE,
+        )
+
+    def _get_troop_steps(self):
+        if self._troop_steps is None:
+            province_adjacency = dict()
+            for territory_id, province_id in enumerate(self.province_ids):
+                province_adjacency[province_id] = province_adjacency.get(province_id, 0) | self.adjacency[territory_id]
+            troop_steps = []
+            for province_id in self.province_ids:
+                steps = 0
+                mask = province_adjacency[province_id]
+                while mask:
+                    low_bit = mask & -mask
+                    steps |= self.province_masks[low_bit.bit_length() - 1]
+                    mask ^= low_bit
+                troop_steps.append(steps)
+            self._troop_steps = troop_steps
+        return self._troop_steps
+
+    def _breadth_first_distances(self, start_mask, step_masks):
+        """ Returns bytes of the fewest steps (following step_masks) from start_mask to each territory id """
+        distances = bytearray([UNREACHABLE_DISTANCE]) * len(self.names)
+        reached = frontier = start_mask
+        distance = 0
+        while frontier:
+            assert distance < UNREACHABLE_DISTANCE
+            next_frontier = 0
+            while frontier:
+                low_bit = frontier & -frontier
+                territory_id = low_bit.bit_length() - 1
+                distances[territory_id] = distance
+                next_frontier |= step_masks[territory_id]
+                frontier ^= low_bit
+            frontier = next_frontier & ~reached
+            reached |= frontier
+            distance += 1
+        return bytes(distances)
+
+    def mask_for_names(self, territory_names):
+        mask = 0
+        for territory_name in territory_names:
+            mask |= 1 << self.territory_ids[territory_name]
+        return mask
+
+    def names_for_mask(self, mask):
+        names = set()
+        while mask:
+            low_bit = mask & -mask
+            names.add(self.names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
@@ -0,0 +1,124 @@
+from pydip.map.map import OwnershipMap
+
+
+# int.bit_count is only available from Python 3.10
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(mask):
+        return bin(mask).count('1')
+
+
+def supply_center_occupants(supply_map, players, player_units):
+    """
+    Returns a map of supply center names to the player whose unit occupies them, for every supply
+    center occupied by a unit of one of players, given a mapping of Player names to their Units
+    """
+    relevant_names = supply_map.game_map.get_compiled_map().relevant_names
+    supply_centers = supply_map.supply_centers
+    occupants = dict()
+    for player in players:
+        for unit in player_units[player]:
+            province = relevant_names[unit.position]
+            if province in supply_centers:
+                occupants[province] = player
+    return occupants
+
+
+class CompiledOwnership:
+    """
+    Bitmask view of an OwnershipMap: each player's owned and home supply centers are a single int,
+    with bits indexed by the province ids of the map's CompiledMap. Counting supply centers, moving
+    ownership to occupying players and checking for a solo victory are then bit operations rather
+    than set operations on territory names. Instances are immutable; updates return a new one.
+    """
+
+    """ SupplyCenterMap """
+    supply_map = None
+
+    """ CompiledMap, of supply_map.game_map """
+    compiled_map = None
+
+    """ int, bitset of every supply center's province id """
+    supply_center_mask = None
+
+    """ String -> int, mapping Player names to a bitset of the supply centers they control """
+    owned_masks = None
+
+    """ String -> int, mapping Player names to a bitset of their home supply centers """
+    home_masks = None
+
+    def __init__(self, supply_map, owned_masks, home_masks):
+        self.supply_map = supply_map
+        self.compiled_map = supply_map.game_map.get_compiled_map()
+        self.supply_center_mask = self.compiled_map.mask_for_names(supply_map.supply_centers)
+        assert all(mask & ~self.supply_center_mask == 0 for mask in owned_masks.values())
+        assert all(mask & ~self.supply_center_mask == 0 for mask in home_masks.values())
+
+        self.owned_masks = dict(owned_masks)
+        self.home_masks = dict(home_masks)
+
+    @classmethod
+    def from_ownership_map(cls, ownership_map):
+        compiled_map = ownership_map.supply_map.game_map.get_compiled_map()
+        return cls(
+            ownership_map.supply_map,
+            {
+                player: compiled_map.mask_for_names(territories)
+                for player, territories in ownership_map.owned_territories.items()
+            },
+            {
+                player: compiled_map.mask_for_names(territories)
+                for player, territories in ownership_map.home_territories.items()
+            },
+        )
+
+    def to_ownership_map(self):
+        return OwnershipMap(
+            self.supply_map,
+            { player: self.compiled_map.names_for_mask(mask) for player, mask in self.owned_masks.items() },
+            { player: self.compiled_map.names_for_mask(mask) for player, mask in self.home_masks.items() },
+        )
+
+    def territory_is_owned(self, player, territory_name):
+        return (self.owned_masks[player] >> self.compiled_map.province_id(territory_name)) & 1 == 1
+
+    def territory_is_home(self, player, territory_name):
+        return (self.home_masks[player] >> self.compiled_map.province_id(territory_name)) & 1 == 1
+
+    def supply_center_count(self, player):
+        return _popcount(self.owned_masks[player])
+
+    def owned_home_mask(self, player):
+        """ Returns a bitset of player's home supply centers which player still controls """
+        return self.owned_masks[player] & self.home_masks[player]
+
+    def occupy(self, player_units):
+        """
+        Returns a new CompiledOwnership after units occupy provinces, given a mapping of Player names to
+        their Units (as calculate_adjustments takes): each player keeps every supply center no other
+        player occupies, and gains every supply center it occupies, as found by supply_center_occupants.
+        """
+        territory_ids = self.compiled_map.territory_ids
+        occupied_masks = { player: 0 for player in self.owned_masks }
+        all_occupied = 0
+        for province, player in supply_center_occupants(self.supply_map, self.owned_masks, player_units).items():
+            occupied_masks[player] |= 1 << territory_ids[province]
+            all_occupied |= 1 << territory_ids[province]
+
+        ownership = CompiledOwnership.__new__(CompiledOwnership)
+        ownership.supply_map = self.supply_map
+        ownership.compiled_map = self.compiled_map
+        ownership.supply_center_mask = self.supply_center_mask
+        ownership.owned_masks = {
+            player: (mask & ~all_occupied) | occupied_masks[player] for player, mask in self.owned_masks.items()
+        }
+        ownership.home_masks = self.home_masks
+        return ownership
+
+    def solo_winner(self, victory_count):
+        """ Returns the name of the player controlling at least victory_count supply centers, or None """
+        for player in self.owned_masks:
+            if self.supply_center_count(player) >= victory_count:
+                return player
+        return None
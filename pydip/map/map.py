@@ -1,4 +1,7 @@
-from pydip.map.territory import LandTerritory, SeaTerritory, CoastTerritory
+from types import MappingProxyType
+
+from pydip.map.compiled_map import CompiledMap
+from pydip.map.territory import LandTerritory, SeaTerritory
 
 
 class Map:
@@ -8,6 +11,9 @@ class Map:
     """ String -> String{} (Adjacency List) """
     adjacency = None
 
+    """ CompiledMap, precomputed province and adjacency tables for this map """
+    _compiled_map = None
+
     """
     territory_descriptors: list of structs defining new territories. Of the form:
         {
@@ -30,6 +36,7 @@ class Map:
 
         self._setup_name_map(territory_descriptors)
         self._setup_adjacencies(adjacencies)
+        self._compiled_map = CompiledMap(self)
 
     def __str__(self):
         territories = []
@@ -38,10 +45,14 @@ class Map:
         return '\n'.join(territories)
 
     def relevant_name_for_territory(self, territory_name):
-        territory = self.name_map[territory_name]
-        if isinstance(territory, CoastTerritory):
-            territory_name = territory.parent.name
-        return territory_name
+        return self._compiled_map.relevant_names[territory_name]
+
+    def get_compiled_map(self):
+        """
+        Returns the integer-indexed CompiledMap for this map. It is built once, when the map is
+        constructed, so the map should not be modified afterwards.
+        """
+        return self._compiled_map
 
     def _setup_name_map(self, territory_descriptors):
         for descriptor in territory_descriptors:
@@ -74,6 +85,77 @@ class Map:
             self.adjacency[name_a].add(name_b)
             self.adjacency[name_b].add(name_a)
 
+    def territory_descriptors(self):
+        """ Returns territory descriptors (as passed to the constructor) for every territory on this map """
+        descriptors = []
+        for territory in self.name_map.values():
+            if isinstance(territory, LandTerritory):
+                descriptors.append({ 'name': territory.name, 'coasts': [coast.name for coast in territory.coasts] })
+            elif isinstance(territory, SeaTerritory):
+                descriptors.append({ 'name': territory.name })
+        return descriptors
+
+    def adjacency_pairs(self):
+        """ Returns adjacencies (as passed to the constructor) for every pair of adjacent territories on this map """
+        names = list(self.name_map.keys())
+        order = { name: index for index, name in enumerate(names) }
+        return [
+            (name, adjacent_name)
+            for name in names
+            for adjacent_name in sorted(self.adjacency[name], key=order.get)
+            if order[name] < order[adjacent_name]
+        ]
+
+
+class FrozenMap(Map):
+    """
+    A Map which cannot be changed once constructed: name_map and adjacency are read-only views,
+    each adjacency set is a frozenset, and attributes cannot be reassigned. As nothing about it can
+    change, a FrozenMap is safe to share between games, and copying one simply returns it.
+    """
+
+    _frozen = False
+
+    def __init__(self, territory_descriptors, adjacencies):
+        super().__init__(territory_descriptors, adjacencies)
+        self.name_map = MappingProxyType(self.name_map)
+        self.adjacency = MappingProxyType({ name: frozenset(adjacent) for name, adjacent in self.adjacency.items() })
+        self._frozen = True
+
+    @classmethod
+    def from_tables(cls, name_map, adjacency, compiled_map):
+        """
+        Returns a FrozenMap made directly from the name_map, adjacency and CompiledMap of an earlier
+        map, skipping the validation and setup done by the constructor (see pydip.map.precompiled)
+        """
+        game_map = cls.__new__(cls)
+        game_map.name_map = MappingProxyType(dict(name_map))
+        game_map.adjacency = MappingProxyType({ name: frozenset(adjacent) for name, adjacent in adjacency.items() })
+        game_map._compiled_map = compiled_map
+        game_map._frozen = True
+        return game_map
+
+    @classmethod
+    def from_map(cls, game_map):
+        """ Returns a FrozenMap with the same territories and adjacencies as game_map """
+        if isinstance(game_map, cls):
+            return game_map
+        return cls(game_map.territory_descriptors(), game_map.adjacency_pairs())
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError("FrozenMap cannot be modified")
+        super().__setattr__(name, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenMap, (self.territory_descriptors(), self.adjacency_pairs())
+
 
 class SupplyCenterMap:
     """ Map """
@@ -92,6 +174,35 @@ class SupplyCenterMap:
         return 'Adjacencies:\n------------\n{}\n\nSCs:\n----\n{}'.format(self.game_map, self.supply_centers)
 
 
+class FrozenSupplyCenterMap(SupplyCenterMap):
+    """
+    A SupplyCenterMap which cannot be changed once constructed: its game_map is a FrozenMap (game_map
+    is frozen first, if needed), supply_centers is a frozenset, and attributes cannot be reassigned.
+    Like a FrozenMap, it is safe to share, and copying one simply returns it.
+    """
+
+    _frozen = False
+
+    def __init__(self, game_map, supply_centers):
+        super().__init__(FrozenMap.from_map(game_map), supply_centers)
+        self.supply_centers = frozenset(self.supply_centers)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError("FrozenSupplyCenterMap cannot be modified")
+        super().__setattr__(name, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenSupplyCenterMap, (self.game_map, self.supply_centers)
+
+
 class OwnershipMap:
     """ SupplyCenterMap """
     supply_map = None
@@ -0,0 +1,49 @@
+"""
+Precompiled maps: a FrozenMap serialised together with its CompiledMap, which loads several times
+faster than the Map constructor can process territory descriptors and adjacencies. Descriptors
+remain the source of truth. Precompiled data is only a cache of what they produce, and whoever
+writes it is responsible for checking that the two still agree.
+"""
+import pickle
+
+from pydip.map.map import FrozenMap
+
+
+""" bytes, prefix identifying precompiled map data """
+_MAGIC = b'PYDIPMAP'
+
+""" int, bumped whenever the layout of precompiled data changes, so that older data is ignored """
+FORMAT_VERSION = 3
+
+
+def dump_map(game_map):
+    """ Returns precompiled data for game_map, as bytes """
+    tables = (dict(game_map.name_map), dict(game_map.adjacency), game_map.get_compiled_map())
+    return _MAGIC + bytes([FORMAT_VERSION]) + pickle.dumps(tables, protocol=4)
+
+
+def load_map(data):
+    """ Returns the FrozenMap stored in precompiled data, or None if the data is of another format version """
+    header_length = len(_MAGIC) + 1
+    if data[:len(_MAGIC)] != _MAGIC or data[len(_MAGIC)] != FORMAT_VERSION:
+        return None
+    name_map, adjacency, compiled_map = pickle.loads(data[header_length:])
+    return FrozenMap.from_tables(name_map, adjacency, compiled_map)
+
+
+def write_map(path, game_map):
+    with open(path, 'wb') as map_file:
+        map_file.write(dump_map(game_map))
+
+
+def read_map(path):
+    """
+    Returns the FrozenMap precompiled at path, or None if there is no usable data there (if it is
+    missing, of another format version, or refers to classes which no longer exist), in which
+    case the caller should build the map from its descriptors instead.
+    """
+    try:
+        with open(path, 'rb') as map_file:
+            return load_map(map_file.read())
+    except (OSError, EOFError, IndexError, AttributeError, ImportError, pickle.UnpicklingError):
+        return None
@@ -0,0 +1,24 @@
+"""
+Writes the precompiled form of each predefined map next to its module, to be run whenever a
+map's descriptors or adjacencies change, or pydip.map.precompiled.FORMAT_VERSION is bumped:
+
+    python -m pydip.map.predefined.build
+"""
+from pydip.map.precompiled import write_map
+from pydip.map.predefined import vanilla_dip
+
+
+""" (String, () -> FrozenMap)[], the precompiled path of each predefined map and the function building it """
+PREDEFINED_MAPS = [
+    (vanilla_dip.PRECOMPILED_MAP_PATH, vanilla_dip.build_map),
+]
+
+
+def main():
+    for path, build_map in PREDEFINED_MAPS:
+        write_map(path, build_map())
+        print('wrote {}'.format(path))
+
+
+if __name__ == '__main__':
+    main()
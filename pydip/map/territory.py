@@ -2,11 +2,15 @@ class Territory:
     """ String """
     name = None
 
+    """ String -- name of the province this territory belongs to (the parent's name, for coasts) """
+    province_name = None
+
     def __init__(self, name):
         self.name = name
+        self.province_name = name
 
     def same_territory(self, other):
-        return self.name == other.name
+        return self.province_name == other.province_name
 
     def __str__(self):
         return self.name
@@ -20,13 +24,7 @@ class CoastTerritory(Territory):
         super().__init__(name)
         assert isinstance(parent, LandTerritory)
         self.parent = parent
-
-    def same_territory(self, other):
-        relevant_territories = (
-            { self.parent.name } |
-            { coast.name for coast in self.parent.coasts }
-        )
-        return other.name in relevant_territories
+        self.province_name = parent.name
 
     def __eq__(self, other):
         if not isinstance(other, CoastTerritory):
@@ -59,13 +57,6 @@ class LandTerritory(Territory):
         for coast_name in coast_names:
             self.coasts.append(CoastTerritory(coast_name, self))
 
-    def same_territory(self, other):
-        relevant_territories = (
-            { self.name } |
-            { coast.name for coast in self.coasts }
-        )
-        return other.name in relevant_territories
-
     def __eq__(self, other):
         if not isinstance(other, LandTerritory):
             return False
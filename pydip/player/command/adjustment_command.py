@@ -1,16 +1,45 @@
+from pydip.player.command.command import Command
 from pydip.player.helpers import unit_type_can_enter
 
 
 class AdjustmentCommand:
+    """
+    Like Commands, AdjustmentCommands are immutable values (see Command): two orders of the same
+    kind, for the same player and unit, are equal and hash equal, so duplicates collapse in sets and
+    as dict keys. Duplicate orders in the list given to resolve_adjustment count only once, while
+    resolve_adjustment__validated rejects them.
+    """
+
+    __slots__ = {
+        'player': 'Player -- who is issuing command',
+        'unit':   'Unit -- unit to disband, or the new unit to create',
+    }
+
     def __init__(self, player, unit):
-        self.player = player
-        self.unit = unit
+        object.__setattr__(self, 'player', player)
+        object.__setattr__(self, 'unit', unit)
+
+    __setattr__ = Command.__setattr__
+    __setstate__ = Command.__setstate__
+
+    def __eq__(self, other):
+        return ((isinstance(other, AdjustmentCommand)) and
+                (self.player.name == other.player.name) and
+                (self.unit == other.unit))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.player.name, self.unit))
 
 
 class AdjustmentDisbandCommand(AdjustmentCommand):
+    __slots__ = ()
+
     def __init__(self, player, unit):
         super().__init__(player, unit)
-        assert unit in player.units
+        assert player.has_unit(unit)
 
     def __repr__(self):
         return '{}: {} {} Disband'.format(
@@ -26,6 +55,8 @@ class AdjustmentDisbandCommand(AdjustmentCommand):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = AdjustmentCommand.__hash__
+
 
 class AdjustmentCreateCommand(AdjustmentCommand):
     """
@@ -33,6 +64,8 @@ class AdjustmentCreateCommand(AdjustmentCommand):
     So this command takes an OwnershipMap, representing current board state, to determine if the
     provided unit would be allowed to be created for this player.
     """
+    __slots__ = ()
+
     def __init__(self, ownership_map, player, unit):
         super().__init__(player, unit)
 
@@ -41,9 +74,7 @@ class AdjustmentCreateCommand(AdjustmentCommand):
         assert ownership_map.territory_is_home(player.name, unit.position)
         assert unit_type_can_enter(unit.unit_type, unit_territory)
 
-        for existing_unit in player.units:
-            existing_unit_territory = ownership_map.supply_map.game_map.name_map[existing_unit.position]
-            assert not unit_territory.same_territory(existing_unit_territory)
+        assert player.unit_in_province(unit.position) is None
 
     def __eq__(self, other):
         return (super(AdjustmentCreateCommand, self).__eq__(other) and
@@ -52,6 +83,8 @@ class AdjustmentCreateCommand(AdjustmentCommand):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = AdjustmentCommand.__hash__
+
     def __repr__(self):
         return '{}: {} {} Create'.format(
             self.player.name,
@@ -8,16 +8,32 @@ from pydip.player.unit import UnitTypes
 
 
 class Command:
-    """ Player -- who is issuing command """
-    player = None
+    """
+    Commands are immutable values: attributes are only set by the constructor (through
+    object.__setattr__), and can never be reassigned. They use __slots__ (documenting each
+    attribute) rather than a __dict__, to keep the many commands held during order generation and
+    search small.
+    """
 
-    """ Unit -- unit being issued command """
-    unit = None
+    __slots__ = {
+        'player': 'Player -- who is issuing command',
+        'unit':   'Unit -- unit being issued command',
+    }
 
     def __init__(self, player, unit):
-        assert unit in player.units
-        self.player = player
-        self.unit = unit
+        assert player.has_unit(unit)
+        object.__setattr__(self, 'player', player)
+        object.__setattr__(self, 'unit', unit)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} cannot be modified".format(type(self).__name__))
+
+    def __setstate__(self, state):
+        # Unpickling and copying restore attributes through here, rather than __setattr__
+        instance_dict, slots = state if isinstance(state, tuple) else (state, None)
+        for attributes in (instance_dict, slots):
+            for name, value in (attributes or dict()).items():
+                object.__setattr__(self, name, value)
 
     def __eq__(self, other):
         return ((isinstance(other, Command)) and
@@ -27,14 +43,19 @@ class Command:
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # Every subclass's __eq__ also compares the player and unit, so this is consistent with all of them
+        return hash((self.player.name, self.unit))
+
 
 class MoveCommand(Command):
-    """
-    String -- Name of territory being moved to.
-      * Must be adjacent or equal to unit's current territory
-      * Must be legal for unit to enter this territory
-    """
-    destination = None
+    __slots__ = {
+        'destination': """
+            String -- Name of territory being moved to.
+              * Must be adjacent or equal to unit's current territory
+              * Must be legal for unit to enter this territory
+        """,
+    }
 
     def __init__(self, player, unit, destination):
         super().__init__(player, unit)
@@ -44,7 +65,7 @@ class MoveCommand(Command):
             unit_can_enter(game_map, unit, game_map.name_map[destination]) or
             unit.position == destination
         )
-        self.destination = destination
+        object.__setattr__(self, 'destination', destination)
 
     def __eq__(self, other):
         return (super(MoveCommand, self).__eq__(other) and
@@ -54,6 +75,8 @@ class MoveCommand(Command):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = Command.__hash__
+
     def __repr__(self):
         return '{}: {} {} -> {}'.format(
             self.player.name,
@@ -65,6 +88,8 @@ class MoveCommand(Command):
 
 class HoldCommand(MoveCommand):
     """ Holding is really just moving to your current position """
+    __slots__ = ()
+
     def __init__(self, player, unit):
         super().__init__(player, unit, unit.position)
 
@@ -77,22 +102,21 @@ class HoldCommand(MoveCommand):
 
 
 class SupportCommand(Command):
-    """ Unit -- unit to support """
-    supported_unit = None
-
-    """
-    String -- name of territory to support into.
-      * Must be adjacent to unit's current territory
-      * Must be legal for unit to enter this territory
-      * Must be adjacent or identical to supported_unit's current territory
-      * Must be legal for supported_unit to support this territory
-    """
-    destination = None
+    __slots__ = {
+        'supported_unit': 'Unit -- unit to support',
+        'destination': """
+            String -- name of territory to support into.
+              * Must be adjacent to unit's current territory
+              * Must be legal for unit to enter this territory
+              * Must be adjacent or identical to supported_unit's current territory
+              * Must be legal for supported_unit to support this territory
+        """,
+    }
 
     def __init__(self, player, unit, supported_unit, destination):
         super().__init__(player, unit)
-        self.supported_unit = supported_unit
-        self.destination = destination
+        object.__setattr__(self, 'supported_unit', supported_unit)
+        object.__setattr__(self, 'destination', destination)
         game_map = self.player.game_map
 
         assert destination in game_map.name_map
@@ -112,11 +136,13 @@ class SupportCommand(Command):
         return (super(SupportCommand, self).__eq__(other) and
                 isinstance(other, SupportCommand) and
                 self.supported_unit == other.supported_unit and
-                self.destination == other.desination)
+                self.destination == other.destination)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = Command.__hash__
+
     def __repr__(self):
         return '{}: {} {} Supports {} {} -> {}'.format(
             self.player.name,
@@ -129,11 +155,12 @@ class SupportCommand(Command):
 
 
 class ConvoyMoveCommand(Command):
-    """
-    String -- name of territory convoying to.
-      * Must be LandTerritory with at least one coast
-    """
-    destination = None
+    __slots__ = {
+        'destination': """
+            String -- name of territory convoying to.
+              * Must be LandTerritory with at least one coast
+        """,
+    }
 
     """
     Extra Assertions:
@@ -144,7 +171,7 @@ class ConvoyMoveCommand(Command):
 
     def __init__(self, player, unit, destination):
         super().__init__(player, unit)
-        self.destination = destination
+        object.__setattr__(self, 'destination', destination)
         game_map = self.player.game_map
 
         current_territory     = game_map.name_map[unit.position]
@@ -165,6 +192,8 @@ class ConvoyMoveCommand(Command):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = Command.__hash__
+
     def __repr__(self):
         return '{}: {} {} -> {} (Convoy)'.format(
             self.player.name,
@@ -175,17 +204,16 @@ class ConvoyMoveCommand(Command):
 
 
 class ConvoyTransportCommand(Command):
-    """
-    Unit -- unit to convoy.
-      * Must be a TROOP
-    """
-    transported_unit = None
-
-    """
-    String -- name of territory convoying to.
-      * Must be LandTerritory with at least one coast
-    """
-    destination = None
+    __slots__ = {
+        'transported_unit': """
+            Unit -- unit to convoy.
+              * Must be a TROOP
+        """,
+        'destination': """
+            String -- name of territory convoying to.
+              * Must be LandTerritory with at least one coast
+        """,
+    }
 
     """
     Extra Assertions:
@@ -197,8 +225,8 @@ class ConvoyTransportCommand(Command):
 
     def __init__(self, player, unit, transported_unit, destination):
         super().__init__(player, unit)
-        self.transported_unit = transported_unit
-        self.destination = destination
+        object.__setattr__(self, 'transported_unit', transported_unit)
+        object.__setattr__(self, 'destination', destination)
         assert unit.unit_type == UnitTypes.FLEET
         game_map = self.player.game_map
 
@@ -218,11 +246,13 @@ class ConvoyTransportCommand(Command):
         return (super(ConvoyTransportCommand, self).__eq__(other) and
                 isinstance(other, ConvoyTransportCommand) and
                 self.transported_unit == other.transported_unit and
-                self.destination == other.desination)
+                self.destination == other.destination)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = Command.__hash__
+
     def __repr__(self):
         return '{}: {} {} Transport {} {} -> {} (Convoy)'.format(
             self.player.name,
@@ -10,6 +10,8 @@ class RetreatCommand(Command):
 
     Commands issued that disagree with the provided retreat_map will fail.
     """
+    __slots__ = ()
+
     def __init__(self, retreat_map, player, unit):
         super().__init__(player, unit)
         assert unit in retreat_map[player.name]
@@ -17,6 +19,8 @@ class RetreatCommand(Command):
 
 
 class RetreatDisbandCommand(RetreatCommand):
+    __slots__ = ()
+
     def __init__(self, retreat_map, player, unit):
         super().__init__(retreat_map, player, unit)
 
@@ -34,21 +38,24 @@ class RetreatDisbandCommand(RetreatCommand):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = RetreatCommand.__hash__
+
 
 class RetreatMoveCommand(RetreatCommand):
-    """
-    String -- Name of territory being retreated to.
-      * Must be included in retreat_map as one of the territories the unit
-        is permitted to retreat to
-    """
-    destination = None
+    __slots__ = {
+        'destination': """
+            String -- Name of territory being retreated to.
+              * Must be included in retreat_map as one of the territories the unit
+                is permitted to retreat to
+        """,
+    }
 
     def __init__(self, retreat_map, player, unit, destination):
         super().__init__(retreat_map, player, unit)
         game_map = self.player.game_map
         assert destination in game_map.name_map
         assert destination in retreat_map[player.name][unit]
-        self.destination = destination
+        object.__setattr__(self, 'destination', destination)
 
     def __eq__(self, other):
         return (super(RetreatMoveCommand, self).__eq__(other) and
@@ -58,6 +65,8 @@ class RetreatMoveCommand(RetreatCommand):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    __hash__ = RetreatCommand.__hash__
+
     def __repr__(self):
         return '{}: {} {} -> {} (Retreat)'.format(
             self.player.name,
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from pydip.player.unit import Unit
 from pydip.player.helpers import unit_type_can_enter
 from pydip.map.territory import CoastTerritory
@@ -10,8 +12,17 @@ class Player:
     """ Map -- reference to game board """
     game_map = None
 
-    """ Unit[] -- units owned by this player """
-    units = None
+    """ Unit[] -- units owned by this player, in the order they were added """
+    _units = None
+
+    """ _UnitsView -- read-only view of _units, returned by the units property """
+    _units_view = None
+
+    """ String -> Unit, each unit owned by this player keyed by its position """
+    _units_by_position = None
+
+    """ String -> Unit, each unit owned by this player keyed by the name of its province """
+    _units_by_province = None
 
     """ String{} -- names of starting territories for player """
     starting_territories = None
@@ -46,7 +57,7 @@ class Player:
                 continue
             assert unit_type_can_enter(unit_type, territory)
 
-            self.units.append(Unit(unit_type, name))
+            self.add_unit(Unit(unit_type, name))
 
         assert len(self.starting_territories) == len(starting_configuration)
 
@@ -56,5 +67,82 @@ class Player:
     def __str__(self):
         return '{}: {}\n  Units: {}'.format(self.name, self.starting_territories, self.units)
 
+    @property
+    def units(self):
+        """
+        Unit[] -- read-only view of the units owned by this player, comparing equal to a list (or
+        tuple) of the same units. Units are indexed by position, so add and remove them with
+        add_unit and remove_unit, or assign a new iterable of units.
+        """
+        return self._units_view
+
+    @units.setter
+    def units(self, units):
+        self._units = []
+        self._units_view = _UnitsView(self._units)
+        self._units_by_position = dict()
+        self._units_by_province = dict()
+        for unit in units:
+            self.add_unit(unit)
+
+    def add_unit(self, unit):
+        province = self.game_map.relevant_name_for_territory(unit.position)
+        assert province not in self._units_by_province
+        self._units.append(unit)
+        self._units_by_position[unit.position] = unit
+        self._units_by_province[province] = unit
+
+    def remove_unit(self, unit):
+        assert self.has_unit(unit)
+        self._units.remove(unit)
+        del self._units_by_position[unit.position]
+        del self._units_by_province[self.game_map.relevant_name_for_territory(unit.position)]
+
     def find_unit(self, territory):
-        return next(unit for unit in self.units if unit.position == territory)
+        """ Returns the unit at territory, raising KeyError if this player has none there """
+        return self._units_by_position[territory]
+
+    def has_unit(self, unit):
+        """ Determines whether this player owns unit (a unit of the same type, in the same position) """
+        existing_unit = self._units_by_position.get(unit.position)
+        return existing_unit is not None and existing_unit == unit
+
+    def unit_in_province(self, territory):
+        """ Returns this player's unit in the same province as territory (on any of its coasts), or None """
+        return self._units_by_province.get(self.game_map.relevant_name_for_territory(territory))
+
+
+class _UnitsView(Sequence):
+    """ A read-only view of a list of units, which compares equal to lists and tuples of the same units """
+
+    __slots__ = ('_units',)
+
+    def __init__(self, units):
+        self._units = units
+
+    def __getitem__(self, index):
+        return self._units[index]
+
+    def __len__(self):
+        return len(self._units)
+
+    def __iter__(self):
+        return iter(self._units)
+
+    def __eq__(self, other):
+        if isinstance(other, _UnitsView):
+            return self._units == other._units
+        if isinstance(other, list):
+            return self._units == other
+        if isinstance(other, tuple):
+            return tuple(self._units) == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._units)
@@ -1,33 +1,70 @@
 from enum import Enum
+from weakref import WeakValueDictionary
 
 
 class UnitTypes(Enum):
     TROOP = 0
     FLEET = 1
 
+    # Members are singletons, so hashing by identity agrees with equality, and is much cheaper than
+    # Enum's default hash. Unit types are hashed whenever a Unit is created or looked up.
+    __hash__ = object.__hash__
+
     def __str__(self):
         return self.name
 
 
+""" (UnitType, String) -> Unit, the single instance of each distinct unit still referenced elsewhere """
+_INTERNED_UNITS = WeakValueDictionary()
+
+
 class Unit:
-    """ UnitType """
-    unit_type = None
+    """
+    An immutable value: a unit of some type in some territory. Units are interned, so every
+    Unit(unit_type, position) with the same arguments is the same object while any of them is alive.
+    """
+
+    __slots__ = {
+        'unit_type':   'UnitType',
+        'position':    'String -- Name of occupied territory',
+        '_hash':       'int -- hash of (unit_type, position), computed once as units are immutable',
+        '__weakref__': 'lets _INTERNED_UNITS drop units once nothing else refers to them',
+    }
 
-    """ String -- Name of occupied territory """
-    position = None
+    def __new__(cls, unit_type, position):
+        unit = _INTERNED_UNITS.get((unit_type, position))
+        if unit is None:
+            unit = super().__new__(cls)
+            object.__setattr__(unit, 'unit_type', unit_type)
+            object.__setattr__(unit, 'position', position)
+            object.__setattr__(unit, '_hash', hash((unit_type, position)))
+            _INTERNED_UNITS[(unit_type, position)] = unit
+        return unit
 
-    def __init__(self, unit_type, position):
-        self.unit_type = unit_type
-        self.position = position
+    def __setattr__(self, name, value):
+        raise AttributeError("Unit cannot be modified")
 
     def __eq__(self, other):
-        return self.unit_type == other.unit_type and self.position == other.position
+        return self is other or (
+            isinstance(other, Unit) and
+            self.unit_type == other.unit_type and
+            self.position == other.position
+        )
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self.unit_type, self.position))
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return Unit, (self.unit_type, self.position)
 
     def __repr__(self):
         return '[{} -- {}]'.format(self.unit_type, self.position)
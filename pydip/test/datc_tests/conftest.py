@@ -0,0 +1,10 @@
+import pytest
+
+from pydip.turn import resolve
+
+
+@pytest.fixture(autouse=True, params=['recursive', 'scc', 'iterative'])
+def resolve_engine(request, monkeypatch):
+    """ Runs every DATC case against each of resolve_turn's engines """
+    monkeypatch.setattr(resolve, '_DEFAULT_ENGINE', request.param)
+    return request.param
@@ -144,11 +144,11 @@ def test_j_2b__removing_the_same_unit_twice__not_validated():
         player_units=player_units,
     )
 
-    # Rather than using "distance", our Civil Disobedience rules will pick in alphabetical order
+    # The fleet cannot reach Paris at all, so is further from home than Gascony
     results = helper.resolve()
     expected_results = deepcopy(player_units)
     expected_results['France'] = {
-        Unit(UnitTypes.FLEET, 'Mid-Atlantic Ocean'),
+        Unit(UnitTypes.TROOP, 'Gascony'),
     }
     assert results == expected_results
 
@@ -207,7 +207,8 @@ def test_j_3b__civil_disorder_two_armies_with_different_distance__not_validated(
         player_units=player_units,
     )
 
-    # Rather than using "distance", our Civil Disobedience rules will pick in alphabetical order
+    # The fleet in the Black Sea cannot reach a home supply center, and Prussia is two moves from
+    # one, while Ukraine is only one
     results = helper.resolve()
     expected_results = deepcopy(player_units)
     expected_results['Russia'] = {
@@ -217,4 +218,5 @@ def test_j_3b__civil_disorder_two_armies_with_different_distance__not_validated(
     assert results == expected_results
 
 
-# Tests J.4-J.11 are skipped, since they are functionally equivalent to J.3 in our system
+# Tests J.4-J.11 are skipped, since they only vary the distances compared in J.3; the distance rules
+# they cover are tested in pydip/test/turn/test_civil_disorder.py
@@ -1,4 +1,12 @@
-from pydip.map.predefined.vanilla_dip import generate_map, generate_supply_center_map
+from pydip.map.map import FrozenMap, FrozenSupplyCenterMap
+from pydip.map.precompiled import read_map
+from pydip.map.predefined.vanilla_dip import (
+    PRECOMPILED_MAP_PATH,
+    build_map,
+    generate_home_territories,
+    generate_map,
+    generate_supply_center_map,
+)
 
 
 def test_territory_adjacency_counts():
@@ -135,3 +143,32 @@ def test_territory_adjacency_counts():
 def test_supply_center_counts():
     game_map = generate_supply_center_map()
     assert len(game_map.supply_centers) == 34
+
+
+def test_generated_maps_are_shared():
+    assert isinstance(generate_map(), FrozenMap)
+    assert generate_map() is generate_map()
+    assert isinstance(generate_supply_center_map(), FrozenSupplyCenterMap)
+    assert generate_supply_center_map() is generate_supply_center_map()
+    assert generate_supply_center_map().game_map is generate_map()
+
+
+def test_generated_home_territories_are_independent():
+    home_territories = generate_home_territories()
+    home_territories['England'].add('Belgium')
+    del home_territories['France']
+
+    assert generate_home_territories()['England'] == { 'Liverpool', 'London', 'Edinburgh' }
+    assert 'France' in generate_home_territories()
+
+
+def test_precompiled_map_agrees_with_descriptors():
+    # If this fails, the descriptors have changed: run `python -m pydip.map.predefined.build`
+    precompiled = read_map(PRECOMPILED_MAP_PATH)
+    built = build_map()
+
+    assert precompiled is not None
+    assert list(precompiled.name_map.keys()) == list(built.name_map.keys())
+    assert dict(precompiled.name_map) == dict(built.name_map)
+    assert dict(precompiled.adjacency) == dict(built.adjacency)
+    assert precompiled.get_compiled_map().__dict__ == built.get_compiled_map().__dict__
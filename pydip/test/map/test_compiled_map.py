@@ -0,0 +1,122 @@
+from pydip.map.compiled_map import UNREACHABLE_DISTANCE, CompiledMap
+from pydip.map.map import Map
+from pydip.map.predefined.vanilla_dip import generate_map
+
+
+def _lake_map():
+    territory_descriptors = [
+        { 'name': 'Salt Lake City', 'coasts': [ 'Salt Lake City Coast' ] },
+        { 'name': 'Ogden',          'coasts': [ 'Ogden Coast' ] },
+        { 'name': 'Great Salt Lake' },
+    ]
+    adjacencies = [
+        ('Salt Lake City', 'Ogden'),
+        ('Salt Lake City Coast', 'Great Salt Lake'),
+        ('Salt Lake City Coast', 'Ogden Coast'),
+        ('Ogden Coast', 'Great Salt Lake'),
+    ]
+    return Map(territory_descriptors, adjacencies)
+
+
+def test_territory_ids_are_dense():
+    compiled_map = CompiledMap(_lake_map())
+
+    assert compiled_map.names == ['Salt Lake City', 'Salt Lake City Coast', 'Ogden', 'Ogden Coast', 'Great Salt Lake']
+    assert [compiled_map.territory_ids[name] for name in compiled_map.names] == [0, 1, 2, 3, 4]
+
+
+def test_province_ids():
+    compiled_map = CompiledMap(_lake_map())
+
+    assert compiled_map.province_ids == [0, 0, 2, 2, 4]
+    assert compiled_map.province_id('Ogden Coast') == compiled_map.territory_ids['Ogden']
+    assert compiled_map.province_ids_by_name['Salt Lake City Coast'] == compiled_map.province_ids_by_name['Salt Lake City']
+    assert compiled_map.province_ids_by_name['Ogden'] != compiled_map.province_ids_by_name['Salt Lake City']
+    assert compiled_map.relevant_names['Salt Lake City Coast'] == 'Salt Lake City'
+    assert compiled_map.relevant_names['Great Salt Lake'] == 'Great Salt Lake'
+
+
+def test_adjacency_bitsets():
+    compiled_map = CompiledMap(_lake_map())
+
+    territory_ids = compiled_map.territory_ids
+    assert compiled_map.adjacency[territory_ids['Great Salt Lake']] == 0b01010
+    assert compiled_map.adjacency[territory_ids['Ogden Coast']] >> territory_ids['Great Salt Lake'] & 1 == 1
+    assert compiled_map.adjacency[territory_ids['Ogden']] >> territory_ids['Great Salt Lake'] & 1 == 0
+    assert compiled_map.province_masks[territory_ids['Ogden']] == 0b01100
+    assert compiled_map.province_masks[territory_ids['Ogden Coast']] == 0b01100
+
+
+def test_mask_round_trip():
+    compiled_map = CompiledMap(_lake_map())
+    names = { 'Ogden', 'Great Salt Lake' }
+
+    assert compiled_map.names_for_mask(compiled_map.mask_for_names(names)) == names
+    assert compiled_map.names_for_mask(0) == set()
+
+
+def test_agrees_with_vanilla_map():
+    game_map = generate_map()
+    compiled_map = game_map.get_compiled_map()
+
+    assert game_map.get_compiled_map() is compiled_map
+    for name, territory in game_map.name_map.items():
+        territory_id = compiled_map.territory_ids[name]
+        assert compiled_map.names_for_mask(compiled_map.adjacency[territory_id]) == game_map.adjacency[name]
+        assert compiled_map.names_for_mask(compiled_map.province_masks[territory_id]) == {
+            other_name for other_name, other_territory in game_map.name_map.items()
+            if territory.same_territory(other_territory)
+        }
+
+
+def test_convoy_index():
+    compiled_map = generate_map().get_compiled_map()
+
+    assert compiled_map.coastal_seas['Spain'] == { 'Mid-Atlantic Ocean', 'Gulf of Lyon', 'Western Mediterranean Sea' }
+    assert compiled_map.coastal_seas['Spain North Coast'] == compiled_map.coastal_seas['Spain']
+    assert compiled_map.coastal_seas['Munich'] == frozenset()
+    assert compiled_map.sea_neighbours['Skagerrak'] == { 'North Sea' }
+    assert 'Spain' not in compiled_map.sea_neighbours
+
+
+def test_type_masks():
+    game_map = _lake_map()
+    compiled_map = game_map.get_compiled_map()
+
+    assert compiled_map.names_for_mask(compiled_map.land_mask) == { 'Salt Lake City', 'Ogden' }
+    assert compiled_map.names_for_mask(compiled_map.sea_mask) == { 'Great Salt Lake' }
+    assert compiled_map.names_for_mask(compiled_map.coast_mask) == { 'Salt Lake City Coast', 'Ogden Coast' }
+    assert compiled_map.names_for_mask(compiled_map.convoy_mask) == { 'Salt Lake City', 'Ogden' }
+
+    landlocked_map = Map([{ 'name': 'Provo', 'coasts': [] }], [])
+    assert landlocked_map.get_compiled_map().convoy_mask == 0
+
+
+def test_troop_distances():
+    compiled_map = CompiledMap(_lake_map())
+    distances = compiled_map.distances_to_province('Ogden', False)
+
+    assert [distances[compiled_map.territory_ids[name]] for name in compiled_map.names] == [1, 1, 0, 0, 1]
+    assert compiled_map.distances_to_province('Ogden', False) is distances
+
+
+def test_fleet_distances():
+    compiled_map = CompiledMap(_lake_map())
+    distances = compiled_map.distances_to_province('Ogden', True)
+
+    assert [distances[compiled_map.territory_ids[name]] for name in compiled_map.names] == [
+        UNREACHABLE_DISTANCE, 1, UNREACHABLE_DISTANCE, 0, 1,
+    ]
+
+
+def test_vanilla_distances():
+    compiled_map = generate_map().get_compiled_map()
+
+    # Troops count convoys through the sea as moves
+    assert compiled_map.distance_to_nearest('London', { 'Paris' }, False) == 3
+    assert compiled_map.distance_to_nearest('Mid-Atlantic Ocean', { 'Paris', 'Brest' }, False) == 1
+    # Fleets can reach either coast of a province, but never a landlocked one
+    assert compiled_map.distance_to_nearest('Gulf of Lyon', { 'Spain' }, True) == 1
+    assert compiled_map.distance_to_nearest('Mid-Atlantic Ocean', { 'Spain' }, True) == 1
+    assert compiled_map.distance_to_nearest('Mid-Atlantic Ocean', { 'Paris' }, True) == UNREACHABLE_DISTANCE
+    assert compiled_map.distance_to_nearest('Mid-Atlantic Ocean', set(), True) == UNREACHABLE_DISTANCE
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from pydip.map.compiled_ownership import CompiledOwnership
+from pydip.map.map import OwnershipMap
+from pydip.map.predefined import vanilla_dip
+from pydip.player.unit import UnitTypes, Unit
+from pydip.turn.adjustment import calculate_adjustments
+
+
+def _starting_ownership():
+    return CompiledOwnership.from_ownership_map(vanilla_dip.generate_starting_ownership_map())
+
+
+def test_round_trip():
+    ownership_map = vanilla_dip.generate_starting_ownership_map()
+
+    round_trip = CompiledOwnership.from_ownership_map(ownership_map).to_ownership_map()
+
+    assert round_trip.supply_map is ownership_map.supply_map
+    assert round_trip.owned_territories == ownership_map.owned_territories
+    assert round_trip.home_territories == ownership_map.home_territories
+
+
+def test_territory_checks_accept_coasts():
+    ownership = _starting_ownership()
+
+    assert ownership.territory_is_owned('Russia', 'St. Petersburg North Coast')
+    assert ownership.territory_is_home('Russia', 'St. Petersburg')
+    assert not ownership.territory_is_owned('Russia', 'Sweden')
+    assert not ownership.territory_is_home('England', 'St. Petersburg South Coast')
+
+
+def test_supply_center_counts():
+    ownership = _starting_ownership()
+
+    assert ownership.supply_center_count('Russia') == 4
+    assert ownership.supply_center_count('France') == 3
+    assert ownership.owned_home_mask('France') == ownership.home_masks['France']
+
+
+def test_occupy_transfers_ownership():
+    ownership = _starting_ownership()
+    player_units = { player: set() for player in ownership.owned_masks }
+    player_units['England'] = { Unit(UnitTypes.TROOP, 'Brest'), Unit(UnitTypes.FLEET, 'Norway Coast') }
+    player_units['France'] = { Unit(UnitTypes.TROOP, 'Picardy') }
+
+    occupied = ownership.occupy(player_units)
+
+    assert occupied.supply_center_count('England') == 5
+    assert occupied.territory_is_owned('England', 'Brest')
+    assert not occupied.territory_is_owned('France', 'Brest')
+    assert occupied.territory_is_home('France', 'Brest')
+    assert ownership.territory_is_owned('France', 'Brest')
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_occupy_matches_ownership_rule(seed):
+    rng = random.Random(seed)
+    supply_map = vanilla_dip.generate_supply_center_map()
+    players = ['Player {}'.format(index) for index in range(12)]
+    owned_territories = { player: set() for player in players }
+    for territory in sorted(supply_map.supply_centers):
+        if rng.random() < 0.8:
+            owned_territories[rng.choice(players)].add(territory)
+    player_units = { player: set() for player in players }
+    provinces = sorted(name for name in supply_map.game_map.name_map if 'Coast' not in name)
+    for territory in rng.sample(provinces, 40):
+        player_units[rng.choice(players)].add(Unit(UnitTypes.TROOP, territory))
+    ownership_map = OwnershipMap(supply_map, owned_territories, { player: set() for player in players })
+
+    occupied = CompiledOwnership.from_ownership_map(ownership_map).occupy(player_units).to_ownership_map()
+    expected, _ = calculate_adjustments(ownership_map, player_units)
+    assert occupied.owned_territories == expected.owned_territories
+
+    occupants = {
+        unit.position: player for player, units in player_units.items() for unit in units
+        if unit.position in supply_map.supply_centers
+    }
+    for territory in supply_map.supply_centers:
+        owners = { player for player, owned in occupied.owned_territories.items() if territory in owned }
+        if territory in occupants:
+            assert owners == { occupants[territory] }
+        else:
+            assert owners == { player for player, owned in owned_territories.items() if territory in owned }
+
+
+def test_solo_winner():
+    ownership = _starting_ownership()
+    assert ownership.solo_winner(18) is None
+    assert ownership.solo_winner(4) == 'Russia'
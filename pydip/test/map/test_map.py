@@ -1,5 +1,10 @@
+import pickle
+from copy import copy, deepcopy
+
+import pytest
+
 from pydip.map.territory import SeaTerritory, LandTerritory
-from pydip.map.map import Map
+from pydip.map.map import Map, FrozenMap, FrozenSupplyCenterMap
 
 
 def test_empty_map():
@@ -80,3 +85,62 @@ def test_land_territories_with_lake():
 
     assert game_map.name_map == expected_name_map
     assert game_map.adjacency == expected_adjacency
+
+
+def _frozen_lake_map():
+    territory_descriptors = [
+        { 'name': 'Salt Lake City', 'coasts': [ 'Salt Lake City Coast' ] },
+        { 'name': 'Provo', 'coasts': [] },
+        { 'name': 'Great Salt Lake' },
+    ]
+    adjacencies = [
+        ('Salt Lake City', 'Provo'),
+        ('Salt Lake City Coast', 'Great Salt Lake'),
+    ]
+    return FrozenMap(territory_descriptors, adjacencies)
+
+
+def test_frozen_map_cannot_be_modified():
+    game_map = _frozen_lake_map()
+
+    assert game_map.adjacency['Provo'] == { 'Salt Lake City' }
+    with pytest.raises(AttributeError):
+        game_map.adjacency['Provo'].add('Great Salt Lake')
+    with pytest.raises(TypeError):
+        game_map.adjacency['Provo'] = set()
+    with pytest.raises(TypeError):
+        game_map.name_map['Ogden'] = LandTerritory('Ogden', [])
+    with pytest.raises(AttributeError):
+        game_map.name_map = dict()
+
+
+def test_frozen_map_is_shared_by_copies():
+    game_map = _frozen_lake_map()
+
+    assert copy(game_map) is game_map
+    assert deepcopy(game_map) is game_map
+    assert deepcopy({ 'map': game_map })['map'] is game_map
+
+
+def test_frozen_map_round_trips():
+    game_map = _frozen_lake_map()
+    unfrozen_map = Map(game_map.territory_descriptors(), game_map.adjacency_pairs())
+    unpickled_map = pickle.loads(pickle.dumps(game_map))
+
+    for other_map in (FrozenMap.from_map(unfrozen_map), unpickled_map):
+        assert isinstance(other_map, FrozenMap)
+        assert list(other_map.name_map.keys()) == list(game_map.name_map.keys())
+        assert other_map.adjacency == game_map.adjacency
+    assert unfrozen_map.adjacency == game_map.adjacency
+    assert FrozenMap.from_map(game_map) is game_map
+
+
+def test_frozen_supply_center_map():
+    supply_map = FrozenSupplyCenterMap(Map(_frozen_lake_map().territory_descriptors(), []), { 'Provo' })
+
+    assert isinstance(supply_map.game_map, FrozenMap)
+    assert supply_map.supply_centers == frozenset({ 'Provo' })
+    assert deepcopy(supply_map) is supply_map
+    with pytest.raises(AttributeError):
+        supply_map.supply_centers = set()
+    assert pickle.loads(pickle.dumps(supply_map)).supply_centers == { 'Provo' }
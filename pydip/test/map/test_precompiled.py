@@ -0,0 +1,56 @@
+from pydip.map.map import FrozenMap
+from pydip.map.precompiled import FORMAT_VERSION, dump_map, load_map, read_map, write_map
+
+
+def _map():
+    return FrozenMap(
+        [
+            { 'name': 'Atlantis', 'coasts': ['Atlantis Coast'] },
+            { 'name': 'Mu', 'coasts': [] },
+            { 'name': 'Deep Sea' },
+        ],
+        [('Atlantis', 'Mu'), ('Atlantis Coast', 'Deep Sea')],
+    )
+
+
+def test_load_map__round_trip():
+    game_map = _map()
+    loaded = load_map(dump_map(game_map))
+
+    assert isinstance(loaded, FrozenMap)
+    assert list(loaded.name_map.keys()) == list(game_map.name_map.keys())
+    assert dict(loaded.name_map) == dict(game_map.name_map)
+    assert dict(loaded.adjacency) == dict(game_map.adjacency)
+    assert loaded.get_compiled_map().__dict__ == game_map.get_compiled_map().__dict__
+
+
+def test_load_map__is_frozen():
+    loaded = load_map(dump_map(_map()))
+    try:
+        loaded.name_map = dict()
+        assert False, 'expected an AttributeError'
+    except AttributeError:
+        pass
+
+
+def test_load_map__other_version():
+    data = dump_map(_map())
+    stale = data[:8] + bytes([FORMAT_VERSION + 1]) + data[9:]
+    assert load_map(stale) is None
+
+
+def test_read_map__missing_file(tmp_path):
+    assert read_map(str(tmp_path / 'missing.map')) is None
+
+
+def test_read_map__corrupt_file(tmp_path):
+    path = str(tmp_path / 'corrupt.map')
+    with open(path, 'wb') as map_file:
+        map_file.write(dump_map(_map())[:40])
+    assert read_map(path) is None
+
+
+def test_write_map__read_map(tmp_path):
+    path = str(tmp_path / 'test.map')
+    write_map(path, _map())
+    assert dict(read_map(path).adjacency) == dict(_map().adjacency)
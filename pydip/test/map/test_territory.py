@@ -15,3 +15,17 @@ def test_coast_needs_land_parent():
 
     """ expect this to create a coast without AssertionError """
     CoastTerritory('Test Success Coast', good_parent)
+
+
+def test_same_territory_spans_province():
+    bulgaria = LandTerritory('Bulgaria', ['Bulgaria North Coast', 'Bulgaria South Coast'])
+    north_coast, south_coast = bulgaria.coasts
+    rumania = LandTerritory('Rumania', ['Rumania Coast'])
+    black_sea = SeaTerritory('Black Sea')
+
+    assert bulgaria.same_territory(north_coast)
+    assert north_coast.same_territory(south_coast)
+    assert south_coast.same_territory(bulgaria)
+    assert not north_coast.same_territory(rumania.coasts[0])
+    assert not bulgaria.same_territory(black_sea)
+    assert black_sea.same_territory(SeaTerritory('Black Sea'))
@@ -0,0 +1,60 @@
+import copy
+import pickle
+
+import pytest
+
+from pydip.map.predefined.vanilla_dip import generate_map
+from pydip.player.command.adjustment_command import AdjustmentDisbandCommand
+from pydip.player.command.command import ConvoyMoveCommand, ConvoyTransportCommand, HoldCommand, MoveCommand, SupportCommand
+from pydip.player.player import Player
+from pydip.player.unit import Unit, UnitTypes
+
+
+def _commands():
+    player = Player("England", generate_map(), [
+        { 'territory_name': 'London',          'unit_type': UnitTypes.TROOP },
+        { 'territory_name': 'English Channel', 'unit_type': UnitTypes.FLEET },
+        { 'territory_name': 'Wales Coast',     'unit_type': UnitTypes.FLEET },
+    ])
+    troop, channel, wales = player.units
+    return [
+        HoldCommand(player, troop),
+        MoveCommand(player, wales, 'Irish Sea'),
+        SupportCommand(player, wales, channel, 'English Channel'),
+        ConvoyMoveCommand(player, troop, 'Brest'),
+        ConvoyTransportCommand(player, channel, troop, 'Brest'),
+        AdjustmentDisbandCommand(player, troop),
+    ]
+
+
+def test_equal_commands_are_equal_and_hash_equal():
+    for command, same_command in zip(_commands(), _commands()):
+        assert command == same_command
+        assert not command != same_command
+        assert hash(command) == hash(same_command)
+    assert len(set(_commands() + _commands())) == len(_commands())
+
+
+def test_different_commands_are_not_equal():
+    commands = _commands()
+    player = commands[0].player
+    wales = Unit(UnitTypes.FLEET, 'Wales Coast')
+
+    assert SupportCommand(player, wales, commands[4].unit, 'English Channel') == commands[2]
+    assert SupportCommand(player, wales, commands[0].unit, 'London') != commands[2]
+    assert ConvoyTransportCommand(player, commands[4].unit, commands[0].unit, 'Picardy') != commands[4]
+
+
+def test_commands_are_immutable():
+    for command in _commands():
+        with pytest.raises(AttributeError):
+            command.unit = Unit(UnitTypes.TROOP, 'Yorkshire')
+        assert not hasattr(command, '__dict__')
+
+
+def test_commands_survive_pickling_and_copying():
+    commands = _commands()
+
+    assert pickle.loads(pickle.dumps(commands)) == commands
+    assert copy.deepcopy(commands) == commands
+    assert [repr(command) for command in copy.copy(commands)] == [repr(command) for command in commands]
@@ -100,3 +100,65 @@ def test_player_multiple_starting_territories():
         Unit(UnitTypes.TROOP, 'Moscow'),
         Unit(UnitTypes.FLEET, 'Sevastopol Coast'),
     ]
+
+
+def _russia():
+    return Player("test player", generate_map(), [
+        { 'territory_name': 'St. Petersburg North Coast', 'unit_type': UnitTypes.FLEET },
+        { 'territory_name': 'Moscow',                     'unit_type': UnitTypes.TROOP },
+    ])
+
+
+def test_player_unit_index():
+    player = _russia()
+
+    assert player.find_unit('Moscow') is player.units[1]
+    assert player.has_unit(Unit(UnitTypes.TROOP, 'Moscow'))
+    assert not player.has_unit(Unit(UnitTypes.FLEET, 'Moscow'))
+    assert not player.has_unit(Unit(UnitTypes.TROOP, 'Warsaw'))
+    assert player.unit_in_province('St. Petersburg') == Unit(UnitTypes.FLEET, 'St. Petersburg North Coast')
+    assert player.unit_in_province('St. Petersburg South Coast') == Unit(UnitTypes.FLEET, 'St. Petersburg North Coast')
+    assert player.unit_in_province('Warsaw') is None
+    with pytest.raises(KeyError):
+        player.find_unit('St. Petersburg')
+
+
+def test_player_add_and_remove_unit():
+    player = _russia()
+    player.add_unit(Unit(UnitTypes.TROOP, 'Warsaw'))
+    player.remove_unit(Unit(UnitTypes.TROOP, 'Moscow'))
+
+    assert player.units == [
+        Unit(UnitTypes.FLEET, 'St. Petersburg North Coast'),
+        Unit(UnitTypes.TROOP, 'Warsaw'),
+    ]
+    assert player.find_unit('Warsaw') == Unit(UnitTypes.TROOP, 'Warsaw')
+    assert player.unit_in_province('Moscow') is None
+    assert not player.has_unit(Unit(UnitTypes.TROOP, 'Moscow'))
+
+    # a province can only hold one unit, and only owned units can be removed
+    with pytest.raises(AssertionError):
+        player.add_unit(Unit(UnitTypes.FLEET, 'St. Petersburg South Coast'))
+    with pytest.raises(AssertionError):
+        player.remove_unit(Unit(UnitTypes.TROOP, 'Moscow'))
+
+
+def test_player_assign_units():
+    player = _russia()
+    player.units = [Unit(UnitTypes.FLEET, 'Sevastopol Coast')]
+
+    assert player.find_unit('Sevastopol Coast') == Unit(UnitTypes.FLEET, 'Sevastopol Coast')
+    assert player.unit_in_province('Moscow') is None
+    assert player.unit_in_province('Sevastopol') == Unit(UnitTypes.FLEET, 'Sevastopol Coast')
+
+
+def test_player_units_cannot_be_changed_directly():
+    player = _russia()
+
+    with pytest.raises(AttributeError):
+        player.units.append(Unit(UnitTypes.TROOP, 'Warsaw'))
+    with pytest.raises(TypeError):
+        player.units[0] = Unit(UnitTypes.TROOP, 'Warsaw')
+    assert not player.has_unit(Unit(UnitTypes.TROOP, 'Warsaw'))
+    assert player.units == (Unit(UnitTypes.FLEET, 'St. Petersburg North Coast'), Unit(UnitTypes.TROOP, 'Moscow'))
+    assert player.units[1:] == [Unit(UnitTypes.TROOP, 'Moscow')]
@@ -1,4 +1,10 @@
-from pydip.player.unit import UnitTypes, Unit
+import copy
+import gc
+import pickle
+
+import pytest
+
+from pydip.player.unit import _INTERNED_UNITS, UnitTypes, Unit
 
 
 def test_same_position_and_type_are_equal():
@@ -31,3 +37,37 @@ def test_different_position_and_type_are_not_equal():
 
     assert not unit_a == unit_b
     assert unit_a != unit_b
+
+
+def test_units_are_interned():
+    unit_a = Unit(UnitTypes.FLEET, 'Adriatic Sea')
+    unit_b = Unit(UnitTypes.FLEET, 'Adriatic Sea')
+
+    assert unit_a is unit_b
+    assert Unit(UnitTypes.TROOP, 'Adriatic Sea') is not unit_a
+
+
+def test_units_are_immutable():
+    unit = Unit(UnitTypes.TROOP, 'Trieste')
+
+    with pytest.raises(AttributeError):
+        unit.position = 'Vienna'
+    assert unit.position == 'Trieste'
+    assert not hasattr(unit, '__dict__')
+
+
+def test_copied_units_are_interned():
+    unit = Unit(UnitTypes.TROOP, 'Trieste')
+
+    assert pickle.loads(pickle.dumps(unit)) is unit
+    assert copy.deepcopy(unit) is unit
+    assert { unit: 1 }[Unit(UnitTypes.TROOP, 'Trieste')] == 1
+
+
+def test_unreferenced_units_are_not_kept():
+    unit = Unit(UnitTypes.FLEET, 'Unreferenced Sea')
+    assert (UnitTypes.FLEET, 'Unreferenced Sea') in _INTERNED_UNITS
+
+    del unit
+    gc.collect()
+    assert (UnitTypes.FLEET, 'Unreferenced Sea') not in _INTERNED_UNITS
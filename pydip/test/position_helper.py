@@ -0,0 +1,74 @@
+from pydip.map.map import Map
+from pydip.player.command.command import MoveCommand
+from pydip.player.player import Player
+from pydip.player.unit import UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.turn_helper import TurnHelper
+
+
+def dislodge_helper():
+    """ A supported German move dislodges Italy's troop in Tyrolia """
+    return TurnHelper([
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.MOVE, UnitTypes.TROOP, 'Munich', 'Tyrolia'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.TROOP, 'Bohemia', 'Munich', 'Tyrolia'),
+        ]),
+        PlayerHelper('Italy', [
+            CommandHelper(CommandType.HOLD, UnitTypes.TROOP, 'Tyrolia'),
+        ]),
+    ])
+
+
+def convoy_paradox_helper():
+    """ France convoys into London, which England supports holding, while Germany attacks the convoying fleet """
+    return TurnHelper([
+        PlayerHelper('England', [
+            CommandHelper(CommandType.HOLD, UnitTypes.FLEET, 'London Coast'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'Wales Coast', 'London Coast', 'London Coast'),
+        ]),
+        PlayerHelper('France', [
+            CommandHelper(CommandType.CONVOY_MOVE, UnitTypes.TROOP, 'Brest', 'London'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'English Channel', 'Brest', 'London'),
+        ]),
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'North Sea', 'Belgium Coast', 'English Channel'),
+            CommandHelper(CommandType.MOVE, UnitTypes.FLEET, 'Belgium Coast', 'English Channel'),
+        ]),
+    ])
+
+
+def pandins_paradox_helper(extra_player_helpers=()):
+    """ DATC 6.F.16, Pandin's paradox, with any extra_player_helpers (PlayerHelper[]) added to the turn """
+    return TurnHelper([
+        PlayerHelper('England', [
+            CommandHelper(CommandType.MOVE, UnitTypes.FLEET, 'Wales Coast', 'English Channel'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'London Coast', 'Wales Coast', 'English Channel'),
+        ]),
+        PlayerHelper('France', [
+            CommandHelper(CommandType.CONVOY_MOVE, UnitTypes.TROOP, 'Brest', 'London'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'English Channel', 'Brest', 'London'),
+        ]),
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.MOVE, UnitTypes.FLEET, 'Belgium Coast', 'English Channel'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'North Sea', 'Belgium Coast', 'English Channel'),
+        ]),
+    ] + list(extra_player_helpers))
+
+
+def chain_position(length):
+    """
+    Returns (game_map, Command[]) for a line of length + 1 land territories, where each of the
+    first length territories holds a troop moving into the next one. Resolving the first move
+    depends on every move after it, so the chain of dependencies is length commands deep.
+    """
+    names = ['Line {}'.format(index) for index in range(length + 1)]
+    game_map = Map(
+        [{ 'name': name, 'coasts': [] } for name in names],
+        list(zip(names, names[1:])),
+    )
+    player = Player('Player', game_map, [
+        { 'territory_name': name, 'unit_type': UnitTypes.TROOP } for name in names[:-1]
+    ])
+    units = { unit.position: unit for unit in player.units }
+    return game_map, [MoveCommand(player, units[source], destination) for source, destination in zip(names, names[1:])]
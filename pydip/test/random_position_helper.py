@@ -0,0 +1,87 @@
+from pydip.map.territory import LandTerritory, SeaTerritory
+from pydip.player.command.command import (
+    ConvoyMoveCommand,
+    ConvoyTransportCommand,
+    HoldCommand,
+    MoveCommand,
+    SupportCommand,
+)
+from pydip.player.player import Player
+from pydip.player.unit import UnitTypes
+
+
+class RandomPositionHelper:
+    """
+    Builds random, legal positions on a map, with a unit in roughly half of its provinces and every
+    kind of order (including convoys) issued at random, for comparing implementations against each other
+    """
+
+    def __init__(self, rng, game_map, player_names=('England', 'France', 'Germany', 'Russia')):
+        self.rng = rng
+        self.game_map = game_map
+        self.convoy_destinations = sorted(
+            territory.name for territory in game_map.name_map.values()
+            if isinstance(territory, LandTerritory) and territory.coasts
+        )
+        self.players = self._random_players(player_names)
+        self.units = [(player, unit) for player in self.players for unit in player.units]
+
+    def random_commands(self, support_ratio=0.3):
+        """
+        Returns a random command for every unit. Afterwards, roughly support_ratio of the units switch
+        to supporting another unit's command, where they can, so that units are regularly dislodged.
+        """
+        commands = [self.random_command(player, unit) for player, unit in self.units]
+        for index, (player, unit) in enumerate(self.units):
+            if self.rng.random() >= support_ratio:
+                continue
+            for supported in self.rng.sample(commands, len(commands)):
+                try:
+                    commands[index] = SupportCommand(player, unit, supported.unit, supported.destination)
+                    break
+                except AssertionError:
+                    continue
+        return commands
+
+    def random_change(self):
+        """ Returns a random command for a random unit """
+        player, unit = self.rng.choice(self.units)
+        return self.random_command(player, unit)
+
+    def random_command(self, player, unit):
+        """ Returns a random legal command for unit, trying random kinds of order until one is legal """
+        rng = self.rng
+        game_map = self.game_map
+        while True:
+            kind = rng.randrange(5)
+            try:
+                if kind == 0:
+                    return HoldCommand(player, unit)
+                elif kind == 1:
+                    return MoveCommand(player, unit, rng.choice(sorted(game_map.adjacency[unit.position])))
+                elif kind == 2:
+                    _, supported_unit = rng.choice(self.units)
+                    destinations = sorted(game_map.adjacency[supported_unit.position]) + [supported_unit.position]
+                    return SupportCommand(player, unit, supported_unit, rng.choice(destinations))
+                elif kind == 3:
+                    return ConvoyMoveCommand(player, unit, rng.choice(self.convoy_destinations))
+                else:
+                    _, transported_unit = rng.choice(self.units)
+                    return ConvoyTransportCommand(player, unit, transported_unit, rng.choice(self.convoy_destinations))
+            except AssertionError:
+                continue
+
+    def _random_players(self, player_names):
+        rng = self.rng
+        configurations = { name: [] for name in player_names }
+        for territory in sorted(self.game_map.name_map.values(), key=lambda territory: territory.name):
+            if not isinstance(territory, (LandTerritory, SeaTerritory)) or rng.random() < 0.45:
+                continue
+            if isinstance(territory, SeaTerritory):
+                configuration = { 'territory_name': territory.name, 'unit_type': UnitTypes.FLEET }
+            elif territory.coasts and rng.random() < 0.4:
+                configuration = { 'territory_name': rng.choice(territory.coasts).name, 'unit_type': UnitTypes.FLEET }
+            else:
+                configuration = { 'territory_name': territory.name, 'unit_type': UnitTypes.TROOP }
+            configurations[rng.choice(player_names)].append(configuration)
+        return [Player(name, self.game_map, configurations[name]) for name in player_names]
@@ -0,0 +1,17 @@
+from pydip.map.predefined import vanilla_dip
+from pydip.test.position_helper import convoy_paradox_helper, dislodge_helper
+from pydip.turn.batch import resolve_turns_batch
+
+
+def test_batch_matches_serial():
+    helpers = {
+        'mixed-{}'.format(index) if index % 2 else 'dislodge-{}'.format(index):
+            convoy_paradox_helper() if index % 2 else dislodge_helper()
+        for index in range(8)
+    }
+    expected = {key: helper.resolve() for key, helper in helpers.items()}
+
+    jobs = [(key, helper.commands) for key, helper in helpers.items()]
+    results = dict(resolve_turns_batch(vanilla_dip.generate_map(), jobs, workers=2))
+
+    assert results == expected
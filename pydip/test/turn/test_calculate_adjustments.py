@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from pydip.map.map import OwnershipMap
+from pydip.map.predefined import vanilla_dip
+from pydip.player.unit import UnitTypes, Unit
+from pydip.turn.adjustment import calculate_adjustments
+
+
+def _ownership_map(owned_territories):
+    return OwnershipMap(
+        vanilla_dip.generate_supply_center_map(),
+        owned_territories,
+        { player: set() for player in owned_territories },
+    )
+
+
+def _reference_owned_territories(ownership_map, player_units):
+    """ Supply centers each player owns after adjustments, checking every pair of players directly """
+    game_map = ownership_map.supply_map.game_map
+    supply_centers = ownership_map.supply_map.supply_centers
+    positions = {
+        player: { game_map.relevant_name_for_territory(unit.position) for unit in player_units[player] }
+        for player in ownership_map.owned_territories
+    }
+    owned_territories = dict()
+    for player, territories in ownership_map.owned_territories.items():
+        occupied_by_others = set().union(*(positions[other] for other in positions if other != player))
+        owned_territories[player] = (territories - occupied_by_others | positions[player]) & supply_centers
+    return owned_territories
+
+
+def test_occupied_supply_centers_change_hands():
+    ownership_map = _ownership_map({
+        'England': { 'London', 'Edinburgh' },
+        'France': { 'Brest', 'Paris' },
+    })
+    player_units = {
+        'England': { Unit(UnitTypes.TROOP, 'Brest'), Unit(UnitTypes.FLEET, 'North Sea') },
+        'France': { Unit(UnitTypes.FLEET, 'Spain North Coast'), Unit(UnitTypes.TROOP, 'Picardy') },
+    }
+
+    new_ownership_map, adjustment_counts = calculate_adjustments(ownership_map, player_units)
+
+    assert new_ownership_map.owned_territories == {
+        'England': { 'London', 'Edinburgh', 'Brest' },
+        'France': { 'Paris', 'Spain' },
+    }
+    assert adjustment_counts == { 'England': 1, 'France': 0 }
+
+
+def test_own_unit_keeps_supply_center_owned_by_another_player():
+    ownership_map = _ownership_map({
+        'England': { 'London' },
+        'France': { 'London' },
+    })
+    player_units = {
+        'England': { Unit(UnitTypes.TROOP, 'London') },
+        'France': set(),
+    }
+
+    new_ownership_map, adjustment_counts = calculate_adjustments(ownership_map, player_units)
+
+    assert new_ownership_map.owned_territories == { 'England': { 'London' }, 'France': set() }
+    assert adjustment_counts == { 'England': 0, 'France': 0 }
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_many_players_match_reference(seed):
+    rng = random.Random(seed)
+    supply_map = vanilla_dip.generate_supply_center_map()
+    players = ['Player {}'.format(index) for index in range(12)]
+    owned_territories = { player: set() for player in players }
+    for territory in sorted(supply_map.supply_centers):
+        if rng.random() < 0.8:
+            owned_territories[rng.choice(players)].add(territory)
+    player_units = { player: set() for player in players }
+    provinces = sorted(name for name in supply_map.game_map.name_map if 'Coast' not in name)
+    for territory in rng.sample(provinces, 40):
+        player_units[rng.choice(players)].add(Unit(UnitTypes.TROOP, territory))
+    ownership_map = _ownership_map(owned_territories)
+
+    new_ownership_map, adjustment_counts = calculate_adjustments(ownership_map, player_units)
+
+    assert new_ownership_map.owned_territories == _reference_owned_territories(ownership_map, player_units)
+    assert adjustment_counts == {
+        player: len(new_ownership_map.owned_territories[player]) - len(player_units[player]) for player in players
+    }
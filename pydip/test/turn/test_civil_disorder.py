@@ -0,0 +1,86 @@
+from copy import deepcopy
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.unit import UnitTypes, Unit
+from pydip.test.adjustment_helper import AdjustmentHelper
+
+
+def _resolve_civil_disorder(france_units, france_territories):
+    """ Resolves adjustments with France in civil disorder, holding france_units and owning france_territories """
+    player_units = vanilla_dip.generate_starting_player_units()
+    player_units['France'] = france_units
+    owned_territories = vanilla_dip.generate_home_territories()
+    owned_territories['France'] = france_territories
+
+    helper = AdjustmentHelper([], player_units=player_units, owned_territories=owned_territories)
+    results = helper.resolve()
+    expected_unchanged = deepcopy(player_units)
+    del expected_unchanged['France']
+    assert { player: units for player, units in results.items() if player != 'France' } == expected_unchanged
+    return results['France']
+
+
+def test_furthest_unit_disbanded_first():
+    results = _resolve_civil_disorder(
+        {
+            Unit(UnitTypes.TROOP, 'Paris'),
+            Unit(UnitTypes.TROOP, 'Picardy'),
+            Unit(UnitTypes.TROOP, 'Ruhr'),
+        },
+        { 'Paris', 'Brest' },
+    )
+
+    assert results == { Unit(UnitTypes.TROOP, 'Paris'), Unit(UnitTypes.TROOP, 'Picardy') }
+
+
+def test_fleet_disbanded_before_troop_at_same_distance():
+    results = _resolve_civil_disorder(
+        {
+            Unit(UnitTypes.TROOP, 'Paris'),
+            Unit(UnitTypes.TROOP, 'Gascony'),
+            Unit(UnitTypes.FLEET, 'Mid-Atlantic Ocean'),
+        },
+        { 'Paris', 'Brest' },
+    )
+
+    assert results == { Unit(UnitTypes.TROOP, 'Paris'), Unit(UnitTypes.TROOP, 'Gascony') }
+
+
+def test_alphabetical_order_at_same_distance():
+    results = _resolve_civil_disorder(
+        {
+            Unit(UnitTypes.TROOP, 'Paris'),
+            Unit(UnitTypes.TROOP, 'Picardy'),
+            Unit(UnitTypes.TROOP, 'Gascony'),
+        },
+        { 'Paris', 'Brest' },
+    )
+
+    assert results == { Unit(UnitTypes.TROOP, 'Paris'), Unit(UnitTypes.TROOP, 'Picardy') }
+
+
+def test_distance_only_to_owned_home_supply_centers():
+    # Piedmont is next to Marseilles, but France no longer owns it
+    results = _resolve_civil_disorder(
+        {
+            Unit(UnitTypes.TROOP, 'Paris'),
+            Unit(UnitTypes.TROOP, 'Picardy'),
+            Unit(UnitTypes.TROOP, 'Piedmont'),
+        },
+        { 'Paris', 'Brest' },
+    )
+
+    assert results == { Unit(UnitTypes.TROOP, 'Paris'), Unit(UnitTypes.TROOP, 'Picardy') }
+
+
+def test_distance_to_any_home_supply_center_when_none_owned():
+    results = _resolve_civil_disorder(
+        {
+            Unit(UnitTypes.TROOP, 'Spain'),
+            Unit(UnitTypes.TROOP, 'Portugal'),
+            Unit(UnitTypes.TROOP, 'Bohemia'),
+        },
+        { 'Spain', 'Portugal' },
+    )
+
+    assert results == { Unit(UnitTypes.TROOP, 'Spain'), Unit(UnitTypes.TROOP, 'Portugal') }
@@ -1,3 +1,5 @@
+import pytest
+
 from pydip.map.predefined.vanilla_dip import generate_map
 from pydip.player.command.command import (
     ConvoyMoveCommand,
@@ -21,11 +23,11 @@ def test__move_command():
     command = MoveCommand(player, player.units[0], 'Ankara')
     command_map = CommandMap(game_map, [command])
 
-    assert command_map._home_map            == {'Smyrna' : command}
-    assert command_map._attacker_map        == {'Ankara' : [command]}
-    assert command_map._convoy_attacker_map == dict()
-    assert command_map._transport_map       == dict()
-    assert command_map._support_map         == dict()
+    assert _by_name(game_map, command_map._home_map)            == {'Smyrna' : command}
+    assert _by_name(game_map, command_map._attacker_map)        == {'Ankara' : [command]}
+    assert _by_name(game_map, command_map._convoy_attacker_map) == dict()
+    assert _by_name(game_map, command_map._transport_map)       == dict()
+    assert _by_name(game_map, command_map._support_map)         == dict()
 
 
 # noinspection PyProtectedMember
@@ -38,11 +40,11 @@ def test__hold_command():
     command = HoldCommand(player, player.units[0])
     command_map = CommandMap(game_map, [command])
 
-    assert command_map._home_map            == {'Smyrna' : command}
-    assert command_map._attacker_map        == {'Smyrna' : [command]}
-    assert command_map._convoy_attacker_map == dict()
-    assert command_map._transport_map       == dict()
-    assert command_map._support_map         == dict()
+    assert _by_name(game_map, command_map._home_map)            == {'Smyrna' : command}
+    assert _by_name(game_map, command_map._attacker_map)        == {'Smyrna' : [command]}
+    assert _by_name(game_map, command_map._convoy_attacker_map) == dict()
+    assert _by_name(game_map, command_map._transport_map)       == dict()
+    assert _by_name(game_map, command_map._support_map)         == dict()
 
 
 # noinspection PyProtectedMember
@@ -61,19 +63,19 @@ def test__support_command():
     support_command_2 = SupportCommand(player, player.units[3], player.units[2], 'Serbia')
     command_map = CommandMap(game_map, [move_command, support_command_1, hold_command, support_command_2])
 
-    assert command_map._home_map == {
+    assert _by_name(game_map, command_map._home_map) == {
         'Smyrna' : move_command,
         'Armenia' : support_command_1,
         'Serbia' : hold_command,
         'Greece' : support_command_2,
     }
-    assert command_map._attacker_map == {
+    assert _by_name(game_map, command_map._attacker_map) == {
         'Ankara' : [move_command],
         'Serbia' : [hold_command],
     }
-    assert command_map._convoy_attacker_map == dict()
-    assert command_map._transport_map       == dict()
-    assert command_map._support_map == {
+    assert _by_name(game_map, command_map._convoy_attacker_map) == dict()
+    assert _by_name(game_map, command_map._transport_map)       == dict()
+    assert _by_name(game_map, command_map._support_map) == {
         ('Smyrna', 'Ankara') : [support_command_1],
         ('Serbia', 'Serbia') : [support_command_2],
     }
@@ -89,11 +91,11 @@ def test__convoy_move_command():
     command = ConvoyMoveCommand(player, player.units[0], 'Sevastopol')
     command_map = CommandMap(game_map, [command])
 
-    assert command_map._home_map            == {'Ankara' : command}
-    assert command_map._attacker_map        == dict()
-    assert command_map._convoy_attacker_map == {'Sevastopol' : [command]}
-    assert command_map._transport_map       == dict()
-    assert command_map._support_map         == dict()
+    assert _by_name(game_map, command_map._home_map)            == {'Ankara' : command}
+    assert _by_name(game_map, command_map._attacker_map)        == dict()
+    assert _by_name(game_map, command_map._convoy_attacker_map) == {'Sevastopol' : [command]}
+    assert _by_name(game_map, command_map._transport_map)       == dict()
+    assert _by_name(game_map, command_map._support_map)         == dict()
 
 
 # noinspection PyProtectedMember
@@ -108,11 +110,11 @@ def test__convoy_transport_command():
     transport_command = ConvoyTransportCommand(player, player.units[1], player.units[0], 'Sevastopol')
     command_map = CommandMap(game_map, [move_command, transport_command])
 
-    assert command_map._home_map            == {'Ankara' : move_command, 'Black Sea' : transport_command}
-    assert command_map._attacker_map        == dict()
-    assert command_map._convoy_attacker_map == {'Sevastopol' : [move_command]}
-    assert command_map._transport_map       == {('Ankara', 'Sevastopol') : [transport_command]}
-    assert command_map._support_map         == dict()
+    assert _by_name(game_map, command_map._home_map)            == {'Ankara' : move_command, 'Black Sea' : transport_command}
+    assert _by_name(game_map, command_map._attacker_map)        == dict()
+    assert _by_name(game_map, command_map._convoy_attacker_map) == {'Sevastopol' : [move_command]}
+    assert _by_name(game_map, command_map._transport_map)       == {('Ankara', 'Sevastopol') : [transport_command]}
+    assert _by_name(game_map, command_map._support_map)         == dict()
 
 
 # noinspection PyProtectedMember
@@ -138,7 +140,7 @@ def test__several_commands():
     ]
     command_map = CommandMap(game_map, commands)
 
-    assert command_map._home_map == {
+    assert _by_name(game_map, command_map._home_map) == {
         'Ankara'    : commands[0],
         'Black Sea' : commands[1],
         'Budapest'  : commands[2],
@@ -146,16 +148,116 @@ def test__several_commands():
         'Ukraine'   : commands[4],
         'Moscow'    : commands[5],
     }
-    assert command_map._attacker_map == {
+    assert _by_name(game_map, command_map._attacker_map) == {
         'Rumania'    : [commands[2]],
         'Sevastopol' : [commands[3], commands[5]],
     }
-    assert command_map._convoy_attacker_map == {
+    assert _by_name(game_map, command_map._convoy_attacker_map) == {
         'Sevastopol' : [commands[0]],
     }
-    assert command_map._transport_map == {
+    assert _by_name(game_map, command_map._transport_map) == {
         ('Ankara', 'Sevastopol') : [commands[1]],
     }
-    assert command_map._support_map == {
+    assert _by_name(game_map, command_map._support_map) == {
         ('Rumania', 'Sevastopol') : [commands[4]],
     }
+
+
+def _several_commands():
+    game_map = generate_map()
+    starting_configuration = [
+        {'territory_name': 'Ankara', 'unit_type': UnitTypes.TROOP},
+        {'territory_name': 'Black Sea', 'unit_type': UnitTypes.FLEET},
+        {'territory_name': 'Budapest', 'unit_type': UnitTypes.TROOP},
+        {'territory_name': 'Rumania Coast', 'unit_type': UnitTypes.FLEET},
+        {'territory_name': 'Ukraine', 'unit_type': UnitTypes.TROOP},
+        {'territory_name': 'Moscow', 'unit_type': UnitTypes.TROOP},
+    ]
+    player = Player("Turkey", game_map, starting_configuration)
+    return game_map, player, [
+        ConvoyMoveCommand(player, player.units[0], 'Sevastopol'),
+        ConvoyTransportCommand(player, player.units[1], player.units[0], 'Sevastopol'),
+        MoveCommand(player, player.units[2], 'Rumania'),
+        MoveCommand(player, player.units[3], 'Sevastopol Coast'),
+        SupportCommand(player, player.units[4], player.units[3], 'Sevastopol Coast'),
+        MoveCommand(player, player.units[5], 'Sevastopol'),
+    ]
+
+
+def _by_name(game_map, index):
+    """ Returns a CommandMap index with its province id keys replaced by province names """
+    names = game_map.get_compiled_map().names
+    return {
+        tuple(names[province_id] for province_id in key) if isinstance(key, tuple) else names[key]: value
+        for key, value in index.items()
+    }
+
+
+def _names(game_map, province_ids):
+    names = game_map.get_compiled_map().names
+    return { names[province_id] for province_id in province_ids }
+
+
+# noinspection PyProtectedMember
+def _assert_same_indices(command_map, expected_map):
+    assert command_map._home_map            == expected_map._home_map
+    assert command_map._attacker_map        == expected_map._attacker_map
+    assert command_map._convoy_attacker_map == expected_map._convoy_attacker_map
+    assert command_map._transport_map       == expected_map._transport_map
+    assert command_map._support_map         == expected_map._support_map
+
+
+def test__add_commands():
+    game_map, _, commands = _several_commands()
+    command_map = CommandMap(game_map, [])
+    touched = [command_map.add_command(command) for command in commands]
+
+    _assert_same_indices(command_map, CommandMap(game_map, commands))
+    assert [_names(game_map, provinces) for provinces in touched] == [
+        {'Ankara', 'Sevastopol'},
+        {'Black Sea', 'Ankara', 'Sevastopol'},
+        {'Budapest', 'Rumania'},
+        {'Rumania', 'Sevastopol'},
+        {'Ukraine', 'Rumania', 'Sevastopol'},
+        {'Moscow', 'Sevastopol'},
+    ]
+
+
+def test__add_command_to_occupied_province():
+    game_map, player, commands = _several_commands()
+    command_map = CommandMap(game_map, commands)
+
+    with pytest.raises(AssertionError):
+        command_map.add_command(HoldCommand(player, player.units[3]))
+
+
+def test__remove_commands():
+    game_map, _, commands = _several_commands()
+    command_map = CommandMap(game_map, commands)
+
+    assert _names(game_map, command_map.remove_command(commands[1])) == {'Black Sea', 'Ankara', 'Sevastopol'}
+    assert _names(game_map, command_map.remove_command(commands[5])) == {'Moscow', 'Sevastopol'}
+    _assert_same_indices(command_map, CommandMap(game_map, commands[:1] + commands[2:5]))
+
+    for command in commands[:1] + commands[2:5]:
+        command_map.remove_command(command)
+    _assert_same_indices(command_map, CommandMap(game_map, []))
+
+
+def test__remove_equal_but_different_command():
+    game_map, player, commands = _several_commands()
+    command_map = CommandMap(game_map, commands)
+
+    with pytest.raises(AssertionError):
+        command_map.remove_command(MoveCommand(player, player.units[2], 'Rumania'))
+
+
+def test__replace_command():
+    game_map, player, commands = _several_commands()
+    command_map = CommandMap(game_map, commands)
+    hold = HoldCommand(player, player.units[4])
+
+    assert _names(game_map, command_map.replace_command(commands[4], hold)) == {'Ukraine', 'Rumania', 'Sevastopol'}
+    _assert_same_indices(command_map, CommandMap(game_map, commands[:4] + [hold, commands[5]]))
+    assert command_map.get_supports('Rumania Coast', 'Sevastopol') == []
+    assert command_map.get_attackers('Ukraine') == [hold]
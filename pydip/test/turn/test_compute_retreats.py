@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.command import ConvoyMoveCommand, MoveCommand
+from pydip.player.unit import Unit
+from pydip.test.random_position_helper import RandomPositionHelper
+from pydip.turn.command_map import CommandMap
+from pydip.turn.resolve import (
+    ResolutionContext,
+    _hold_strength_steps,
+    _prevent_strength_steps,
+    _resolve,
+    _run_steps,
+    compute_retreats,
+)
+
+
+def _reference_retreats(game_map, command_map, commands, resolutions):
+    """ Computes the retreat map by checking each rule for each territory adjacent to a dislodged unit """
+    context = ResolutionContext.from_resolutions(game_map, command_map, resolutions)
+    compiled_map = game_map.get_compiled_map()
+
+    def province_mask(territory):
+        return compiled_map.province_masks[compiled_map.territory_ids[territory]]
+
+    def in_mask(territory, mask):
+        return (mask >> compiled_map.territory_ids[territory]) & 1 == 1
+
+    occupied = 0
+    for command in commands:
+        moved = isinstance(command, (MoveCommand, ConvoyMoveCommand)) and resolutions[command.unit.position]
+        occupied |= province_mask(command.destination if moved else command.unit.position)
+
+    retreat_map = dict()
+    for command in commands:
+        position = command.unit.position
+        results = retreat_map.setdefault(command.player.name, dict())
+        direct_attackers = [c for c in command_map.get_attackers(position) if resolutions[c.unit.position]]
+        convoy_attackers = [c for c in command_map.get_convoy_attackers(position) if resolutions[c.unit.position]]
+        if resolutions[position]:
+            moved = isinstance(command, (MoveCommand, ConvoyMoveCommand))
+            results[Unit(command.unit.unit_type, command.destination) if moved else command.unit] = None
+        elif len(direct_attackers) + len(convoy_attackers) == 0:
+            results[command.unit] = None
+        else:
+            results[command.unit] = {
+                territory for territory in game_map.adjacency[position]
+                if not in_mask(territory, occupied)
+                and all(not in_mask(territory, province_mask(attacker.unit.position)) for attacker in direct_attackers)
+                and _run_steps(context, _hold_strength_steps(context, territory)) == 0
+                and all(_run_steps(context, _prevent_strength_steps(context, attacker)) == 0 for attacker in command_map.get_attackers(territory))
+            }
+    return retreat_map
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_retreat_options_match_reference(seed):
+    game_map = vanilla_dip.generate_map()
+    helper = RandomPositionHelper(random.Random(seed), game_map)
+    dislodged_count = 0
+    for _ in range(20):
+        commands = helper.random_commands()
+        command_map = CommandMap(game_map, commands)
+        context = ResolutionContext(game_map, command_map)
+        resolutions = { command.unit.position: _resolve(context, command) for command in commands }
+
+        retreat_map = compute_retreats(game_map, command_map, commands, resolutions)
+        assert retreat_map == _reference_retreats(game_map, command_map, commands, resolutions)
+        dislodged_count += sum(
+            retreats is not None for results in retreat_map.values() for retreats in results.values()
+        )
+    assert dislodged_count > 0
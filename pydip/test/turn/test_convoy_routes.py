@@ -0,0 +1,71 @@
+from pydip.map.predefined.vanilla_dip import generate_map
+from pydip.player.unit import UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.turn_helper import TurnHelper
+from pydip.turn.command_map import CommandMap
+from pydip.turn.convoy_routes import ConvoyRoutes
+from pydip.turn.resolve import ResolutionContext, _resolve
+
+
+def _routes():
+    transports = { 'North Sea', 'English Channel', 'Irish Sea', 'Mid-Atlantic Ocean' }
+    return ConvoyRoutes(generate_map().get_compiled_map(), 'Norway', 'Portugal', transports)
+
+
+def _long_convoy_helper():
+    return TurnHelper([
+        PlayerHelper('England', [
+            CommandHelper(CommandType.CONVOY_MOVE, UnitTypes.TROOP, 'London', 'Tunis'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'English Channel', 'London', 'Tunis'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'Mid-Atlantic Ocean', 'London', 'Tunis'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'Western Mediterranean Sea', 'London', 'Tunis'),
+        ]),
+    ])
+
+
+def test_route_needs_transports_at_both_ends():
+    routes = _routes()
+    assert not routes.connected()
+
+    routes.add_surviving_transport('North Sea')
+    routes.add_surviving_transport('English Channel')
+    assert not routes.connected()
+
+    routes.add_surviving_transport('Mid-Atlantic Ocean')
+    assert routes.connected()
+
+
+def test_route_must_be_contiguous():
+    routes = _routes()
+    routes.add_surviving_transport('North Sea')
+    routes.add_surviving_transport('Mid-Atlantic Ocean')
+    assert not routes.connected()
+
+    routes.add_surviving_transport('Irish Sea')
+    assert not routes.connected()
+
+    routes.add_surviving_transport('English Channel')
+    assert routes.connected()
+
+
+def test_resolved_transports_are_kept_on_context():
+    helper = _long_convoy_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+
+    assert _resolve(context, helper.commands[0])
+    assert context.convoy_routes[('London', 'Tunis')].connected()
+
+    context.mark_unresolved('London')
+    assert ('London', 'Tunis') in context.convoy_routes
+    context.mark_unresolved('Mid-Atlantic Ocean')
+    assert ('London', 'Tunis') not in context.convoy_routes
+
+
+def test_routes_are_not_built_without_transports():
+    helper = _long_convoy_helper()
+    helper.commands = helper.commands[:1]
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+
+    assert not _resolve(context, helper.commands[0])
+    assert context.convoy_routes == {}
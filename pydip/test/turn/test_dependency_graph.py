@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from pydip.test.position_helper import pandins_paradox_helper
+from pydip.turn.command_map import CommandMap
+from pydip.turn.dependency_graph import build_dependency_graph, strongly_connected_components
+from pydip.turn.resolve import resolve_turn
+
+
+def _is_cyclic(graph, component):
+    """ Determines whether a component from strongly_connected_components contains a cycle """
+    return len(component) > 1 or component[0] in graph.get(component[0], ())
+
+
+def test_strongly_connected_components_order_dependencies_first():
+    graph = {
+        'a': ['b'],
+        'b': ['c'],
+        'c': ['b', 'd'],
+        'd': [],
+        'e': ['e'],
+    }
+    components = strongly_connected_components(graph)
+
+    assert [sorted(component) for component in components] == [['d'], ['b', 'c'], ['a'], ['e']]
+    assert [_is_cyclic(graph, component) for component in components] == [False, True, False, True]
+
+
+def test_strongly_connected_components_of_long_chain():
+    graph = { index: [index + 1] for index in range(5000) }
+    graph[5000] = []
+
+    components = strongly_connected_components(graph)
+    assert components == [[index] for index in reversed(range(5001))]
+
+
+def test_dependency_graph_of_pandins_paradox():
+    helper = pandins_paradox_helper()
+    graph = build_dependency_graph(CommandMap(helper.game_map, helper.commands), helper.commands)
+
+    assert sorted(graph['North Sea']) == []
+    assert sorted(graph['English Channel']) == ['Belgium Coast', 'Wales Coast']
+    assert sorted(graph['Brest']) == ['English Channel', 'London Coast']
+    assert sorted(graph['London Coast']) == ['English Channel']
+    assert [sorted(component) for component in strongly_connected_components(graph)] == [
+        ['North Sea'],
+        ['Belgium Coast', 'English Channel', 'London Coast', 'Wales Coast'],
+        ['Brest'],
+    ]
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'scc', 'iterative'])
+def test_paradox_resolution_does_not_depend_on_command_order(engine):
+    helper = pandins_paradox_helper()
+    expected = helper.resolve()
+
+    for commands in itertools.permutations(helper.commands):
+        assert resolve_turn(helper.game_map, list(commands), engine=engine) == expected
+
+
+def test_invalid_engine():
+    helper = pandins_paradox_helper()
+    with pytest.raises(ValueError):
+        resolve_turn(helper.game_map, helper.commands, engine='bogus')
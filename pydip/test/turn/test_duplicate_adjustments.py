@@ -0,0 +1,77 @@
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.unit import UnitTypes, Unit
+from pydip.test.adjustment_helper import AdjustmentHelper
+from pydip.test.command_helper import AdjustmentCommandHelper, AdjustmentCommandType
+from pydip.test.player_helper import PlayerHelper
+
+
+def _france_helper(france_units, france_territories, command_helpers):
+    player_units = vanilla_dip.generate_starting_player_units()
+    player_units['France'] = france_units
+    owned_territories = vanilla_dip.generate_home_territories()
+    owned_territories['France'] = france_territories
+    return AdjustmentHelper(
+        [PlayerHelper('France', command_helpers)],
+        player_units=player_units,
+        owned_territories=owned_territories,
+    )
+
+
+def _disband_helper():
+    """ France must disband three units, and orders the disband of Picardy twice """
+    return _france_helper(
+        {
+            Unit(UnitTypes.TROOP, 'Paris'),
+            Unit(UnitTypes.TROOP, 'Picardy'),
+            Unit(UnitTypes.TROOP, 'Burgundy'),
+            Unit(UnitTypes.TROOP, 'Gascony'),
+        },
+        { 'Paris' },
+        [
+            AdjustmentCommandHelper(AdjustmentCommandType.DISBAND, UnitTypes.TROOP, 'Picardy'),
+            AdjustmentCommandHelper(AdjustmentCommandType.DISBAND, UnitTypes.TROOP, 'Picardy'),
+            AdjustmentCommandHelper(AdjustmentCommandType.DISBAND, UnitTypes.TROOP, 'Burgundy'),
+        ],
+    )
+
+
+def _create_helper():
+    """ France may build two units, and orders a build in Marseilles twice """
+    return _france_helper(
+        { Unit(UnitTypes.TROOP, 'Paris') },
+        { 'Paris', 'Brest', 'Marseilles' },
+        [
+            AdjustmentCommandHelper(AdjustmentCommandType.CREATE, UnitTypes.TROOP, 'Marseilles'),
+            AdjustmentCommandHelper(AdjustmentCommandType.CREATE, UnitTypes.TROOP, 'Marseilles'),
+        ],
+    )
+
+
+def test_duplicate_orders_are_equal():
+    for helper in (_disband_helper(), _create_helper()):
+        first, second = helper.commands[:2]
+        assert first is not second
+        assert first == second
+        assert len({ first, second }) == 1
+
+
+def test_duplicate_disband_counts_once():
+    results = _disband_helper().resolve()
+
+    # Gascony is disbanded in civil disorder, in place of the repeated order
+    assert results['France'] == { Unit(UnitTypes.TROOP, 'Paris') }
+
+
+def test_duplicate_create_counts_once():
+    results = _create_helper().resolve()
+
+    assert results['France'] == { Unit(UnitTypes.TROOP, 'Paris'), Unit(UnitTypes.TROOP, 'Marseilles') }
+
+
+def test_duplicate_orders_rejected_when_validated():
+    with pytest.raises(AssertionError):
+        _disband_helper().resolve__validated()
+    with pytest.raises(AssertionError):
+        _create_helper().resolve__validated()
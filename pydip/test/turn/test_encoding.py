@@ -0,0 +1,189 @@
+import pytest
+
+from pydip.map.map import Map, OwnershipMap
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.adjustment_command import AdjustmentCreateCommand, AdjustmentDisbandCommand
+from pydip.player.command.retreat_command import RetreatDisbandCommand, RetreatMoveCommand
+from pydip.player.player import Player
+from pydip.player.unit import Unit, UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.turn_helper import TurnHelper
+from pydip.turn.encoding import (
+    decode_commands,
+    decode_ownership_map,
+    decode_retreat_map,
+    decode_units,
+    encode_commands,
+    encode_ownership_map,
+    encode_retreat_map,
+    encode_units,
+    iter_records,
+)
+from pydip.turn.resolve import resolve_turn
+
+
+def _turn_helper():
+    return TurnHelper([
+        PlayerHelper('England', [
+            CommandHelper(CommandType.HOLD, UnitTypes.FLEET, 'London Coast'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'Wales Coast', 'London Coast', 'London Coast'),
+        ]),
+        PlayerHelper('France', [
+            CommandHelper(CommandType.CONVOY_MOVE, UnitTypes.TROOP, 'Brest', 'London'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'English Channel', 'Brest', 'London'),
+        ]),
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'North Sea', 'Belgium Coast', 'English Channel'),
+            CommandHelper(CommandType.MOVE, UnitTypes.FLEET, 'Belgium Coast', 'English Channel'),
+            CommandHelper(CommandType.MOVE, UnitTypes.TROOP, 'Munich', 'Tyrolia'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.TROOP, 'Bohemia', 'Munich', 'Tyrolia'),
+        ]),
+        PlayerHelper('Italy', [
+            CommandHelper(CommandType.HOLD, UnitTypes.TROOP, 'Tyrolia'),
+        ]),
+    ])
+
+
+def _assert_same_commands(decoded, commands):
+    assert [type(command) for command in decoded] == [type(command) for command in commands]
+    assert [repr(command) for command in decoded] == [repr(command) for command in commands]
+
+
+def test_commands_round_trip():
+    helper = _turn_helper()
+    encoded = encode_commands(helper.game_map, helper.commands)
+    decoded = decode_commands(encoded, helper.game_map)
+
+    _assert_same_commands(decoded, helper.commands)
+    assert encode_commands(helper.game_map, decoded) == encoded
+
+
+def test_commands_round_trip__resolves_identically():
+    helper = _turn_helper()
+    decoded = decode_commands(encode_commands(helper.game_map, helper.commands), helper.game_map)
+    assert resolve_turn(helper.game_map, decoded) == helper.resolve()
+
+
+def test_commands_round_trip__given_players():
+    helper = _turn_helper()
+    players = { command.player.name: command.player for command in helper.commands }
+    decoded = decode_commands(encode_commands(helper.game_map, helper.commands), helper.game_map, players)
+
+    _assert_same_commands(decoded, helper.commands)
+    assert all(command.player is players[command.player.name] for command in decoded)
+
+
+def test_retreat_commands_round_trip():
+    game_map = vanilla_dip.generate_map()
+    retreat_map = {
+        'England': {
+            Unit(UnitTypes.TROOP, 'Holland'): { 'Belgium', 'Kiel' },
+            Unit(UnitTypes.FLEET, 'North Sea'): { 'Norwegian Sea' },
+        },
+    }
+    player = Player('England', game_map, [
+        { 'territory_name': 'Holland', 'unit_type': UnitTypes.TROOP },
+        { 'territory_name': 'North Sea', 'unit_type': UnitTypes.FLEET },
+    ])
+    commands = [
+        RetreatMoveCommand(retreat_map, player, player.units[0], 'Belgium'),
+        RetreatDisbandCommand(retreat_map, player, player.units[1]),
+    ]
+
+    decoded = decode_commands(encode_commands(game_map, commands), game_map)
+    _assert_same_commands(decoded, commands)
+    assert decoded == commands
+
+
+def test_adjustment_commands_round_trip():
+    game_map = vanilla_dip.generate_map()
+    ownership_map = OwnershipMap(
+        vanilla_dip.generate_supply_center_map(),
+        vanilla_dip.generate_home_territories(),
+        vanilla_dip.generate_home_territories(),
+    )
+    player = Player('Germany', game_map, [{ 'territory_name': 'Munich', 'unit_type': UnitTypes.TROOP }])
+    commands = [
+        AdjustmentDisbandCommand(player, player.units[0]),
+        AdjustmentCreateCommand(ownership_map, player, Unit(UnitTypes.FLEET, 'Kiel Coast')),
+    ]
+
+    decoded = decode_commands(encode_commands(game_map, commands), game_map)
+    _assert_same_commands(decoded, commands)
+    assert decoded[1].player.units == [Unit(UnitTypes.TROOP, 'Munich')]
+
+
+def test_units_round_trip():
+    game_map = vanilla_dip.generate_map()
+    player_units = vanilla_dip.generate_starting_player_units()
+    player_units['Italy'] = set()
+    assert decode_units(encode_units(game_map, player_units), game_map) == player_units
+
+
+def test_retreat_map_round_trip():
+    helper = _turn_helper()
+    retreat_map = helper.resolve()
+    assert any(retreats is not None for units in retreat_map.values() for retreats in units.values())
+
+    encoded = encode_retreat_map(helper.game_map, retreat_map)
+    assert decode_retreat_map(encoded, helper.game_map) == retreat_map
+
+
+def test_ownership_map_round_trip():
+    supply_map = vanilla_dip.generate_supply_center_map()
+    owned_territories = vanilla_dip.generate_home_territories()
+    owned_territories['Germany'] |= { 'Holland', 'Denmark' }
+    owned_territories['Turkey'] = set()
+    ownership_map = OwnershipMap(supply_map, owned_territories, vanilla_dip.generate_home_territories())
+
+    decoded = decode_ownership_map(encode_ownership_map(ownership_map), supply_map)
+    assert decoded.supply_map is supply_map
+    assert decoded.owned_territories == ownership_map.owned_territories
+    assert decoded.home_territories == ownership_map.home_territories
+
+
+def test_iter_records():
+    helper = _turn_helper()
+    retreat_map = helper.resolve()
+    data = bytearray()
+    for _ in range(3):
+        data += encode_commands(helper.game_map, helper.commands)
+        data += encode_retreat_map(helper.game_map, retreat_map)
+
+    records = list(iter_records(data))
+    assert len(records) == 6
+    for index, record in enumerate(records):
+        assert isinstance(record, memoryview)
+        if index % 2 == 0:
+            _assert_same_commands(decode_commands(record, helper.game_map), helper.commands)
+        else:
+            assert decode_retreat_map(record, helper.game_map) == retreat_map
+
+
+def test_decode__wrong_kind():
+    game_map = vanilla_dip.generate_map()
+    encoded = encode_units(game_map, vanilla_dip.generate_starting_player_units())
+    with pytest.raises(ValueError):
+        decode_retreat_map(encoded, game_map)
+
+
+def test_decode__wrong_version():
+    game_map = vanilla_dip.generate_map()
+    encoded = encode_units(game_map, vanilla_dip.generate_starting_player_units())
+    with pytest.raises(ValueError):
+        decode_units(bytes([encoded[0] + 1]) + encoded[1:], game_map)
+
+
+def test_decode__wrong_map():
+    helper = _turn_helper()
+    other_map = Map([{ 'name': 'Atlantis', 'coasts': [] }], [])
+    with pytest.raises(ValueError):
+        decode_commands(encode_commands(helper.game_map, helper.commands), other_map)
+
+
+def test_decode__truncated():
+    helper = _turn_helper()
+    encoded = encode_commands(helper.game_map, helper.commands)
+    with pytest.raises(ValueError):
+        decode_commands(encoded[:-1], helper.game_map)
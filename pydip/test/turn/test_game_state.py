@@ -0,0 +1,216 @@
+import random
+
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.adjustment_command import AdjustmentCreateCommand
+from pydip.player.command.command import HoldCommand, MoveCommand, SupportCommand
+from pydip.player.command.retreat_command import RetreatDisbandCommand, RetreatMoveCommand
+from pydip.player.helpers import unit_can_enter
+from pydip.player.unit import UnitTypes, Unit
+from pydip.turn.adjustment import calculate_adjustments, resolve_adjustment
+from pydip.turn.game_state import GameState, Phase, Season
+from pydip.turn.resolve import resolve_turn
+from pydip.turn.retreat import resolve_retreats
+
+
+def _burgundy_state():
+    """ Germany is ready to dislodge France's only unit, in Burgundy """
+    return GameState(vanilla_dip.generate_starting_ownership_map(), {
+        'France': { Unit(UnitTypes.TROOP, 'Burgundy') },
+        'Germany': { Unit(UnitTypes.TROOP, 'Munich'), Unit(UnitTypes.TROOP, 'Ruhr') },
+    })
+
+
+def _dislodge_burgundy(state):
+    germany = state.players['Germany']
+    munich = germany.find_unit('Munich')
+    state.resolve_movement([
+        MoveCommand(germany, munich, 'Burgundy'),
+        SupportCommand(germany, germany.find_unit('Ruhr'), munich, 'Burgundy'),
+    ])
+
+
+def _assert_players_match_units(state):
+    for name, player in state.players.items():
+        assert set(player.units) == state.player_units[name]
+
+
+def test_initial_state():
+    state = GameState(vanilla_dip.generate_starting_ownership_map(), vanilla_dip.generate_starting_player_units())
+
+    assert (state.year, state.season, state.phase) == (1901, Season.SPRING, Phase.MOVEMENT)
+    assert state.player_units == vanilla_dip.generate_starting_player_units()
+    _assert_players_match_units(state)
+
+
+def test_movement_updates_players_in_place():
+    state = GameState(vanilla_dip.generate_starting_ownership_map(), vanilla_dip.generate_starting_player_units())
+    england = state.players['England']
+    france_units = state.player_units['France']
+
+    state.resolve_movement([MoveCommand(england, england.find_unit('Liverpool'), 'Yorkshire')])
+
+    assert (state.year, state.season, state.phase) == (1901, Season.FALL, Phase.MOVEMENT)
+    assert state.players['England'] is england
+    assert england.has_unit(Unit(UnitTypes.TROOP, 'Yorkshire'))
+    assert not england.has_unit(Unit(UnitTypes.TROOP, 'Liverpool'))
+    assert state.player_units['France'] is france_units
+    _assert_players_match_units(state)
+
+
+def test_year_without_changes_skips_adjustments():
+    state = GameState(vanilla_dip.generate_starting_ownership_map(), vanilla_dip.generate_starting_player_units())
+
+    state.resolve_movement([])
+    state.resolve_movement([])
+
+    assert (state.year, state.season, state.phase) == (1902, Season.SPRING, Phase.MOVEMENT)
+    assert state.player_units == vanilla_dip.generate_starting_player_units()
+
+
+def test_dislodged_unit_retreats():
+    state = _burgundy_state()
+    _dislodge_burgundy(state)
+
+    assert state.phase == Phase.RETREAT
+    assert state.retreat_map['France'][Unit(UnitTypes.TROOP, 'Burgundy')] == {
+        'Paris', 'Picardy', 'Belgium', 'Gascony', 'Marseilles',
+    }
+    france = state.players['France']
+    state.resolve_retreats([RetreatMoveCommand(state.retreat_map, france, france.find_unit('Burgundy'), 'Paris')])
+
+    assert (state.year, state.season, state.phase) == (1901, Season.FALL, Phase.MOVEMENT)
+    assert state.retreat_map is None
+    assert state.player_units['France'] == { Unit(UnitTypes.TROOP, 'Paris') }
+    assert state.player_units['Germany'] == { Unit(UnitTypes.TROOP, 'Burgundy'), Unit(UnitTypes.TROOP, 'Ruhr') }
+    _assert_players_match_units(state)
+
+
+def test_missing_retreat_disbands():
+    state = _burgundy_state()
+    _dislodge_burgundy(state)
+
+    state.resolve_retreats([])
+
+    assert state.player_units['France'] == set()
+    assert state.players['France'].units == []
+
+
+def test_fall_captures_and_builds():
+    ownership_map = vanilla_dip.generate_starting_ownership_map()
+    state = GameState(ownership_map, {
+        'England': { Unit(UnitTypes.TROOP, 'Belgium') },
+    }, season=Season.FALL)
+
+    state.resolve_movement([])
+
+    assert state.phase == Phase.ADJUSTMENT
+    assert state.ownership_map.territory_is_owned('England', 'Belgium')
+    assert state.adjustment_counts['England'] == 3
+    england = state.players['England']
+    state.resolve_adjustments([
+        AdjustmentCreateCommand(state.ownership_map, england, Unit(UnitTypes.FLEET, 'London Coast')),
+    ])
+
+    assert (state.year, state.season, state.phase) == (1902, Season.SPRING, Phase.MOVEMENT)
+    assert state.adjustment_counts is None
+    assert state.player_units['England'] == { Unit(UnitTypes.TROOP, 'Belgium'), Unit(UnitTypes.FLEET, 'London Coast') }
+    _assert_players_match_units(state)
+
+
+def test_wrong_phase():
+    state = GameState(vanilla_dip.generate_starting_ownership_map(), vanilla_dip.generate_starting_player_units())
+
+    with pytest.raises(AssertionError):
+        state.resolve_retreats([])
+    with pytest.raises(AssertionError):
+        state.resolve_adjustments([])
+
+
+def _random_movement(rng, state):
+    game_map = state.game_map
+    commands = []
+    for player in state.players.values():
+        for unit in player.units:
+            destinations = [
+                destination for destination in sorted(game_map.adjacency[unit.position])
+                if unit_can_enter(game_map, unit, game_map.name_map[destination])
+            ]
+            if rng.random() < 0.7 and len(destinations) > 0:
+                commands.append(MoveCommand(player, unit, rng.choice(destinations)))
+            else:
+                commands.append(HoldCommand(player, unit))
+    # some units support another unit instead, so that units are dislodged
+    for index, command in enumerate(commands):
+        if rng.random() >= 0.3:
+            continue
+        for supported in rng.sample(commands, len(commands)):
+            try:
+                commands[index] = SupportCommand(command.player, command.unit, supported.unit, supported.destination)
+                break
+            except AssertionError:
+                continue
+    return commands
+
+
+def _random_retreats(rng, state):
+    commands = []
+    for name, units in state.retreat_map.items():
+        for unit, retreats in sorted(units.items(), key=lambda item: item[0].position):
+            if retreats is None:
+                continue
+            if len(retreats) > 0 and rng.random() < 0.8:
+                destination = rng.choice(sorted(retreats))
+                commands.append(RetreatMoveCommand(state.retreat_map, state.players[name], unit, destination))
+            else:
+                commands.append(RetreatDisbandCommand(state.retreat_map, state.players[name], unit))
+    return commands
+
+
+def _builds(state):
+    """ Troops in every free home supply center of each player who may build, up to their count """
+    game_map = state.game_map
+    occupied = { game_map.relevant_name_for_territory(unit.position) for units in state.player_units.values() for unit in units }
+    commands = []
+    for name, count in state.adjustment_counts.items():
+        free = sorted(
+            state.ownership_map.home_territories[name] & state.ownership_map.owned_territories[name] - occupied
+        )
+        for territory in free[:max(count, 0)]:
+            commands.append(AdjustmentCreateCommand(state.ownership_map, state.players[name], Unit(UnitTypes.TROOP, territory)))
+    return commands
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_game_matches_chained_phases(seed):
+    rng = random.Random(seed)
+    state = GameState(vanilla_dip.generate_starting_ownership_map(), vanilla_dip.generate_starting_player_units())
+    ownership_map = state.ownership_map
+    player_units = vanilla_dip.generate_starting_player_units()
+
+    while state.year < 1905:
+        season = state.season
+        commands = _random_movement(rng, state)
+        retreat_map = resolve_turn(state.game_map, commands)
+        player_units = { name: set(units) for name, units in retreat_map.items() }
+        state.resolve_movement(commands)
+
+        if state.phase == Phase.RETREAT:
+            retreat_commands = _random_retreats(rng, state)
+            player_units = resolve_retreats(retreat_map, retreat_commands)
+            state.resolve_retreats(retreat_commands)
+        player_units = { name: player_units.get(name, set()) for name in ownership_map.owned_territories }
+        assert state.player_units == player_units
+
+        if season == Season.FALL:
+            ownership_map, adjustment_counts = calculate_adjustments(ownership_map, player_units)
+            assert state.ownership_map.owned_territories == ownership_map.owned_territories
+            if state.phase == Phase.ADJUSTMENT:
+                adjustment_commands = _builds(state)
+                player_units = resolve_adjustment(ownership_map, adjustment_counts, player_units, adjustment_commands)
+                state.resolve_adjustments(adjustment_commands)
+            else:
+                assert all(count == 0 for count in adjustment_counts.values())
+            assert state.player_units == player_units
+        _assert_players_match_units(state)
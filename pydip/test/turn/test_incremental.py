@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.command import HoldCommand, MoveCommand
+from pydip.player.player import Player
+from pydip.player.unit import UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.position_helper import pandins_paradox_helper
+from pydip.test.random_position_helper import RandomPositionHelper
+from pydip.turn.incremental import IncrementalAdjudicator
+from pydip.turn.resolve import resolve_turn
+
+
+def _pandins_paradox_helper():
+    """ Pandin's paradox, with an unrelated Russian unit holding in Moscow """
+    return pandins_paradox_helper([
+        PlayerHelper('Russia', [
+            CommandHelper(CommandType.HOLD, UnitTypes.TROOP, 'Moscow'),
+        ]),
+    ])
+
+
+def _current_commands(adjudicator):
+    return list(adjudicator.commands.values())
+
+
+def test_initial_retreat_map_matches_resolve_turn():
+    helper = _pandins_paradox_helper()
+    adjudicator = IncrementalAdjudicator(helper.game_map, helper.commands)
+    assert adjudicator.retreat_map() == helper.resolve()
+    assert adjudicator.last_cone == { command.unit.position for command in helper.commands }
+
+
+def test_change_re_resolves_only_dependency_cone():
+    helper = _pandins_paradox_helper()
+    adjudicator = IncrementalAdjudicator(helper.game_map, helper.commands)
+    support = next(command for command in helper.commands if command.unit.position == 'North Sea')
+
+    retreat_map = adjudicator.change_command(HoldCommand(support.player, support.unit))
+
+    assert retreat_map == resolve_turn(helper.game_map, _current_commands(adjudicator))
+    assert 'Moscow' not in adjudicator.last_cone
+    assert { 'North Sea', 'Belgium Coast', 'Wales Coast' } <= adjudicator.last_cone
+
+
+def test_change_isolated_order():
+    helper = _pandins_paradox_helper()
+    adjudicator = IncrementalAdjudicator(helper.game_map, helper.commands)
+    hold = next(command for command in helper.commands if command.unit.position == 'Moscow')
+
+    retreat_map = adjudicator.change_command(MoveCommand(hold.player, hold.unit, 'Livonia'))
+
+    assert retreat_map == resolve_turn(helper.game_map, _current_commands(adjudicator))
+    assert adjudicator.last_cone == { 'Moscow' }
+
+
+def test_change_for_unit_without_command():
+    helper = _pandins_paradox_helper()
+    adjudicator = IncrementalAdjudicator(helper.game_map, helper.commands)
+    player = Player('Russia', helper.game_map, [
+        { 'territory_name': 'Warsaw', 'unit_type': UnitTypes.TROOP },
+    ])
+
+    with pytest.raises(KeyError):
+        adjudicator.change_command(HoldCommand(player, player.units[0]))
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_random_changes_match_resolve_turn(seed):
+    game_map = vanilla_dip.generate_map()
+    helper = RandomPositionHelper(random.Random(seed), game_map)
+    commands = helper.random_commands()
+
+    adjudicator = IncrementalAdjudicator(game_map, commands)
+    assert adjudicator.retreat_map() == resolve_turn(game_map, commands)
+    for _ in range(40):
+        retreat_map = adjudicator.change_command(helper.random_change())
+        assert retreat_map == resolve_turn(game_map, _current_commands(adjudicator))
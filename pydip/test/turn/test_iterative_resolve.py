@@ -0,0 +1,27 @@
+from pydip.player.command.command import HoldCommand
+from pydip.player.unit import Unit, UnitTypes
+from pydip.test.position_helper import chain_position
+from pydip.turn.resolve import resolve_turn
+
+
+def test_iterative_engine_resolves_chains_deeper_than_recursion_limit():
+    game_map, commands = chain_position(2000)
+
+    result = resolve_turn(game_map, commands, engine='iterative')
+    assert result == { 'Player': { Unit(UnitTypes.TROOP, command.destination): None for command in commands } }
+
+
+def test_iterative_engine_matches_recursive_engine_on_blocked_chain():
+    game_map, commands = chain_position(50)
+    positions = [command.unit.position for command in commands]
+    commands[-1] = HoldCommand(commands[-1].player, commands[-1].unit)
+
+    expected = resolve_turn(game_map, commands, engine='recursive')
+    assert resolve_turn(game_map, commands, engine='iterative') == expected
+    assert expected == { 'Player': { Unit(UnitTypes.TROOP, name): None for name in positions } }
+
+
+def test_engines_agree_on_long_chain():
+    game_map, commands = chain_position(200)
+
+    assert resolve_turn(game_map, commands, engine='recursive') == resolve_turn(game_map, commands, engine='iterative')
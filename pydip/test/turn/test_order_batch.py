@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.command import (
+    ConvoyMoveCommand,
+    ConvoyTransportCommand,
+    HoldCommand,
+    MoveCommand,
+    SupportCommand,
+)
+from pydip.player.player import Player
+from pydip.player.unit import Unit, UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.turn_helper import TurnHelper
+from pydip.turn.order_batch import NO_AUX, OrderBatch, OrderKinds
+from pydip.turn.resolve import resolve_turn
+
+
+""" OrderKinds -> Command class """
+_COMMAND_CLASSES = {
+    OrderKinds.HOLD: HoldCommand,
+    OrderKinds.MOVE: MoveCommand,
+    OrderKinds.SUPPORT: SupportCommand,
+    OrderKinds.CONVOY_MOVE: ConvoyMoveCommand,
+    OrderKinds.CONVOY_TRANSPORT: ConvoyTransportCommand,
+}
+
+
+def _turn_helper():
+    return TurnHelper([
+        PlayerHelper('England', [
+            CommandHelper(CommandType.HOLD, UnitTypes.FLEET, 'London Coast'),
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'Wales Coast', 'London Coast', 'London Coast'),
+        ]),
+        PlayerHelper('France', [
+            CommandHelper(CommandType.CONVOY_MOVE, UnitTypes.TROOP, 'Brest', 'London'),
+            CommandHelper(CommandType.CONVOY_TRANSPORT, UnitTypes.FLEET, 'English Channel', 'Brest', 'London'),
+        ]),
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.SUPPORT, UnitTypes.FLEET, 'North Sea', 'Belgium Coast', 'English Channel'),
+            CommandHelper(CommandType.MOVE, UnitTypes.FLEET, 'Belgium Coast', 'English Channel'),
+        ]),
+    ])
+
+
+def _construct(player, kind, unit, destination, aux_unit):
+    """ Builds the Command for an order through its constructor, returning None if it is rejected """
+    command_class = _COMMAND_CLASSES[kind]
+    try:
+        if kind == OrderKinds.HOLD:
+            return command_class(player, unit)
+        if aux_unit is None:
+            return command_class(player, unit, destination)
+        return command_class(player, unit, aux_unit, destination)
+    except AssertionError:
+        return None
+
+
+def test_from_commands_round_trip():
+    helper = _turn_helper()
+    batch = OrderBatch.from_commands(helper.game_map, helper.commands)
+    commands = batch.to_commands()
+
+    assert len(batch) == len(helper.commands)
+    assert batch.player_names == ['England', 'France', 'Germany']
+    assert list(batch.aux_sources).count(NO_AUX) == 3
+    assert [type(command) for command in commands] == [type(command) for command in helper.commands]
+    assert [repr(command) for command in commands] == [repr(command) for command in helper.commands]
+    assert resolve_turn(helper.game_map, commands) == helper.resolve()
+
+
+def test_to_commands__given_players():
+    helper = _turn_helper()
+    players = { command.player.name: command.player for command in helper.commands }
+    commands = OrderBatch.from_commands(helper.game_map, helper.commands).to_commands(players)
+    assert all(command.player is players[command.player.name] for command in commands)
+
+
+def test_illegal_rows__matches_constructors():
+    game_map = vanilla_dip.generate_map()
+    names = sorted(game_map.name_map)
+    rng = random.Random(0)
+
+    player = Player('Player', game_map)
+    batch = OrderBatch(game_map)
+    expected = []
+    for row in range(20000):
+        kind = rng.choice(list(OrderKinds))
+        unit = Unit(rng.choice(list(UnitTypes)), rng.choice(names))
+        aux_unit = None
+        if kind in (OrderKinds.SUPPORT, OrderKinds.CONVOY_TRANSPORT):
+            aux_unit = Unit(rng.choice(list(UnitTypes)), rng.choice(names))
+        # Bias destinations towards the unit's neighbours, so that plenty of orders are legal
+        neighbours = sorted(game_map.adjacency[unit.position])
+        destination = rng.choice(neighbours if neighbours and rng.random() < 0.7 else names)
+
+        player.units = [unit]
+        if _construct(player, kind, unit, destination, aux_unit) is None:
+            expected.append(row)
+        batch.add(
+            'Player',
+            kind,
+            unit.unit_type,
+            unit.position,
+            destination,
+            aux_unit and aux_unit.unit_type,
+            aux_unit and aux_unit.position,
+        )
+
+    assert 0 < len(expected) < len(batch)
+    assert batch.illegal_rows() == expected
+
+
+def test_illegal_rows__checks_ownership():
+    helper = _turn_helper()
+    batch = OrderBatch.from_commands(helper.game_map, helper.commands)
+    player_units = { name: set() for name in batch.player_names }
+    for command in helper.commands:
+        player_units[command.player.name].add(command.unit)
+    # Germany's last order is to its fleet in Belgium, but Germany has a troop there instead
+    player_units['Germany'].remove(Unit(UnitTypes.FLEET, 'Belgium Coast'))
+    player_units['Germany'].add(Unit(UnitTypes.TROOP, 'Belgium'))
+
+    assert batch.illegal_rows() == []
+    assert batch.illegal_rows(player_units) == [5]
+
+
+def test_add__requires_aux_unit_for_supports():
+    batch = OrderBatch(vanilla_dip.generate_map())
+    with pytest.raises(AssertionError):
+        batch.add('England', OrderKinds.SUPPORT, UnitTypes.FLEET, 'North Sea', 'Norwegian Sea')
+    with pytest.raises(AssertionError):
+        batch.add('England', OrderKinds.MOVE, UnitTypes.FLEET, 'North Sea', 'Atlantis')
@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from pydip.map.map import OwnershipMap
+from pydip.map.predefined import vanilla_dip
+from pydip.player.command.adjustment_command import AdjustmentCreateCommand
+from pydip.player.player import Player
+from pydip.player.unit import Unit, UnitTypes
+from pydip.turn.adjustment import calculate_adjustments, resolve_adjustment
+from pydip.turn.player_units import PlayerUnits
+
+
+def test_equal_to_dict_of_sets():
+    starting_units = vanilla_dip.generate_starting_player_units()
+    player_units = PlayerUnits(starting_units)
+
+    assert player_units == starting_units
+    assert starting_units == player_units
+    assert set(player_units) == set(starting_units)
+    assert all(isinstance(units, frozenset) for units in player_units.values())
+
+
+def test_is_immutable():
+    player_units = PlayerUnits(vanilla_dip.generate_starting_player_units())
+    with pytest.raises(TypeError):
+        player_units['Italy'] = set()
+    with pytest.raises(AttributeError):
+        player_units['Italy'].add(Unit(UnitTypes.TROOP, 'Rome'))
+
+
+def test_with_units_shares_unchanged_players():
+    player_units = PlayerUnits(vanilla_dip.generate_starting_player_units())
+    updated = player_units.with_units({ 'Italy': player_units['Italy'] - { Unit(UnitTypes.TROOP, 'Rome') } })
+
+    assert Unit(UnitTypes.TROOP, 'Rome') in player_units['Italy']
+    assert Unit(UnitTypes.TROOP, 'Rome') not in updated['Italy']
+    assert all(updated[player] is player_units[player] for player in player_units if player != 'Italy')
+    assert player_units.with_units(dict()) is player_units
+
+
+def test_pickle_round_trip():
+    player_units = PlayerUnits(vanilla_dip.generate_starting_player_units())
+    assert pickle.loads(pickle.dumps(player_units)) == player_units
+
+
+def test_resolve_adjustment_only_copies_adjusting_players():
+    game_map = vanilla_dip.generate_map()
+    starting_units = vanilla_dip.generate_starting_player_units()
+    starting_units['Italy'] = starting_units['Italy'] - { Unit(UnitTypes.TROOP, 'Rome') }
+    player_units = PlayerUnits(starting_units)
+    home_territories = vanilla_dip.generate_home_territories()
+    ownership_map = OwnershipMap(vanilla_dip.generate_supply_center_map(), home_territories, home_territories)
+    ownership_map, adjustment_counts = calculate_adjustments(ownership_map, player_units)
+    assert adjustment_counts['Italy'] == 1
+
+    italy = Player('Italy', game_map, [
+        { 'territory_name': unit.position, 'unit_type': unit.unit_type } for unit in player_units['Italy']
+    ])
+    create = AdjustmentCreateCommand(ownership_map, italy, Unit(UnitTypes.TROOP, 'Rome'))
+    result = resolve_adjustment(ownership_map, adjustment_counts, player_units, [create])
+
+    assert isinstance(result, PlayerUnits)
+    assert result['Italy'] == player_units['Italy'] | { Unit(UnitTypes.TROOP, 'Rome') }
+    assert all(result[player] is player_units[player] for player in player_units if player != 'Italy')
+    assert resolve_adjustment(ownership_map, adjustment_counts, starting_units, [create]) == result
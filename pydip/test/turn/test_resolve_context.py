@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pydip.player.unit import UnitTypes
+from pydip.test.command_helper import CommandType, CommandHelper
+from pydip.test.player_helper import PlayerHelper
+from pydip.test.position_helper import convoy_paradox_helper, dislodge_helper
+from pydip.test.turn_helper import TurnHelper
+from pydip.turn.command_map import CommandMap
+from pydip.turn.resolve import (
+    ResolutionContext,
+    ResolutionState,
+    _get_head_to_head_combatant,
+    _has_path_steps,
+    _prevent_strength_steps,
+    _resolve,
+    _run_steps,
+    _support_count_steps,
+)
+
+
+def _support_count(context, source, destination, excluded_player_name=None):
+    return _run_steps(context, _support_count_steps(context, source, destination, excluded_player_name))
+
+
+def _prevent_strength(context, command):
+    return _run_steps(context, _prevent_strength_steps(context, command))
+
+
+def _has_path(context, command):
+    return _run_steps(context, _has_path_steps(context, command))
+
+
+def _rotation_helper():
+    return TurnHelper([
+        PlayerHelper('Germany', [
+            CommandHelper(CommandType.MOVE, UnitTypes.TROOP, 'Galicia', 'Bohemia'),
+        ]),
+        PlayerHelper('Austria', [
+            CommandHelper(CommandType.MOVE, UnitTypes.TROOP, 'Bohemia', 'Vienna'),
+        ]),
+        PlayerHelper('Turkey', [
+            CommandHelper(CommandType.MOVE, UnitTypes.TROOP, 'Vienna', 'Galicia'),
+        ]),
+    ])
+
+
+def test_context_starts_unresolved():
+    helper = _rotation_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+
+    assert context.state_map['Galicia'] == ResolutionState.UNRESOLVED
+    assert context.dependency_list == []
+
+
+def test_contexts_do_not_share_state():
+    first_helper = _rotation_helper()
+    second_helper = dislodge_helper()
+    first_context = ResolutionContext(first_helper.game_map, CommandMap(first_helper.game_map, first_helper.commands))
+    second_context = ResolutionContext(second_helper.game_map, CommandMap(second_helper.game_map, second_helper.commands))
+
+    assert _resolve(first_context, first_helper.commands[0])
+    assert second_context.state_map['Galicia'] == ResolutionState.UNRESOLVED
+    assert not _resolve(second_context, second_helper.commands[2])
+    assert first_context.state_map['Tyrolia'] == ResolutionState.UNRESOLVED
+
+
+def test_concurrent_resolution_matches_serial():
+    helper_factories = [_rotation_helper, convoy_paradox_helper, dislodge_helper] * 20
+    expected = [factory().resolve() for factory in helper_factories]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda factory: factory().resolve(), helper_factories))
+
+    assert results == expected
+
+
+def test_support_counts_are_kept_once_resolved():
+    helper = dislodge_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+
+    assert _support_count(context, 'Munich', 'Tyrolia') == 1
+    assert context.support_counts[('Munich', 'Tyrolia')] == (1, {'Germany': 1})
+    assert _support_count(context, 'Munich', 'Tyrolia', 'Germany') == 0
+    assert _support_count(context, 'Tyrolia', 'Tyrolia') == 0
+
+
+def test_support_counts_are_discarded_when_support_is_reset():
+    helper = dislodge_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+    _support_count(context, 'Munich', 'Tyrolia')
+
+    context.mark_unresolved('Munich')
+    assert ('Munich', 'Tyrolia') in context.support_counts
+    context.mark_unresolved('Bohemia')
+    assert ('Munich', 'Tyrolia') not in context.support_counts
+
+
+def test_prevent_strength_counts_successful_supports():
+    helper = dislodge_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+    for command in helper.commands:
+        _resolve(context, command)
+
+    assert _prevent_strength(context, helper.commands[0]) == 2
+
+
+def test_paths_read_from_guesses_record_the_dependency():
+    helper = convoy_paradox_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+    context.resolution_map['English Channel'] = True
+    context.state_map['English Channel'] = ResolutionState.GUESSING
+
+    assert _has_path(context, helper.commands[2])
+    assert context.dependency_list == ['English Channel']
+
+
+def test_head_to_head_combatants_are_kept():
+    helper = _rotation_helper()
+    context = ResolutionContext(helper.game_map, CommandMap(helper.game_map, helper.commands))
+
+    assert _get_head_to_head_combatant(context, helper.commands[0]) is None
+    assert context.head_to_head_combatants == { 'Galicia': None }
@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from pydip.map.predefined import vanilla_dip
+from pydip.map.territory import LandTerritory
+from pydip.player.command.retreat_command import RetreatDisbandCommand, RetreatMoveCommand
+from pydip.player.player import Player
+from pydip.player.unit import Unit, UnitTypes
+from pydip.turn.retreat import RetreatResolver, resolve_retreats
+
+
+def _retreat_setup():
+    game_map = vanilla_dip.generate_map()
+    retreat_map = {
+        'England': {
+            Unit(UnitTypes.TROOP, 'Holland'): { 'Belgium', 'Ruhr' },
+            Unit(UnitTypes.FLEET, 'North Sea'): None,
+        },
+        'Germany': {
+            Unit(UnitTypes.TROOP, 'Munich'): { 'Ruhr', 'Bohemia' },
+            Unit(UnitTypes.TROOP, 'Berlin'): { 'Prussia' },
+            Unit(UnitTypes.TROOP, 'Kiel'): None,
+        },
+    }
+    players = {
+        player_name: Player(player_name, game_map, [
+            { 'territory_name': unit.position, 'unit_type': unit.unit_type } for unit in units
+        ])
+        for player_name, units in retreat_map.items()
+    }
+    return retreat_map, players
+
+
+def test_streamed_commands_match_resolve_retreats():
+    retreat_map, players = _retreat_setup()
+    commands = [
+        RetreatMoveCommand(retreat_map, players['England'], Unit(UnitTypes.TROOP, 'Holland'), 'Ruhr'),
+        RetreatMoveCommand(retreat_map, players['Germany'], Unit(UnitTypes.TROOP, 'Munich'), 'Ruhr'),
+        RetreatDisbandCommand(retreat_map, players['Germany'], Unit(UnitTypes.TROOP, 'Berlin')),
+    ]
+
+    resolver = RetreatResolver(retreat_map)
+    for command in commands:
+        resolver.add_command(command)
+
+    expected = {
+        'England': { Unit(UnitTypes.FLEET, 'North Sea') },
+        'Germany': { Unit(UnitTypes.TROOP, 'Kiel') },
+    }
+    assert resolver.resolve() == expected
+    assert resolve_retreats(retreat_map, commands) == expected
+
+
+def test_retreats_to_different_destinations_succeed():
+    retreat_map, players = _retreat_setup()
+    resolver = RetreatResolver(retreat_map)
+    resolver.add_command(RetreatMoveCommand(retreat_map, players['England'], Unit(UnitTypes.TROOP, 'Holland'), 'Belgium'))
+    resolver.add_command(RetreatMoveCommand(retreat_map, players['Germany'], Unit(UnitTypes.TROOP, 'Munich'), 'Ruhr'))
+    resolver.add_command(RetreatMoveCommand(retreat_map, players['Germany'], Unit(UnitTypes.TROOP, 'Berlin'), 'Prussia'))
+    resolver.add_command(RetreatMoveCommand(retreat_map, players['Germany'], Unit(UnitTypes.TROOP, 'Berlin'), 'Prussia'))
+
+    assert resolver.resolve() == {
+        'England': { Unit(UnitTypes.FLEET, 'North Sea'), Unit(UnitTypes.TROOP, 'Belgium') },
+        'Germany': { Unit(UnitTypes.TROOP, 'Kiel'), Unit(UnitTypes.TROOP, 'Ruhr'), Unit(UnitTypes.TROOP, 'Prussia') },
+    }
+
+
+def test_resolve_requires_every_retreat():
+    retreat_map, players = _retreat_setup()
+    resolver = RetreatResolver(retreat_map)
+    resolver.add_command(RetreatMoveCommand(retreat_map, players['England'], Unit(UnitTypes.TROOP, 'Holland'), 'Belgium'))
+    with pytest.raises(AssertionError):
+        resolver.resolve()
+
+
+def test_add_command_rejects_unit_not_retreating():
+    retreat_map, players = _retreat_setup()
+    other_map = dict(retreat_map, Germany={ Unit(UnitTypes.TROOP, 'Kiel'): { 'Ruhr' } })
+    resolver = RetreatResolver(retreat_map)
+    with pytest.raises(AssertionError):
+        resolver.add_command(RetreatDisbandCommand(other_map, players['Germany'], Unit(UnitTypes.TROOP, 'Kiel')))
+
+
+def _reference_resolve_retreats(retreat_map, commands):
+    """ Resolves retreats by comparing every retreating move against every other """
+    result_map = {
+        player: { unit for unit, retreats in units.items() if retreats is None }
+        for player, units in retreat_map.items()
+    }
+    moves = [command for command in commands if isinstance(command, RetreatMoveCommand)]
+    for command in moves:
+        if all(command.destination != other.destination for other in moves if other != command):
+            result_map[command.player.name].add(Unit(command.unit.unit_type, command.destination))
+    return result_map
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_many_retreats_match_reference(seed):
+    rng = random.Random(seed)
+    game_map = vanilla_dip.generate_map()
+    territories = sorted(
+        name for name, territory in game_map.name_map.items()
+        if isinstance(territory, LandTerritory) and len(game_map.adjacency[name]) >= 2
+    )
+    player_names = ['Austria', 'France', 'Italy']
+    retreat_map = { name: dict() for name in player_names }
+    for territory in territories:
+        retreats = None if rng.random() < 0.3 else set(rng.sample(sorted(game_map.adjacency[territory]), 2))
+        retreat_map[rng.choice(player_names)][Unit(UnitTypes.TROOP, territory)] = retreats
+    players = {
+        name: Player(name, game_map, [
+            { 'territory_name': unit.position, 'unit_type': unit.unit_type } for unit in units
+        ])
+        for name, units in retreat_map.items()
+    }
+
+    commands = []
+    for name, units in retreat_map.items():
+        for unit, retreats in units.items():
+            if retreats is None:
+                continue
+            if rng.random() < 0.2:
+                commands.append(RetreatDisbandCommand(retreat_map, players[name], unit))
+            else:
+                commands.append(RetreatMoveCommand(retreat_map, players[name], unit, rng.choice(sorted(retreats))))
+    rng.shuffle(commands)
+
+    assert resolve_retreats(retreat_map, commands) == _reference_resolve_retreats(retreat_map, commands)
@@ -1,3 +1,5 @@
 from pydip.turn.resolve import resolve_turn
 from pydip.turn.retreat import resolve_retreats
 from pydip.turn.adjustment import resolve_adjustment
+from pydip.turn.batch import resolve_turns_batch
+from pydip.turn.game_state import GameState, Phase, Season
@@ -1,7 +1,8 @@
-from copy import deepcopy
-
+from pydip.map.compiled_ownership import supply_center_occupants
 from pydip.map.map import OwnershipMap
 from pydip.player.command.adjustment_command import AdjustmentCommand, AdjustmentCreateCommand, AdjustmentDisbandCommand
+from pydip.player.unit import UnitTypes
+from pydip.turn.player_units import PlayerUnits
 
 
 def calculate_adjustments(ownership_map, player_units):
@@ -24,26 +25,19 @@ def calculate_adjustments(ownership_map, player_units):
     player must disband units this turn.
     """
     all_players = ownership_map.owned_territories.keys()
-    new_owned_territories = { player : set() for player in all_players }
-
-    for player in all_players:
-        other_player_positions = set()
-        for other_player in all_players:
-            if other_player != player:
-                other_player_positions |= {
-                    ownership_map.supply_map.game_map.relevant_name_for_territory(unit.position)
-                    for unit in player_units[other_player]
-                }
-
-        for territory in ownership_map.owned_territories[player]:
-            if territory not in other_player_positions:
-                if territory in ownership_map.supply_map.supply_centers:
-                    new_owned_territories[player].add(territory)
-
-        for unit in player_units[player]:
-            relevant_territory = ownership_map.supply_map.game_map.relevant_name_for_territory(unit.position)
-            if relevant_territory in ownership_map.supply_map.supply_centers:
-                new_owned_territories[player].add(relevant_territory)
+    supply_centers = ownership_map.supply_map.supply_centers
+    occupants = supply_center_occupants(ownership_map.supply_map, all_players, player_units)
+
+    # a player keeps each supply center no other player occupies, and gains each one it occupies
+    new_owned_territories = {
+        player : {
+            territory for territory in ownership_map.owned_territories[player]
+            if territory in supply_centers and occupants.get(territory, player) == player
+        }
+        for player in all_players
+    }
+    for territory, player in occupants.items():
+        new_owned_territories[player].add(territory)
 
     new_ownership_map = OwnershipMap(
         ownership_map.supply_map,
@@ -77,27 +71,30 @@ def resolve_adjustment__validated(ownership_map, adjustment_counts, player_units
     improper order counts are provided.
 
 
-    Both versions return a mapping of player names to sets of Units, representing the units owned by
-    each player after adjustments have been resolved.
+    Both versions return a PlayerUnits, mapping player names to frozensets of Units, representing the
+    units owned by each player after adjustments have been resolved. player_units may be a PlayerUnits
+    (such as the output of resolve_retreats) or any mapping of player names to sets of Units; when it
+    is a PlayerUnits, the result shares the sets of every player without adjustments with it.
     """
     _validate_adjustments(ownership_map, adjustment_counts, commands)
     return resolve_adjustment(ownership_map, adjustment_counts, player_units, commands)
 
 
 def resolve_adjustment(ownership_map, adjustment_counts, player_units, commands):
-    new_player_units = deepcopy(player_units)
+    player_units = PlayerUnits(player_units)
+    changes = dict()
     for player, count in adjustment_counts.items():
         if count < 0:
-            disbands = _find_disbands(player, adjustment_counts, player_units, commands)
-            new_player_units[player] -= disbands
+            disbands = _find_disbands(ownership_map, player, adjustment_counts, player_units, commands)
+            changes[player] = player_units[player] - disbands
         elif count > 0:
             creates = _find_creates(ownership_map.supply_map.game_map, player, adjustment_counts, commands)
-            new_player_units[player] |= creates
+            changes[player] = player_units[player] | creates
 
-    return new_player_units
+    return player_units.with_units(changes)
 
 
-def _find_disbands(player, adjustment_counts, player_units, commands):
+def _find_disbands(ownership_map, player, adjustment_counts, player_units, commands):
     expected_disband_count = -adjustment_counts[player]
 
     filtered_commands = filter(lambda c: isinstance(c, AdjustmentDisbandCommand), commands)
@@ -109,17 +106,36 @@ def _find_disbands(player, adjustment_counts, player_units, commands):
         filtered_commands = filtered_commands[:expected_disband_count]
     disbands = { command.unit for command in filtered_commands }
 
-    # if too few disbands, begin disbanding units in alphabetical order
-    while len(disbands) < expected_disband_count:
+    # if too few disbands, disband the remaining units in civil disorder order
+    missing_disband_count = expected_disband_count - len(disbands)
+    if missing_disband_count > 0:
         remaining_units = sorted(
-            list(set(player_units[player]) - disbands),
-            key = lambda u: u.position.lower()
+            (unit for unit in player_units[player] if unit not in disbands),
+            key=_civil_disorder_order(ownership_map, player),
         )
-        disbands.add(remaining_units[0])
+        disbands.update(remaining_units[:missing_disband_count])
 
     return disbands
 
 
+def _civil_disorder_order(ownership_map, player):
+    """
+    Returns a sort key putting player's units in the order civil disorder disbands them: furthest
+    from the player's home supply centers first, then fleets before troops, then alphabetically.
+    Distance is to the nearest home supply center the player still owns (or to any of its home
+    supply centers, if it owns none of them), as given by the map's CompiledMap distance tables.
+    """
+    compiled_map = ownership_map.supply_map.game_map.get_compiled_map()
+    home_territories = ownership_map.home_territories.get(player, set())
+    target_territories = (home_territories & ownership_map.owned_territories.get(player, set())) or home_territories
+
+    def order(unit):
+        fleet = unit.unit_type == UnitTypes.FLEET
+        distance = compiled_map.distance_to_nearest(unit.position, target_territories, fleet)
+        return -distance, not fleet, unit.position.lower()
+    return order
+
+
 def _find_creates(game_map, player, adjustment_counts, commands):
     permitted_create_count = adjustment_counts[player]
 
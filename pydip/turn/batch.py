@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pydip.turn.encoding import decode_commands, decode_retreat_map, encode_commands, encode_retreat_map
+from pydip.turn.resolve import resolve_turn
+
+
+def resolve_turns_batch(game_map, jobs, workers=None):
+    """
+    Resolves many independent turns played on the same map across a pool of
+    worker processes. Each worker receives game_map once, when it starts, and
+    every job afterwards only ships the compact binary encoding of its commands
+    and its result (see pydip.turn.encoding).
+
+    game_map: Map shared by every job
+    jobs: iterable of (key, Command[]) pairs. key is any picklable value used
+          to identify the job in the results; Command[] is exactly what would
+          be passed to resolve_turn.
+    workers: number of worker processes (defaults to the number of CPUs)
+
+    Yields (key, retreat_map) pairs in the order jobs complete, where
+    retreat_map is the same value resolve_turn would return for that job.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(game_map,)) as executor:
+        futures = [
+            executor.submit(_resolve_encoded_job, key, encode_commands(game_map, commands))
+            for key, commands in jobs
+        ]
+        for future in as_completed(futures):
+            key, encoded_retreat_map = future.result()
+            yield key, decode_retreat_map(encoded_retreat_map, game_map)
+
+
+#----------------------
+# Worker process
+#----------------------
+_worker_game_map = None
+
+
+def _init_worker(game_map):
+    global _worker_game_map
+    _worker_game_map = game_map
+
+
+def _resolve_encoded_job(key, encoded_commands):
+    commands = decode_commands(encoded_commands, _worker_game_map)
+    return key, encode_retreat_map(_worker_game_map, resolve_turn(_worker_game_map, commands))
@@ -0,0 +1,108 @@
+"""
+Numbered kinds of command, shared by pydip.turn.encoding and pydip.turn.order_batch, and building
+commands of each kind from their parts without validating them again.
+"""
+from pydip.player.command.adjustment_command import AdjustmentCreateCommand, AdjustmentDisbandCommand
+from pydip.player.command.command import (
+    ConvoyMoveCommand,
+    ConvoyTransportCommand,
+    HoldCommand,
+    MoveCommand,
+    SupportCommand,
+)
+from pydip.player.command.retreat_command import RetreatDisbandCommand, RetreatMoveCommand
+from pydip.player.player import Player
+
+
+HOLD               = 0
+MOVE               = 1
+SUPPORT            = 2
+CONVOY_MOVE        = 3
+CONVOY_TRANSPORT   = 4
+RETREAT_MOVE       = 5
+RETREAT_DISBAND    = 6
+ADJUSTMENT_CREATE  = 7
+ADJUSTMENT_DISBAND = 8
+
+""" kinds of command with a supported or transported unit """
+AUX_UNIT_KINDS = frozenset({ SUPPORT, CONVOY_TRANSPORT })
+
+""" kinds of command with a destination other than the unit's own territory """
+DESTINATION_KINDS = frozenset({ MOVE, SUPPORT, CONVOY_MOVE, CONVOY_TRANSPORT, RETREAT_MOVE })
+
+""" int -> Command class, for each command kind """
+_COMMAND_CLASSES = {
+    HOLD:               HoldCommand,
+    MOVE:               MoveCommand,
+    SUPPORT:            SupportCommand,
+    CONVOY_MOVE:        ConvoyMoveCommand,
+    CONVOY_TRANSPORT:   ConvoyTransportCommand,
+    RETREAT_MOVE:       RetreatMoveCommand,
+    RETREAT_DISBAND:    RetreatDisbandCommand,
+    ADJUSTMENT_CREATE:  AdjustmentCreateCommand,
+    ADJUSTMENT_DISBAND: AdjustmentDisbandCommand,
+}
+
+
+def command_kind(command):
+    """ Returns the kind of command, a command of any of the kinds above """
+    # Subclasses are checked before the classes they extend
+    if isinstance(command, HoldCommand):
+        return HOLD
+    if isinstance(command, MoveCommand):
+        return MOVE
+    if isinstance(command, SupportCommand):
+        return SUPPORT
+    if isinstance(command, ConvoyMoveCommand):
+        return CONVOY_MOVE
+    if isinstance(command, ConvoyTransportCommand):
+        return CONVOY_TRANSPORT
+    if isinstance(command, RetreatMoveCommand):
+        return RETREAT_MOVE
+    if isinstance(command, RetreatDisbandCommand):
+        return RETREAT_DISBAND
+    if isinstance(command, AdjustmentCreateCommand):
+        return ADJUSTMENT_CREATE
+    if isinstance(command, AdjustmentDisbandCommand):
+        return ADJUSTMENT_DISBAND
+    raise ValueError("Command unexpected type")
+
+
+def build_command(player, kind, unit, other_unit, destination):
+    """
+    Returns a command of the given kind, without validating it. other_unit is the supported or
+    transported unit (or None), and destination is ignored for holds and may be None for disbands.
+    """
+    if kind not in _COMMAND_CLASSES:
+        raise ValueError("Invalid encoded command kind: {}".format(kind))
+    # Commands are immutable, so their attributes are set as their constructors set them
+    command = _COMMAND_CLASSES[kind].__new__(_COMMAND_CLASSES[kind])
+    object.__setattr__(command, 'player', player)
+    object.__setattr__(command, 'unit', unit)
+    if kind == SUPPORT:
+        object.__setattr__(command, 'supported_unit', other_unit)
+    elif kind == CONVOY_TRANSPORT:
+        object.__setattr__(command, 'transported_unit', other_unit)
+    if kind == HOLD:
+        object.__setattr__(command, 'destination', unit.position)
+    elif destination is not None:
+        object.__setattr__(command, 'destination', destination)
+    return command
+
+
+def players_for_commands(game_map, entries):
+    """
+    Returns a mapping of player names to a new Player for each name in entries, which are (kind,
+    player name, unit, other unit, destination) tuples as build_command takes. Each Player owns the
+    units of its commands, except for the units of AdjustmentCreateCommands, which do not exist yet.
+    """
+    player_units = { name: [] for _, name, _, _, _ in entries }
+    for kind, name, unit, _, _ in entries:
+        if kind != ADJUSTMENT_CREATE:
+            player_units[name].append(unit)
+
+    players = dict()
+    for name, units in player_units.items():
+        player = players[name] = Player(name, game_map)
+        player.units = units
+    return players
@@ -5,22 +5,26 @@ from pydip.player.command.command import MoveCommand, ConvoyMoveCommand, ConvoyT
 
 class CommandMap:
 
-    """ territory -> MoveCommand[], representing commands with destination at key territory """
+    """ province id -> MoveCommand[], representing commands with destination at key province """
     _attacker_map        = None
-    """ territory -> ConvoyMoveCommand[], representing commands with destination at key territory """
+    """ province id -> ConvoyMoveCommand[], representing commands with destination at key province """
     _convoy_attacker_map = None
-    """ (source, dest) -> ConvoyTransportCommand[], representing transport commands from source to dest territories """
+    """ (source, dest) province ids -> ConvoyTransportCommand[], representing transport commands from source to dest provinces """
     _transport_map       = None
-    """ (source, dest) -> SupportCommand[], representing supports of units attacking from source to dest territories """
+    """ (source, dest) province ids -> SupportCommand[], representing supports of units attacking from source to dest provinces """
     _support_map         = None
-    """ territory -> Command, representing command for unit originating at key territory """
+    """ province id -> Command, representing command for unit originating at key province """
     _home_map            = None
 
     _game_map = None
 
+    """ String -> int, territory name to the id of its province (from the map's CompiledMap) """
+    _province_ids = None
+
     """ Builds CommandMap from provided Command[] """
     def __init__(self, game_map, commands):
         self._game_map = game_map
+        self._province_ids = game_map.get_compiled_map().province_ids_by_name
         self._attacker_map        = defaultdict(list)
         self._convoy_attacker_map = defaultdict(list)
         self._transport_map       = defaultdict(list)
@@ -28,41 +32,85 @@ class CommandMap:
         self._home_map            = dict()
 
         for command in commands:
-            home_name = self._game_map.relevant_name_for_territory(command.unit.position)
-            self._home_map[home_name] = command
-            if isinstance(command, MoveCommand):
-                destination_name = self._game_map.relevant_name_for_territory(command.destination)
-                self._attacker_map[destination_name].append(command)
-            elif isinstance(command, ConvoyMoveCommand):
-                destination_name = self._game_map.relevant_name_for_territory(command.destination)
-                self._convoy_attacker_map[destination_name].append(command)
-            elif isinstance(command, ConvoyTransportCommand):
-                source = self._game_map.relevant_name_for_territory(command.transported_unit.position)
-                dest   = self._game_map.relevant_name_for_territory(command.destination)
-                self._transport_map[(source, dest)].append(command)
-            elif isinstance(command, SupportCommand):
-                source = self._game_map.relevant_name_for_territory(command.supported_unit.position)
-                dest   = self._game_map.relevant_name_for_territory(command.destination)
-                self._support_map[(source, dest)].append(command)
+            self._home_map[self._province_ids[command.unit.position]] = command
+            self._index_command(command)
+
+    def add_command(self, command):
+        """
+        Adds command to the map, updating every index in place. There must not already be a command
+        for a unit in the same province. Returns the set of province ids whose entries changed.
+        """
+        home_id = self._province_ids[command.unit.position]
+        assert home_id not in self._home_map
+        self._home_map[home_id] = command
+        index, key = self._index_entry(command)
+        if index is not None:
+            index[key].append(command)
+        return self._touched_provinces(home_id, key)
+
+    def remove_command(self, command):
+        """
+        Removes command (the very command added, not merely an equal one) from the map, updating
+        every index in place. Returns the set of province ids whose entries changed.
+        """
+        home_id = self._province_ids[command.unit.position]
+        assert self._home_map.get(home_id) is command
+        del self._home_map[home_id]
+
+        index, key = self._index_entry(command)
+        if index is not None:
+            commands = index[key]
+            del commands[next(position for position, indexed in enumerate(commands) if indexed is command)]
+            if len(commands) == 0:
+                del index[key]
+        return self._touched_provinces(home_id, key)
+
+    def replace_command(self, old_command, new_command):
+        """ Replaces old_command with new_command, as remove_command then add_command, returning every province touched """
+        return self.remove_command(old_command) | self.add_command(new_command)
+
+    def _index_command(self, command):
+        index, key = self._index_entry(command)
+        if index is not None:
+            index[key].append(command)
+
+    def _index_entry(self, command):
+        """ Returns (index, key) for the list command belongs in, other than _home_map, or (None, None) """
+        if isinstance(command, MoveCommand):
+            return self._attacker_map, self._province_ids[command.destination]
+        elif isinstance(command, ConvoyMoveCommand):
+            return self._convoy_attacker_map, self._province_ids[command.destination]
+        elif isinstance(command, ConvoyTransportCommand):
+            source = self._province_ids[command.transported_unit.position]
+            dest   = self._province_ids[command.destination]
+            return self._transport_map, (source, dest)
+        elif isinstance(command, SupportCommand):
+            source = self._province_ids[command.supported_unit.position]
+            dest   = self._province_ids[command.destination]
+            return self._support_map, (source, dest)
+        return None, None
+
+    @staticmethod
+    def _touched_provinces(home_id, key):
+        """ Returns the province ids keying a command's entries: its home, and those of its _index_entry key """
+        touched = { home_id }
+        if isinstance(key, tuple):
+            touched.update(key)
+        elif key is not None:
+            touched.add(key)
+        return touched
 
     def get_attackers(self, territory_name):
-        territory_name = self._game_map.relevant_name_for_territory(territory_name)
-        return self._attacker_map[territory_name]
+        return self._attacker_map[self._province_ids[territory_name]]
 
     def get_convoy_attackers(self, territory_name):
-        territory_name = self._game_map.relevant_name_for_territory(territory_name)
-        return self._convoy_attacker_map[territory_name]
+        return self._convoy_attacker_map[self._province_ids[territory_name]]
 
     def get_convoy_transports(self, source_name, destination_name):
-        source_name = self._game_map.relevant_name_for_territory(source_name)
-        destination_name = self._game_map.relevant_name_for_territory(destination_name)
-        return self._transport_map[(source_name, destination_name)]
+        return self._transport_map[(self._province_ids[source_name], self._province_ids[destination_name])]
 
     def get_supports(self, source_name, destination_name):
-        source_name = self._game_map.relevant_name_for_territory(source_name)
-        destination_name = self._game_map.relevant_name_for_territory(destination_name)
-        return self._support_map[(source_name, destination_name)]
+        return self._support_map[(self._province_ids[source_name], self._province_ids[destination_name])]
 
     def get_home_command(self, territory_name):
-        territory_name = self._game_map.relevant_name_for_territory(territory_name)
-        return self._home_map.get(territory_name, None)
+        return self._home_map.get(self._province_ids[territory_name], None)
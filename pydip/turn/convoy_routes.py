@@ -0,0 +1,69 @@
+class ConvoyRoutes:
+    """
+    Tracks which transports ordered for a single convoyed move are known to succeed, as a
+    union-find over their territories. The source and destination provinces are nodes too, joined
+    to each surviving transport adjacent to them, so a route of surviving transports exists exactly
+    when the source and destination share a set. Transports can be added as they resolve, but not
+    taken away: if a transport's resolution is reset, the whole ConvoyRoutes must be discarded.
+    """
+
+    """ String -- name of the convoyed unit's province """
+    source = None
+
+    """ String -- name of the destination province """
+    destination = None
+
+    """ String{} -- territories of every transport ordered for this move """
+    transports = None
+
+    """
+    bool -- set once a search has found every transport reachable from the source resolved, and
+    no route among them, so that there is no route to be found
+    """
+    blocked = None
+
+    """ CompiledMap """
+    _compiled_map = None
+
+    """ String -> String, union-find parent of the source, destination and each surviving transport """
+    _parents = None
+
+    def __init__(self, compiled_map, source, destination, transports):
+        self.source = source
+        self.destination = destination
+        self.transports = transports
+        self.blocked = False
+        self._compiled_map = compiled_map
+        self._parents = { source: source, destination: destination }
+
+    def connected(self):
+        """ Determines whether surviving transports form a route from the source to the destination """
+        return self._find(self.source) == self._find(self.destination)
+
+    def add_surviving_transport(self, transport):
+        assert transport in self.transports
+        if transport in self._parents:
+            return
+        self._parents[transport] = transport
+
+        for neighbour in self._compiled_map.sea_neighbours[transport]:
+            if neighbour in self._parents:
+                self._union(transport, neighbour)
+        if transport in self._compiled_map.coastal_seas[self.source]:
+            self._union(transport, self.source)
+        if transport in self._compiled_map.coastal_seas[self.destination]:
+            self._union(transport, self.destination)
+
+    def _find(self, node):
+        root = node
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[node] != root:
+            self._parents[node], node = root, self._parents[node]
+        return root
+
+    def _union(self, node_1, node_2):
+        root_1 = self._find(node_1)
+        root_2 = self._find(node_2)
+        if root_1 != root_2:
+            self._parents[root_1] = root_2
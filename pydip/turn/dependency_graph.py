@@ -0,0 +1,113 @@
+from pydip.player.command.command import MoveCommand, ConvoyMoveCommand, ConvoyTransportCommand, SupportCommand
+
+
+def build_dependency_graph(command_map, commands):
+    """
+    Builds the static dependency graph for a turn: a map of each command's territory (the unit's
+    position, as used to key resolutions) to the territories of every command whose resolution
+    may be consulted while adjudicating it. This is a superset of the dependencies actually
+    followed during resolution, as it does not know which branches adjudication will take.
+    """
+    return {
+        command.unit.position: [dependency.unit.position for dependency in _dependencies(command_map, command)]
+        for command in commands
+    }
+
+
+def strongly_connected_components(graph):
+    """
+    Returns the strongly connected components of graph (node -> node[]) as lists of nodes. The
+    components are ordered so that each one only has edges to itself and to components before it.
+    Implemented as an iterative Tarjan's algorithm, so large graphs do not hit the recursion limit.
+    """
+    index_map = dict()
+    low_link  = dict()
+    on_stack  = set()
+    stack     = []
+    components = []
+
+    for root in graph:
+        if root in index_map:
+            continue
+        work = [(root, iter(graph[root]))]
+        index_map[root] = low_link[root] = len(index_map)
+        stack.append(root)
+        on_stack.add(root)
+
+        while len(work) > 0:
+            node, neighbours = work[-1]
+            advanced = False
+            for neighbour in neighbours:
+                if neighbour not in index_map:
+                    index_map[neighbour] = low_link[neighbour] = len(index_map)
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(graph.get(neighbour, ()))))
+                    advanced = True
+                    break
+                if neighbour in on_stack:
+                    low_link[node] = min(low_link[node], index_map[neighbour])
+            if advanced:
+                continue
+
+            work.pop()
+            if len(work) > 0:
+                parent = work[-1][0]
+                low_link[parent] = min(low_link[parent], low_link[node])
+            if low_link[node] == index_map[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.remove(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def _dependencies(command_map, command):
+    if isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand):
+        return _move_dependencies(command_map, command)
+    elif isinstance(command, SupportCommand):
+        return _support_dependencies(command_map, command)
+    elif isinstance(command, ConvoyTransportCommand):
+        return command_map.get_attackers(command.unit.position)
+    else:
+        raise ValueError("Command unexpected type")
+
+
+def _move_dependencies(command_map, command):
+    source      = command.unit.position
+    destination = command.destination
+
+    dependencies = list(command_map.get_supports(source, destination))
+    if isinstance(command, ConvoyMoveCommand):
+        dependencies.extend(command_map.get_convoy_transports(source, destination))
+
+    # the command being attacked, which determines hold or defend strength
+    defender = command_map.get_home_command(destination)
+    if defender is not None:
+        dependencies.append(defender)
+        dependencies.extend(command_map.get_supports(destination, destination))
+        if isinstance(defender, MoveCommand) or isinstance(defender, ConvoyMoveCommand):
+            dependencies.extend(command_map.get_supports(defender.unit.position, defender.destination))
+
+    # other commands moving into the destination, which determine prevent strength
+    for combatant in command_map.get_attackers(destination) + command_map.get_convoy_attackers(destination):
+        if combatant is command:
+            continue
+        dependencies.extend(command_map.get_supports(combatant.unit.position, destination))
+        if isinstance(combatant, ConvoyMoveCommand):
+            dependencies.extend(command_map.get_convoy_transports(combatant.unit.position, destination))
+
+    return dependencies
+
+
+def _support_dependencies(command_map, command):
+    position = command.unit.position
+    dependencies = list(command_map.get_attackers(position))
+    for convoy_attacker in command_map.get_convoy_attackers(position):
+        dependencies.extend(command_map.get_convoy_transports(convoy_attacker.unit.position, position))
+    return dependencies
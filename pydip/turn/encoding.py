@@ -0,0 +1,283 @@
+"""
+Compact binary encoding of game state: player units, commands, retreat maps and OwnershipMaps.
+
+Territories are written as their ids in the map's CompiledMap, so encoded records only make sense
+alongside the map they were encoded with (decoding checks that the map has as many territories).
+Players are written once per record, in a table of names, and referred to by their index into it.
+
+Every record begins with a header:
+    u8 format version, u8 record kind, u16 territory count, u32 length of the record after the header
+so records can be concatenated into one larger buffer and split again with iter_records. Decoders
+accept any object supporting the buffer protocol (bytes, bytearray, memoryview, mmap) and read
+values directly out of it, without copying the record first.
+
+Units are packed into a u16, as (territory id << 1) | unit type value. All integers are
+little-endian. The record bodies are:
+  * units:          per player, u16 unit count followed by that many units
+  * commands:       u16 command count; per command, u8 command kind (as numbered in
+                    pydip.turn.command_kinds), u8 player index, u16 unit, followed by u16 supported or
+                    transported unit, if any, and u16 destination, if any
+  * retreat map:    per player, u16 unit count; per unit, u16 unit and u8 retreat count (or
+                    _NO_RETREAT) followed by that many u16 territory ids
+  * ownership map:  owned territories, then home territories, each as u8 entry count; per entry,
+                    u8 player index, u16 territory count and that many u16 territory ids
+"""
+import struct
+
+from pydip.map.map import OwnershipMap
+from pydip.player.unit import Unit, UnitTypes
+from pydip.turn.command_kinds import (
+    AUX_UNIT_KINDS,
+    CONVOY_TRANSPORT,
+    DESTINATION_KINDS,
+    SUPPORT,
+    build_command,
+    command_kind,
+    players_for_commands,
+)
+
+
+""" int, bumped whenever the encoding changes; records of any other version are rejected """
+FORMAT_VERSION = 1
+
+_UNITS         = 0
+_COMMANDS      = 1
+_RETREAT_MAP   = 2
+_OWNERSHIP_MAP = 3
+
+""" u8 retreat count marking a unit which does not need to retreat """
+_NO_RETREAT = 0xFF
+
+_HEADER  = struct.Struct('<BBHI')
+_U8      = struct.Struct('<B')
+_U16     = struct.Struct('<H')
+_COMMAND = struct.Struct('<BBH')
+
+""" int -> UnitTypes, by value """
+_UNIT_TYPES = { unit_type.value: unit_type for unit_type in UnitTypes }
+
+
+def encode_units(game_map, player_units):
+    """ Encodes player_units, a mapping of player names to iterables of Units (as returned by resolve_retreats) """
+    encoder = _Encoder(game_map, player_units.keys())
+    for units in player_units.values():
+        units = list(units)
+        encoder.write(_U16, len(units))
+        for unit in units:
+            encoder.write_unit(unit)
+    return encoder.finish(_UNITS)
+
+
+def decode_units(data, game_map):
+    """ Decodes a record from encode_units, returning a mapping of player names to sets of Units """
+    decoder = _Decoder(data, game_map, _UNITS)
+    player_units = dict()
+    for name in decoder.player_names:
+        player_units[name] = { decoder.read_unit() for _ in range(decoder.read(_U16)) }
+    return player_units
+
+
+def encode_commands(game_map, commands):
+    """
+    Encodes a list of commands of any kind: Commands for a turn, RetreatCommands or AdjustmentCommands.
+    Only the name of each command's player is kept, not the Player itself.
+    """
+    commands = list(commands)
+    encoder = _Encoder(game_map, { command.player.name: None for command in commands })
+    encoder.write(_U16, len(commands))
+    for command in commands:
+        kind = command_kind(command)
+        encoder.write_command(kind, encoder.player_indices[command.player.name], command.unit)
+        if kind == SUPPORT:
+            encoder.write_unit(command.supported_unit)
+        elif kind == CONVOY_TRANSPORT:
+            encoder.write_unit(command.transported_unit)
+        if kind in DESTINATION_KINDS:
+            encoder.write_territory(command.destination)
+    return encoder.finish(_COMMANDS)
+
+
+def decode_commands(data, game_map, players=None):
+    """
+    Decodes a record from encode_commands, returning the list of commands it holds.
+
+    players is a mapping of player names to the Players the commands should be issued by. If it is
+    not provided, a Player is created for each name, owning the units its commands were issued to.
+
+    Commands were validated when they were first created, so they are not validated again here:
+    this also means retreat and adjustment commands can be decoded without the retreat map or
+    OwnershipMap they were checked against.
+    """
+    decoder = _Decoder(data, game_map, _COMMANDS)
+    entries = []
+    for _ in range(decoder.read(_U16)):
+        kind, player_index, unit = decoder.read_command()
+        other_unit = decoder.read_unit() if kind in AUX_UNIT_KINDS else None
+        destination = decoder.read_territory() if kind in DESTINATION_KINDS else None
+        entries.append((kind, decoder.player_names[player_index], unit, other_unit, destination))
+
+    if players is None:
+        players = players_for_commands(game_map, entries)
+    return [build_command(players[name], kind, unit, other_unit, destination) for kind, name, unit, other_unit, destination in entries]
+
+
+def encode_retreat_map(game_map, retreat_map):
+    """ Encodes retreat_map, in the form returned by resolve_turn """
+    encoder = _Encoder(game_map, retreat_map.keys())
+    for retreats in retreat_map.values():
+        encoder.write(_U16, len(retreats))
+        for unit, territories in retreats.items():
+            encoder.write_unit(unit)
+            if territories is None:
+                encoder.write(_U8, _NO_RETREAT)
+                continue
+            assert len(territories) < _NO_RETREAT
+            encoder.write(_U8, len(territories))
+            for territory in sorted(territories, key=encoder.territory_ids.__getitem__):
+                encoder.write_territory(territory)
+    return encoder.finish(_RETREAT_MAP)
+
+
+def decode_retreat_map(data, game_map):
+    """ Decodes a record from encode_retreat_map """
+    decoder = _Decoder(data, game_map, _RETREAT_MAP)
+    retreat_map = dict()
+    for name in decoder.player_names:
+        retreats = retreat_map[name] = dict()
+        for _ in range(decoder.read(_U16)):
+            unit = decoder.read_unit()
+            count = decoder.read(_U8)
+            retreats[unit] = None if count == _NO_RETREAT else { decoder.read_territory() for _ in range(count) }
+    return retreat_map
+
+
+def encode_ownership_map(ownership_map):
+    """ Encodes the owned and home territories of ownership_map. Its SupplyCenterMap is not encoded. """
+    owned_territories = ownership_map.owned_territories
+    home_territories = ownership_map.home_territories
+    game_map = ownership_map.supply_map.game_map
+    encoder = _Encoder(game_map, list(owned_territories.keys()) + list(home_territories.keys()))
+    for territories_by_player in (owned_territories, home_territories):
+        encoder.write(_U8, len(territories_by_player))
+        for name, territories in territories_by_player.items():
+            encoder.write(_U8, encoder.player_indices[name])
+            encoder.write(_U16, len(territories))
+            for territory in sorted(territories, key=encoder.territory_ids.__getitem__):
+                encoder.write_territory(territory)
+    return encoder.finish(_OWNERSHIP_MAP)
+
+
+def decode_ownership_map(data, supply_map):
+    """ Decodes a record from encode_ownership_map, as an OwnershipMap over supply_map """
+    decoder = _Decoder(data, supply_map.game_map, _OWNERSHIP_MAP)
+    owned_territories, home_territories = [
+        {
+            decoder.player_names[decoder.read(_U8)]: { decoder.read_territory() for _ in range(decoder.read(_U16)) }
+            for _ in range(decoder.read(_U8))
+        }
+        for _ in range(2)
+    ]
+    return OwnershipMap(supply_map, owned_territories, home_territories)
+
+
+def iter_records(data):
+    """
+    Yields a memoryview of each record in data, a buffer holding any number of encoded records
+    one after another. Each view shares data's memory, and can be passed straight to a decoder.
+    """
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        _, _, _, length = _HEADER.unpack_from(view, offset)
+        end = offset + _HEADER.size + length
+        if end > len(view):
+            raise ValueError("Encoded record is truncated")
+        yield view[offset:end]
+        offset = end
+
+
+class _Encoder:
+    """ Accumulates the body of a record, and the player table written before it """
+
+    """ CompiledMap.territory_ids of the map being encoded against """
+    territory_ids = None
+
+    """ String -> int, index of each player name in the player table """
+    player_indices = None
+
+    def __init__(self, game_map, player_names):
+        compiled_map = game_map.get_compiled_map()
+        assert len(compiled_map.names) < 1 << 15
+        self.territory_ids = compiled_map.territory_ids
+        self.player_indices = dict()
+        for name in player_names:
+            self.player_indices.setdefault(name, len(self.player_indices))
+        assert len(self.player_indices) <= 0xFF
+
+        self._territory_count = len(compiled_map.names)
+        self._parts = [_U8.pack(len(self.player_indices))]
+        for name in self.player_indices:
+            encoded_name = name.encode('utf-8')
+            assert len(encoded_name) <= 0xFF
+            self._parts.append(_U8.pack(len(encoded_name)) + encoded_name)
+
+    def write(self, value_struct, *values):
+        self._parts.append(value_struct.pack(*values))
+
+    def write_territory(self, territory_name):
+        self._parts.append(_U16.pack(self.territory_ids[territory_name]))
+
+    def write_unit(self, unit):
+        self._parts.append(_U16.pack(self.territory_ids[unit.position] << 1 | unit.unit_type.value))
+
+    def write_command(self, kind, player_index, unit):
+        self._parts.append(_COMMAND.pack(kind, player_index, self.territory_ids[unit.position] << 1 | unit.unit_type.value))
+
+    def finish(self, kind):
+        body = b''.join(self._parts)
+        return _HEADER.pack(FORMAT_VERSION, kind, self._territory_count, len(body)) + body
+
+
+class _Decoder:
+    """ Reads values in order from a record, starting after its player table """
+
+    """ String[], the player table of the record """
+    player_names = None
+
+    def __init__(self, data, game_map, kind):
+        self._data = memoryview(data)
+        version, record_kind, territory_count, length = _HEADER.unpack_from(data, 0)
+        if version != FORMAT_VERSION:
+            raise ValueError("Unsupported encoding version: {}".format(version))
+        if record_kind != kind:
+            raise ValueError("Expected an encoded record of kind {}, not {}".format(kind, record_kind))
+        compiled_map = game_map.get_compiled_map()
+        if territory_count != len(compiled_map.names):
+            raise ValueError("Encoded record does not match the map it is being decoded with")
+        if _HEADER.size + length > len(self._data):
+            raise ValueError("Encoded record is truncated")
+        self._names = compiled_map.names
+        self._offset = _HEADER.size
+
+        self.player_names = []
+        for _ in range(self.read(_U8)):
+            length = self.read(_U8)
+            self.player_names.append(str(self._data[self._offset:self._offset + length], 'utf-8'))
+            self._offset += length
+
+    def read(self, value_struct):
+        value, = value_struct.unpack_from(self._data, self._offset)
+        self._offset += value_struct.size
+        return value
+
+    def read_territory(self):
+        return self._names[self.read(_U16)]
+
+    def read_unit(self):
+        packed = self.read(_U16)
+        return Unit(_UNIT_TYPES[packed & 1], self._names[packed >> 1])
+
+    def read_command(self):
+        kind, player_index, packed = _COMMAND.unpack_from(self._data, self._offset)
+        self._offset += _COMMAND.size
+        return kind, player_index, Unit(_UNIT_TYPES[packed & 1], self._names[packed >> 1])
@@ -0,0 +1,180 @@
+from enum import Enum
+
+from pydip.player.command.command import HoldCommand
+from pydip.player.command.retreat_command import RetreatDisbandCommand
+from pydip.player.player import Player
+from pydip.turn.adjustment import calculate_adjustments, resolve_adjustment
+from pydip.turn.player_units import PlayerUnits
+from pydip.turn.resolve import resolve_turn
+from pydip.turn.retreat import resolve_retreats
+
+
+class Season(Enum):
+    SPRING = 0
+    FALL = 1
+
+    def __str__(self):
+        return self.name
+
+
+class Phase(Enum):
+    MOVEMENT = 0
+    RETREAT = 1
+    ADJUSTMENT = 2
+
+    def __str__(self):
+        return self.name
+
+
+class GameState:
+    """
+    A game in progress: the units, supply center ownership and current season and phase, advanced
+    one phase at a time by resolve_movement, resolve_retreats and resolve_adjustments. Each phase's
+    output is fed straight into the next, so callers no longer pass results between resolve_turn,
+    resolve_retreats, calculate_adjustments and resolve_adjustment themselves.
+
+    The Player objects in players are created once and kept for the whole game: after each phase,
+    only the units which changed are removed from or added to them, so commands for the next phase
+    can be built from them directly, without constructing new Players. Retreat phases are skipped
+    when no unit is dislodged, and adjustment phases when no player must build or disband.
+    """
+
+    """ OwnershipMap, as of the last adjustment phase (or as given, before the first) """
+    ownership_map = None
+
+    """ String -> Player, every player in ownership_map, holding their current units """
+    players = None
+
+    """ PlayerUnits, the units of every player in players """
+    player_units = None
+
+    """ int """
+    year = None
+
+    """ Season """
+    season = None
+
+    """ Phase, which resolve method is expected next """
+    phase = None
+
+    """ String -> Unit -> optional set of String, the output of resolve_turn during a retreat phase (otherwise None) """
+    retreat_map = None
+
+    """ String -> int, the output of calculate_adjustments during an adjustment phase (otherwise None) """
+    adjustment_counts = None
+
+    def __init__(self, ownership_map, player_units, year=1901, season=Season.SPRING):
+        """
+        player_units is a mapping of player names to iterables of Units; every player must be in
+        ownership_map, and players without units may be left out. The game begins with the movement
+        phase of season in year.
+        """
+        assert player_units.keys() <= ownership_map.owned_territories.keys()
+        game_map = ownership_map.supply_map.game_map
+
+        self.ownership_map = ownership_map
+        self.player_units = PlayerUnits({
+            name: player_units.get(name, ()) for name in ownership_map.owned_territories
+        })
+        self.players = dict()
+        for name, units in self.player_units.items():
+            self.players[name] = Player(name, game_map)
+            self.players[name].units = units
+        self.year = year
+        self.season = season
+        self.phase = Phase.MOVEMENT
+
+    def __str__(self):
+        return '{} {} {}'.format(self.season, self.year, self.phase)
+
+    @property
+    def game_map(self):
+        return self.ownership_map.supply_map.game_map
+
+    def resolve_movement(self, commands, engine=None):
+        """
+        Resolves a movement phase, given commands built from players. Units without a command hold.
+        Moves to the retreat phase if any unit is dislodged, and otherwise ends the season.
+        """
+        assert self.phase == Phase.MOVEMENT
+        commands = list(commands)
+        commanded = { (command.player.name, command.unit) for command in commands }
+        for name, units in self.player_units.items():
+            for unit in units:
+                if (name, unit) not in commanded:
+                    commands.append(HoldCommand(self.players[name], unit))
+
+        retreat_map = resolve_turn(self.game_map, commands, engine)
+        self._update_units({ name: units.keys() for name, units in retreat_map.items() })
+        if any(retreats is not None for units in retreat_map.values() for retreats in units.values()):
+            self.retreat_map = retreat_map
+            self.phase = Phase.RETREAT
+        else:
+            self._end_season()
+
+    def resolve_retreats(self, commands):
+        """
+        Resolves a retreat phase, given retreat commands built from players and retreat_map.
+        Dislodged units without a command are disbanded. Ends the season.
+        """
+        assert self.phase == Phase.RETREAT
+        commands = list(commands)
+        commanded = { (command.player.name, command.unit) for command in commands }
+        for name, units in self.retreat_map.items():
+            for unit, retreats in units.items():
+                if retreats is not None and (name, unit) not in commanded:
+                    commands.append(RetreatDisbandCommand(self.retreat_map, self.players[name], unit))
+
+        self._update_units(resolve_retreats(self.retreat_map, commands))
+        self.retreat_map = None
+        self._end_season()
+
+    def resolve_adjustments(self, commands):
+        """
+        Resolves an adjustment phase, given adjustment commands built from players and ownership_map.
+        Missing or excess commands are handled as resolve_adjustment does. Begins the next year.
+        """
+        assert self.phase == Phase.ADJUSTMENT
+        self._update_units(resolve_adjustment(self.ownership_map, self.adjustment_counts, self.player_units, commands))
+        self.adjustment_counts = None
+        self._begin_year()
+
+    def _end_season(self):
+        if self.season == Season.SPRING:
+            self.season = Season.FALL
+            self.phase = Phase.MOVEMENT
+            return
+
+        self.ownership_map, adjustment_counts = calculate_adjustments(self.ownership_map, self.player_units)
+        if any(count != 0 for count in adjustment_counts.values()):
+            self.adjustment_counts = adjustment_counts
+            self.phase = Phase.ADJUSTMENT
+        else:
+            self._begin_year()
+
+    def _begin_year(self):
+        self.year += 1
+        self.season = Season.SPRING
+        self.phase = Phase.MOVEMENT
+
+    def _update_units(self, player_units):
+        """
+        Sets each player's units to those in player_units (a mapping of player names to iterables of
+        Units, where players left out have none), changing only the players whose units differ
+        """
+        changes = dict()
+        for name, current_units in self.player_units.items():
+            units = player_units.get(name, ())
+            if units is current_units:
+                continue
+            units = frozenset(units)
+            if units == current_units:
+                continue
+            changes[name] = units
+            player = self.players[name]
+            # every removal comes first, as a unit may move into a province another unit is leaving
+            for unit in current_units - units:
+                player.remove_unit(unit)
+            for unit in units - current_units:
+                player.add_unit(unit)
+        self.player_units = self.player_units.with_units(changes)
@@ -0,0 +1,185 @@
+from collections import defaultdict
+
+from pydip.player.command.command import ConvoyTransportCommand, SupportCommand
+from pydip.turn.command_map import CommandMap
+from pydip.turn.dependency_graph import build_dependency_graph
+from pydip.turn.resolve import (
+    ResolutionContext,
+    _blocked_retreat_mask,
+    _dislodging_attackers,
+    _resolve,
+    _resulting_unit,
+    _retreat_options,
+)
+
+
+class IncrementalAdjudicator:
+    """
+    Resolves a turn, then keeps its resolutions and dependency graph so that the turn can be
+    re-resolved cheaply after a single order changes, as when previewing orders while they are
+    entered. Only the changed order, the orders which read the index entries it moved between, and
+    everything transitively depending on those (the dependency cone) are resolved again; every
+    other order keeps its previous resolution. Likewise, the retreat map is only recomputed for
+    units in the cone, units they attack, and dislodged units.
+
+    The dependency graph is the static one from pydip.turn.dependency_graph, which is a superset of
+    the dependencies _resolve actually follows, so the cone never misses an order whose outcome
+    could change.
+    """
+
+    """ Map """
+    game_map = None
+
+    """ CommandMap, kept up to date with every change """
+    command_map = None
+
+    """ String -> Command, the current command for the unit at each territory """
+    commands = None
+
+    """ String -> bool, the current resolution of the command at each territory """
+    resolutions = None
+
+    """ String -> String[], the static dependency graph of the current commands """
+    dependency_graph = None
+
+    """ String -> set of String, territories whose commands depend on the command at each territory """
+    dependents = None
+
+    """ set of String, territories re-resolved by the most recent change (every territory, initially) """
+    last_cone = None
+
+    """
+    String -> (String, Unit, optional set of String), the entry in the retreat map for the command at
+    each territory, as its player's name, the unit's resulting position and its retreat options
+    """
+    _retreat_entries = None
+
+    """ int -> set of String, province id to the territories of commands keyed by that province """
+    _keyed_commands = None
+
+    """ String -> int, territory name to the id of its province """
+    _province_ids = None
+
+    def __init__(self, game_map, commands):
+        self.game_map = game_map
+        self._province_ids = game_map.get_compiled_map().province_ids_by_name
+        self.command_map = CommandMap(game_map, commands)
+        self.commands = { command.unit.position: command for command in commands }
+
+        self._keyed_commands = defaultdict(set)
+        for command in commands:
+            for province in self._key_provinces(command):
+                self._keyed_commands[province].add(command.unit.position)
+
+        self.dependency_graph = build_dependency_graph(self.command_map, commands)
+        self.dependents = defaultdict(set)
+        for territory, dependencies in self.dependency_graph.items():
+            for dependency in dependencies:
+                self.dependents[dependency].add(territory)
+
+        context = ResolutionContext(game_map, self.command_map)
+        self.resolutions = { command.unit.position: _resolve(context, command) for command in commands }
+        self.last_cone = set(self.commands)
+        self._retreat_entries = dict()
+        self._update_retreat_entries(context, self.commands)
+
+    def retreat_map(self):
+        """ Returns the retreat map for the current commands, as resolve_turn would """
+        player_results = defaultdict(dict)
+        for player_name, unit, retreats in self._retreat_entries.values():
+            player_results[player_name][unit] = None if retreats is None else set(retreats)
+        return player_results
+
+    def change_command(self, command):
+        """
+        Replaces the current command for command's unit with command, re-resolves the orders whose
+        outcome may have changed, and returns the updated retreat map.
+        """
+        territory = command.unit.position
+        old_command = self.commands[territory]
+        assert old_command.unit == command.unit
+
+        touched = self.command_map.replace_command(old_command, command)
+        self.commands[territory] = command
+        for province in self._key_provinces(old_command):
+            self._keyed_commands[province].discard(territory)
+        for province in self._key_provinces(command):
+            self._keyed_commands[province].add(territory)
+
+        # Orders keyed by a touched province may read different index entries now, so their
+        # dependencies are rebuilt, as well as being re-resolved
+        changed = { territory }
+        for province in touched:
+            changed |= self._keyed_commands[province]
+        self._update_dependencies(changed)
+
+        cone = self._dependency_cone(changed)
+        context = ResolutionContext.from_resolutions(
+            self.game_map,
+            self.command_map,
+            { other: resolution for other, resolution in self.resolutions.items() if other not in cone },
+        )
+        for cone_territory in cone:
+            self.resolutions[cone_territory] = _resolve(context, self.commands[cone_territory])
+        self.last_cone = cone
+
+        # A unit's entry can only change if its own resolution may have, if a move against it may
+        # have, or if it is dislodged, as retreat options depend on the whole board
+        stale = set(cone)
+        for destination in [old_command.destination] + [self.commands[other].destination for other in cone]:
+            attacked = self.command_map.get_home_command(destination)
+            if attacked is not None:
+                stale.add(attacked.unit.position)
+        stale.update(other for other, (_, _, retreats) in self._retreat_entries.items() if retreats is not None)
+        self._update_retreat_entries(context, stale)
+        return self.retreat_map()
+
+    def _update_retreat_entries(self, context, territories):
+        """ Recomputes the retreat map entries of the commands at territories, given a context holding every resolution """
+        commands = [self.commands[territory] for territory in territories]
+        dislodged = []
+        for command in commands:
+            direct_attackers = _dislodging_attackers(context, command)
+            if direct_attackers is None:
+                self._retreat_entries[command.unit.position] = command.player.name, _resulting_unit(context, command), None
+            else:
+                dislodged.append((command, direct_attackers))
+        if len(dislodged) == 0:
+            return
+
+        blocked_mask = _blocked_retreat_mask(context, list(self.commands.values()))
+        for command, direct_attackers in dislodged:
+            retreats = _retreat_options(context, command, direct_attackers, blocked_mask)
+            self._retreat_entries[command.unit.position] = command.player.name, command.unit, retreats
+
+    def _key_provinces(self, command):
+        """
+        Returns the province ids keying every CommandMap entry that adjudicating command reads: its
+        unit's, its destination's and, for supports and transports, that of the unit it assists
+        """
+        provinces = { self._province_ids[command.unit.position], self._province_ids[command.destination] }
+        if isinstance(command, SupportCommand):
+            provinces.add(self._province_ids[command.supported_unit.position])
+        elif isinstance(command, ConvoyTransportCommand):
+            provinces.add(self._province_ids[command.transported_unit.position])
+        return provinces
+
+    def _update_dependencies(self, territories):
+        commands = [self.commands[territory] for territory in territories]
+        for territory, dependencies in build_dependency_graph(self.command_map, commands).items():
+            for dependency in self.dependency_graph[territory]:
+                self.dependents[dependency].discard(territory)
+            for dependency in dependencies:
+                self.dependents[dependency].add(territory)
+            self.dependency_graph[territory] = dependencies
+
+    def _dependency_cone(self, territories):
+        """ Returns territories, and every territory whose command transitively depends on one of them """
+        cone = set(territories)
+        to_visit = list(territories)
+        while len(to_visit) > 0:
+            for dependent in self.dependents[to_visit.pop()]:
+                if dependent not in cone:
+                    cone.add(dependent)
+                    to_visit.append(dependent)
+        return cone
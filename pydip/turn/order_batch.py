@@ -0,0 +1,210 @@
+from array import array
+from enum import Enum
+
+from pydip.player.command.command import ConvoyTransportCommand, SupportCommand
+from pydip.player.unit import Unit, UnitTypes
+from pydip.turn.command_kinds import build_command, command_kind, players_for_commands
+
+
+class OrderKinds(Enum):
+    """ Kinds of order held by an OrderBatch, numbered as in pydip.turn.command_kinds """
+    HOLD = 0
+    MOVE = 1
+    SUPPORT = 2
+    CONVOY_MOVE = 3
+    CONVOY_TRANSPORT = 4
+
+    def __str__(self):
+        return self.name
+
+
+""" aux_sources and aux_unit_types value for orders without a supported or transported unit """
+NO_AUX = 0xFFFF
+
+""" int -> UnitTypes, by value """
+_UNIT_TYPES = { unit_type.value: unit_type for unit_type in UnitTypes }
+
+_TROOP = UnitTypes.TROOP.value
+_FLEET = UnitTypes.FLEET.value
+_HOLD = OrderKinds.HOLD.value
+_MOVE = OrderKinds.MOVE.value
+_SUPPORT = OrderKinds.SUPPORT.value
+_CONVOY_MOVE = OrderKinds.CONVOY_MOVE.value
+_CONVOY_TRANSPORT = OrderKinds.CONVOY_TRANSPORT.value
+
+
+class OrderBatch:
+    """
+    A columnar batch of orders for one turn, for ingesting many orders at once without building and
+    validating a Command for each. Each order is a row across parallel arrays, with territories
+    held as their ids in the map's CompiledMap and players as indices into player_names.
+    illegal_rows checks every row against the CompiledMap's bitsets, applying the same rules as
+    the Command constructors, after which to_commands can build Commands without checking them again.
+    """
+
+    """ Map """
+    game_map = None
+
+    """ String[], names of the players issuing orders, indexed by player id """
+    player_names = None
+
+    """ array of int, player id for each order """
+    player_ids = None
+
+    """ array of int, UnitTypes value of the unit ordered """
+    unit_types = None
+
+    """ array of int, territory id of the unit ordered """
+    sources = None
+
+    """ array of int, OrderKinds value of each order """
+    kinds = None
+
+    """ array of int, territory id of the destination (the unit's own territory, for holds) """
+    targets = None
+
+    """ array of int, territory id of the supported or transported unit, or NO_AUX """
+    aux_sources = None
+
+    """ array of int, UnitTypes value of the supported or transported unit, or NO_AUX """
+    aux_unit_types = None
+
+    def __init__(self, game_map):
+        compiled_map = game_map.get_compiled_map()
+        assert len(compiled_map.names) < NO_AUX
+        self.game_map = game_map
+        self.player_names = []
+        self.player_ids = array('H')
+        self.unit_types = array('B')
+        self.sources = array('H')
+        self.kinds = array('B')
+        self.targets = array('H')
+        self.aux_sources = array('H')
+        self.aux_unit_types = array('H')
+
+        self._compiled_map = compiled_map
+        self._player_indices = dict()
+
+    @classmethod
+    def from_commands(cls, game_map, commands):
+        batch = cls(game_map)
+        for command in commands:
+            batch.add_command(command)
+        return batch
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, player_name, kind, unit_type, source, target=None, aux_unit_type=None, aux_source=None):
+        """
+        Adds an order, without validating it. target is required for every kind of order but holds,
+        and the aux arguments (the supported or transported unit) only for supports and convoy transports.
+        """
+        territory_ids = self._compiled_map.territory_ids
+        assert source in territory_ids
+        if kind == OrderKinds.HOLD:
+            target = source
+        assert target in territory_ids
+        has_aux = kind in (OrderKinds.SUPPORT, OrderKinds.CONVOY_TRANSPORT)
+        assert has_aux == (aux_source is not None)
+        assert aux_source is None or aux_source in territory_ids
+
+        if player_name not in self._player_indices:
+            self._player_indices[player_name] = len(self.player_names)
+            self.player_names.append(player_name)
+        self.player_ids.append(self._player_indices[player_name])
+        self.unit_types.append(unit_type.value)
+        self.sources.append(territory_ids[source])
+        self.kinds.append(kind.value)
+        self.targets.append(territory_ids[target])
+        self.aux_sources.append(territory_ids[aux_source] if has_aux else NO_AUX)
+        self.aux_unit_types.append(aux_unit_type.value if has_aux else NO_AUX)
+
+    def add_command(self, command):
+        kind = OrderKinds(command_kind(command))
+        aux_unit_type = aux_source = None
+        if isinstance(command, SupportCommand):
+            aux_unit_type, aux_source = command.supported_unit.unit_type, command.supported_unit.position
+        elif isinstance(command, ConvoyTransportCommand):
+            aux_unit_type, aux_source = command.transported_unit.unit_type, command.transported_unit.position
+        self.add(
+            command.player.name,
+            kind,
+            command.unit.unit_type,
+            command.unit.position,
+            command.destination,
+            aux_unit_type,
+            aux_source,
+        )
+
+    def illegal_rows(self, player_units=None):
+        """
+        Returns the indices of every order which the Command constructors would reject. If
+        player_units (a mapping of player names to iterables of Units) is provided, orders to units
+        their player does not own are rejected too; otherwise ownership is not checked.
+        """
+        compiled_map = self._compiled_map
+        adjacency = compiled_map.adjacency
+        province_masks = compiled_map.province_masks
+        convoy_mask = compiled_map.convoy_mask
+        sea_mask = compiled_map.sea_mask
+        # UnitTypes value -> bitset of territories units of that type can enter
+        enterable = { _TROOP: compiled_map.land_mask, _FLEET: compiled_map.sea_mask | compiled_map.coast_mask }
+
+        owned = None
+        if player_units is not None:
+            owned = set()
+            territory_ids = compiled_map.territory_ids
+            for player_id, name in enumerate(self.player_names):
+                owned.update(
+                    (player_id, territory_ids[unit.position], unit.unit_type.value)
+                    for unit in player_units.get(name, ())
+                )
+
+        illegal = []
+        columns = zip(self.player_ids, self.unit_types, self.sources, self.kinds, self.targets, self.aux_sources, self.aux_unit_types)
+        for row, (player_id, unit_type, source, kind, target, aux_source, aux_unit_type) in enumerate(columns):
+            if owned is not None and (player_id, source, unit_type) not in owned:
+                legal = False
+            elif kind == _HOLD or kind == _MOVE:
+                legal = target == source or ((adjacency[source] & enterable[unit_type]) >> target) & 1 == 1
+            elif kind == _SUPPORT:
+                legal = (
+                    (adjacency[source] & enterable[unit_type] & province_masks[target]) != 0 and (
+                        target == aux_source or
+                        ((adjacency[aux_source] & enterable[aux_unit_type]) >> target) & 1 == 1 or
+                        (aux_unit_type == _TROOP and (convoy_mask >> target) & (convoy_mask >> aux_source) & 1 == 1)
+                    )
+                )
+            elif kind == _CONVOY_MOVE:
+                legal = (
+                    unit_type == _TROOP and target != source and
+                    (convoy_mask >> source) & (convoy_mask >> target) & 1 == 1
+                )
+            elif kind == _CONVOY_TRANSPORT:
+                legal = (
+                    unit_type == _FLEET and aux_unit_type == _TROOP and (sea_mask >> source) & 1 == 1 and
+                    target != aux_source and (convoy_mask >> aux_source) & (convoy_mask >> target) & 1 == 1
+                )
+            else:
+                raise ValueError("Invalid order kind: {}".format(kind))
+            if not legal:
+                illegal.append(row)
+        return illegal
+
+    def to_commands(self, players=None):
+        """
+        Returns a Command for each order, in order. Commands are not validated as they are built, so
+        check the batch with illegal_rows first. players is as for pydip.turn.encoding.decode_commands.
+        """
+        names = self._compiled_map.names
+        entries = []
+        columns = zip(self.player_ids, self.unit_types, self.sources, self.kinds, self.targets, self.aux_sources, self.aux_unit_types)
+        for player_id, unit_type, source, kind, target, aux_source, aux_unit_type in columns:
+            unit = Unit(_UNIT_TYPES[unit_type], names[source])
+            aux_unit = None if aux_source == NO_AUX else Unit(_UNIT_TYPES[aux_unit_type], names[aux_source])
+            entries.append((kind, self.player_names[player_id], unit, aux_unit, names[target]))
+
+        if players is None:
+            players = players_for_commands(self.game_map, entries)
+        return [build_command(players[name], kind, unit, aux_unit, target) for kind, name, unit, aux_unit, target in entries]
@@ -0,0 +1,55 @@
+from collections.abc import Mapping
+
+
+class PlayerUnits(Mapping):
+    """
+    An immutable mapping of player names to frozensets of Units: the units each player has after
+    retreats or adjustments are resolved. It compares equal to any mapping with the same players and
+    units (such as a dict of sets), so it can be used wherever such a dict was.
+
+    Updates return a new PlayerUnits, which shares the sets of every player not updated with the
+    original, so a phase which only changes a few players' units does not copy everyone else's.
+    """
+
+    __slots__ = {
+        '_units': 'String -> frozenset of Unit, the units held by each player',
+    }
+
+    def __init__(self, player_units=()):
+        """ player_units is a mapping (or iterable of pairs) of player names to iterables of Units """
+        if isinstance(player_units, PlayerUnits):
+            self._units = player_units._units
+        else:
+            # frozenset returns a frozenset argument itself, so this only copies mutable sets
+            self._units = { player: frozenset(units) for player, units in dict(player_units).items() }
+
+    def __getitem__(self, player):
+        return self._units[player]
+
+    def __iter__(self):
+        return iter(self._units)
+
+    def __len__(self):
+        return len(self._units)
+
+    def __contains__(self, player):
+        return player in self._units
+
+    def __repr__(self):
+        return 'PlayerUnits({!r})'.format({ player: set(units) for player, units in self._units.items() })
+
+    def __reduce__(self):
+        return PlayerUnits, (self._units,)
+
+    def with_units(self, changes):
+        """
+        Returns a new PlayerUnits where each player in changes (a mapping of player names to
+        iterables of Units) has exactly the units given, and every other player is unchanged
+        """
+        if len(changes) == 0:
+            return self
+        player_units = PlayerUnits.__new__(PlayerUnits)
+        player_units._units = dict(self._units)
+        for player, units in changes.items():
+            player_units._units[player] = frozenset(units)
+        return player_units
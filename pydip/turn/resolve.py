@@ -1,14 +1,18 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
-from functools import reduce
 
-from pydip.map.territory import CoastTerritory, SeaTerritory, LandTerritory
 from pydip.player.command.command import MoveCommand, ConvoyMoveCommand, ConvoyTransportCommand, SupportCommand
 from pydip.player.unit import Unit
 from pydip.turn.command_map import CommandMap
+from pydip.turn.convoy_routes import ConvoyRoutes
+from pydip.turn.dependency_graph import build_dependency_graph, strongly_connected_components
 
 
-def resolve_turn(game_map, commands):
+""" String -- engine used by resolve_turn when none is given """
+_DEFAULT_ENGINE = 'recursive'
+
+
+def resolve_turn(game_map, commands, engine=None):
     """
     Returns resulting positions of each unit by considering interactions
     of provided list of commands.
@@ -17,10 +21,23 @@ def resolve_turn(game_map, commands):
     If a unit has _not_ been issued a command, you ought to insert a
     HoldCommand for that unit by default.
 
+    Resolution state is held in a ResolutionContext created for this call
+    alone, so separate turns may be resolved concurrently (e.g. from a
+    thread pool) without interfering with one another.
+
     map: Map representing game board
     commands: Command[] representing each command issued for this turn
               Expected to be fully populated for each unit on the board
               (Recommended to default to Hold for units not given orders)
+    engine: which strategy to use to resolve commands. Either:
+              * 'recursive' (default): resolves each command in turn, recursing
+                into whatever it depends on
+              * 'scc': builds the static dependency graph between commands
+                first, and resolves its strongly connected components in
+                dependency order, so guessing is only needed within cycles
+              * 'iterative': the same algorithm as 'recursive', but run on an
+                explicit stack, so long chains of dependencies cannot exceed
+                the interpreter's recursion limit
 
     returns a map of Player names to sub-maps representing results of that
     player's units. The sub-maps will be maps of Units to an optional set
@@ -29,12 +46,37 @@ def resolve_turn(game_map, commands):
     territory set is provided, a retreat is required. If it is empty, no
     retreat is possible.
     """
+    engine = engine or _DEFAULT_ENGINE
     command_map = CommandMap(game_map, commands)
-    _init_resolution()
-    resolutions = {command.unit.position: _resolve(game_map, command_map, command) for command in commands}
+    context = ResolutionContext(game_map, command_map)
+    if engine == 'recursive':
+        resolutions = {command.unit.position: _resolve(context, command) for command in commands}
+    elif engine == 'scc':
+        resolutions = _resolve_by_components(context, commands)
+    elif engine == 'iterative':
+        resolutions = {command.unit.position: _resolve_iteratively(context, command) for command in commands}
+    else:
+        raise ValueError("Invalid engine: {}".format(engine))
     return compute_retreats(game_map, command_map, commands, resolutions)
 
 
+def _resolve_by_components(context, commands):
+    """
+    Resolves commands one strongly connected component of the dependency graph at a time, with
+    every component a command could depend on resolved before it. A command outside any cycle
+    therefore finds all of its dependencies RESOLVED, and _resolve adjudicates it in a single pass;
+    the guess, re-guess and backup rule logic only comes into play within cyclic components.
+    """
+    commands_by_territory = {command.unit.position: command for command in commands}
+    graph = build_dependency_graph(context.command_map, commands)
+
+    resolutions = dict()
+    for component in strongly_connected_components(graph):
+        for territory in component:
+            resolutions[territory] = _resolve(context, commands_by_territory[territory])
+    return {command.unit.position: resolutions[command.unit.position] for command in commands}
+
+
 #------------------------------------------------------------------------------
 # Below implementation is taken with minor modification from Lucas Kruijswijk:
 # http://www.diplom.org/Zine/S2009M/Kruijswijk/DipMath_Chp6.htm
@@ -46,209 +88,369 @@ class ResolutionState(Enum):
     GUESSING   = 1
     RESOLVED   = 2
 
-resolution_map  = None
-state_map       = None
-dependency_list = None
 
+class ResolutionContext:
+    """
+    Holds all state for a single resolution of a turn. Nothing here is shared
+    between contexts, so each call to resolve_turn can proceed independently.
+    """
 
-def _init_resolution():
-    global resolution_map
-    global state_map
-    global dependency_list
-    resolution_map = defaultdict(bool)
-    state_map      = defaultdict(lambda: ResolutionState.UNRESOLVED)
-    dependency_list = list()
+    """ Map """
+    game_map = None
 
+    """ CommandMap """
+    command_map = None
 
-def _resolve(game_map, command_map, command):
-    global resolution_map
-    global state_map
-    global dependency_list
-    command_territory = command.unit.position
+    """ String -> bool, representing current resolution (or guess) for the command at a territory """
+    resolution_map = None
 
-    if state_map[command_territory] == ResolutionState.RESOLVED:
-        return resolution_map[command_territory]
+    """ String -> ResolutionState, representing how far along resolution is for the command at a territory """
+    state_map = None
 
-    if state_map[command_territory] == ResolutionState.GUESSING:
-        if command_territory not in dependency_list:
-            dependency_list.append(command_territory)
-        return resolution_map[command_territory]
+    """ String[], representing territories whose guessed resolutions were depended upon """
+    dependency_list = None
 
-    old_dependency_length = len(dependency_list)
+    """ String -> int, representing the order in which territories' commands most recently began guessing """
+    guess_sequence = None
+    guess_count    = None
 
-    # Initially, guess that we fail
-    resolution_map[command_territory] = False
-    state_map[command_territory]      = ResolutionState.GUESSING
-    fail_guess_result                 = _adjudicate(game_map, command_map, command)
+    """
+    (String, String) -> (int, String -> int), mapping (source, destination) province names to the
+    number of successful supports for that move, in total and by supporting player. Only filled in
+    once every such support is RESOLVED, and discarded if any of them is later reset.
+    """
+    support_counts = None
 
-    # If the dependency graph didn't change as a consequence, our result doesn't
-    # depend on the guess and we can return right away
-    if old_dependency_length == len(dependency_list):
-        # This is possible because of the backup rule in paradox resolutions
-        if state_map[command_territory] != ResolutionState.RESOLVED:
-            resolution_map[command_territory] = fail_guess_result
-            state_map[command_territory]      = ResolutionState.RESOLVED
+    """
+    (String, String) -> ConvoyRoutes, mapping (source, destination) province names of a convoyed
+    move to the transports known to have survived for it. Discarded if any of them is later reset.
+    """
+    convoy_routes = None
+
+    """ String -> optional MoveCommand, the head to head combatant of the move at each territory, once found """
+    head_to_head_combatants = None
+
+    """ String -> String, territory name to the name of its province """
+    _relevant_names = None
+
+    def __init__(self, game_map, command_map):
+        self.game_map        = game_map
+        self.command_map     = command_map
+        self.resolution_map  = defaultdict(bool)
+        self.state_map       = defaultdict(lambda: ResolutionState.UNRESOLVED)
+        self.dependency_list = list()
+        self.guess_sequence  = dict()
+        self.guess_count     = 0
+        self.support_counts  = dict()
+        self.convoy_routes   = dict()
+        self.head_to_head_combatants = dict()
+        self._relevant_names = game_map.get_compiled_map().relevant_names
+
+    @classmethod
+    def from_resolutions(cls, game_map, command_map, resolutions):
+        """
+        Builds a context where every command has already been resolved, as given by resolutions
+        (a map of territory names to bools, keyed like the output of _resolve in resolve_turn).
+        """
+        context = cls(game_map, command_map)
+        for territory, resolution in resolutions.items():
+            context.resolution_map[territory] = resolution
+            context.state_map[territory]      = ResolutionState.RESOLVED
+        return context
+
+    def support_key(self, source_name, destination_name):
+        return self._relevant_names[source_name], self._relevant_names[destination_name]
+
+    def mark_unresolved(self, territory):
+        self.state_map[territory] = ResolutionState.UNRESOLVED
+        self.invalidate_support_count(territory)
+        self.invalidate_convoy_routes(territory)
+
+    def mark_resolved(self, territory, resolution):
+        self.resolution_map[territory] = resolution
+        self.state_map[territory]      = ResolutionState.RESOLVED
+        self.invalidate_support_count(territory)
+        self.invalidate_convoy_routes(territory)
+
+    def invalidate_support_count(self, territory):
+        """ Discards any cached support count that the command at territory contributed to """
+        command = self.command_map.get_home_command(territory)
+        if isinstance(command, SupportCommand):
+            self.support_counts.pop(self.support_key(command.supported_unit.position, command.destination), None)
+
+    def get_convoy_routes(self, source_name, destination_name):
+        """
+        Returns the ConvoyRoutes for a convoyed move, or None if no transport is ordered for it.
+        Routes are only built once a move with transports is first searched.
+        """
+        key = self.support_key(source_name, destination_name)
+        routes = self.convoy_routes.get(key)
+        if routes is None:
+            transports = self.command_map.get_convoy_transports(source_name, destination_name)
+            if len(transports) == 0:
+                return None
+            routes = ConvoyRoutes(
+                self.game_map.get_compiled_map(),
+                key[0],
+                key[1],
+                { transport.unit.position for transport in transports },
+            )
+            self.convoy_routes[key] = routes
+        return routes
+
+    def invalidate_convoy_routes(self, territory):
+        """ Discards any convoy routes that the command at territory may have been counted towards """
+        if len(self.convoy_routes) == 0:
+            return
+        command = self.command_map.get_home_command(territory)
+        if isinstance(command, ConvoyTransportCommand):
+            self.convoy_routes.pop(self.support_key(command.transported_unit.position, command.destination), None)
+
+
+#------------------------------------------------------------------------------
+# Every calculation below is a generator, written once for both engines. Each
+# yields a Command wherever it needs that Command's resolution, and is sent the
+# resolution back. _resolve drives them recursively, resolving each yielded
+# Command with another call to _resolve, while _resolve_iteratively keeps the
+# generators for the commands being resolved on an explicit stack, so that the
+# depth of a chain of dependencies is limited by memory rather than by the
+# recursion limit.
+#------------------------------------------------------------------------------
+def _resolve(context, command):
+    # Resolved commands are by far the most common dependency, so skip starting a generator for them
+    if context.state_map[command.unit.position] == ResolutionState.RESOLVED:
+        return context.resolution_map[command.unit.position]
+    return _run_steps(context, _resolve_steps(context, command))
+
+
+def _run_steps(context, steps):
+    """ Returns the result of the generator steps, resolving each command it yields with _resolve """
+    resolution = None
+    try:
+        while True:
+            resolution = _resolve(context, steps.send(resolution))
+    except StopIteration as stop:
+        return stop.value
+
+
+def _resolve_iteratively(context, command):
+    """ Equivalent to _resolve(context, command), without recursing per dependency """
+    resolution_map = context.resolution_map
+    state_map      = context.state_map
+
+    stack = [_resolve_steps(context, command)]
+    resolution = None
+    while len(stack) > 0:
+        try:
+            dependency = stack[-1].send(resolution)
+        except StopIteration as stop:
+            stack.pop()
+            resolution = stop.value
+            continue
+
+        if state_map[dependency.unit.position] == ResolutionState.RESOLVED:
+            resolution = resolution_map[dependency.unit.position]
+        else:
+            stack.append(_resolve_steps(context, dependency))
+            resolution = None
 
-        return fail_guess_result
+    return resolution
 
-    dependency_sub_set = set(dependency_list[old_dependency_length:])
-    # If we don't depend on ourselves yet, we add ourselves in to complete the
-    # cycle, and let our caller sort out the details
-    if command_territory not in dependency_sub_set:
-        dependency_list.append(command_territory)
-        resolution_map[command_territory] = fail_guess_result
-        return fail_guess_result
 
-    # Otherwise, we depend on our own guess, so we need to clear out dependencies
-    # to check the other guess for consistency
-    for dependent_territory in dependency_sub_set:
-        state_map[dependent_territory] = ResolutionState.UNRESOLVED
-    dependency_list = dependency_list[:old_dependency_length]
+def _resolve_steps(context, command):
+    resolution_map = context.resolution_map
+    state_map      = context.state_map
+    command_territory = command.unit.position
 
-    resolution_map[command_territory] = True
-    state_map[command_territory]      = ResolutionState.GUESSING
-    success_guess_result              = _adjudicate(game_map, command_map, command)
+    # Each pass of this loop resolves the command from scratch, which is needed again after
+    # applying the backup rule, as it may not resolve this command itself
+    while True:
+        if state_map[command_territory] == ResolutionState.RESOLVED:
+            return resolution_map[command_territory]
+
+        if state_map[command_territory] == ResolutionState.GUESSING:
+            context.dependency_list.append(command_territory)
+            return resolution_map[command_territory]
+
+        old_dependency_length = len(context.dependency_list)
+        guess_sequence = context.guess_count
+        context.guess_count += 1
+        context.guess_sequence[command_territory] = guess_sequence
+
+        # Initially, guess that we fail
+        resolution_map[command_territory] = False
+        state_map[command_territory]      = ResolutionState.GUESSING
+        fail_guess_result                 = yield from _adjudicate_steps(context, command)
+
+        # If the dependency graph didn't change as a consequence, our result doesn't
+        # depend on the guess and we can return right away
+        if old_dependency_length == len(context.dependency_list):
+            # This is possible because of the backup rule in paradox resolutions
+            if state_map[command_territory] != ResolutionState.RESOLVED:
+                resolution_map[command_territory] = fail_guess_result
+                state_map[command_territory]      = ResolutionState.RESOLVED
+
+            return fail_guess_result
+
+        dependency_sub_set = set(context.dependency_list[old_dependency_length:])
+        # If we depended on a guess that was made before ours, we're part of a cycle
+        # belonging to one of our callers, so we add ourselves in to complete the
+        # cycle, and let that caller sort out the details
+        if any(context.guess_sequence[territory] < guess_sequence for territory in dependency_sub_set):
+            context.dependency_list.append(command_territory)
+            resolution_map[command_territory] = fail_guess_result
+            return fail_guess_result
 
-    # If results are consistent, no need for further checking
-    if fail_guess_result == success_guess_result:
+        # Otherwise, we depend on our own guess, so we need to clear out dependencies
+        # to check the other guess for consistency
         for dependent_territory in dependency_sub_set:
-            state_map[dependent_territory] = ResolutionState.UNRESOLVED
-        dependency_list = dependency_list[:old_dependency_length]
+            context.mark_unresolved(dependent_territory)
+        context.dependency_list = context.dependency_list[:old_dependency_length]
 
-        resolution_map[command_territory] = fail_guess_result
-        state_map[command_territory]      = ResolutionState.RESOLVED
-        return fail_guess_result
+        resolution_map[command_territory] = True
+        state_map[command_territory]      = ResolutionState.GUESSING
+        success_guess_result              = yield from _adjudicate_steps(context, command)
 
-    # If we got to this point, that means we encountered a paradox that has two
-    # consistent outcomes, and we need a backup rule to fully resolve it
-    _backup_rule(command_map, dependency_sub_set)
-    dependency_list = dependency_list[:old_dependency_length]
+        # If results are consistent, no need for further checking
+        if fail_guess_result == success_guess_result:
+            for dependent_territory in dependency_sub_set:
+                context.mark_unresolved(dependent_territory)
+            context.dependency_list = context.dependency_list[:old_dependency_length]
+
+            resolution_map[command_territory] = fail_guess_result
+            state_map[command_territory]      = ResolutionState.RESOLVED
+            return fail_guess_result
 
-    # And because the backup rule may not resolve our own command, we'll need to
-    # start fresh just to be sure
-    return _resolve(game_map, command_map, command)
+        # If we got to this point, that means we encountered a paradox that has two
+        # consistent outcomes, and we need a backup rule to fully resolve it
+        _backup_rule(context, dependency_sub_set)
+        context.dependency_list = context.dependency_list[:old_dependency_length]
 
 
-def _adjudicate(game_map, command_map, command):
+def _adjudicate_steps(context, command):
     if isinstance(command, MoveCommand):
-        return _adjudicate_move(game_map, command_map, command)
+        return (yield from _adjudicate_move_steps(context, command))
     elif isinstance(command, ConvoyMoveCommand):
-        return _adjudicate_convoy_move(game_map, command_map, command)
+        return (yield from _adjudicate_convoy_move_steps(context, command))
     elif isinstance(command, ConvoyTransportCommand):
-        return _adjudicate_convoy_transport(game_map, command_map, command)
+        return (yield from _adjudicate_convoy_transport_steps(context, command))
     elif isinstance(command, SupportCommand):
-        return _adjudicate_support(game_map, command_map, command)
+        return (yield from _adjudicate_support_steps(context, command))
     else:
         raise ValueError("Command unexpected type")
 
 
-def _backup_rule(command_map, dependency_set):
-    global resolution_map
-    global state_map
+def _backup_rule(context, dependency_set):
+    command_map = context.command_map
     for dependency_territory in dependency_set:
         dependency = command_map.get_home_command(dependency_territory)
         if isinstance(dependency, MoveCommand):
             if isinstance(command_map.get_home_command(dependency.destination), ConvoyTransportCommand):
-                _apply_szykman(command_map, dependency_set)
+                _apply_szykman(context, dependency_set)
                 return
-    _apply_circular_movement(command_map, dependency_set)
+    _apply_circular_movement(context, dependency_set)
 
 
-def _apply_szykman(command_map, dependency_set):
+def _apply_szykman(context, dependency_set):
     for dependency_territory in dependency_set:
-        dependency = command_map.get_home_command(dependency_territory)
+        dependency = context.command_map.get_home_command(dependency_territory)
         if isinstance(dependency, ConvoyMoveCommand) or isinstance(dependency, ConvoyTransportCommand):
-            resolution_map[dependency_territory] = False
-            state_map[dependency_territory] = ResolutionState.RESOLVED
+            context.mark_resolved(dependency_territory, False)
         else:
-            state_map[dependency_territory] = ResolutionState.UNRESOLVED
+            context.mark_unresolved(dependency_territory)
 
 
-def _apply_circular_movement(command_map, dependency_set):
+def _apply_circular_movement(context, dependency_set):
     for dependency_territory in dependency_set:
-        dependency = command_map.get_home_command(dependency_territory)
+        dependency = context.command_map.get_home_command(dependency_territory)
         if isinstance(dependency, MoveCommand) or isinstance(dependency, ConvoyMoveCommand):
-            resolution_map[dependency_territory] = True
-            state_map[dependency_territory] = ResolutionState.RESOLVED
+            context.mark_resolved(dependency_territory, True)
         else:
-            state_map[dependency_territory] = ResolutionState.UNRESOLVED
+            context.mark_unresolved(dependency_territory)
 
 
 #----------------------
 # convoys
 #----------------------
-def _adjudicate_convoy_move(game_map, command_map, command):
+def _adjudicate_convoy_move_steps(context, command):
     assert isinstance(command, ConvoyMoveCommand)
-    if not _has_path(game_map, command_map, command):
+    if not (yield from _has_path_steps(context, command)):
         return False
-    return _adjudicate_move(game_map, command_map, command)
+    return (yield from _adjudicate_move_steps(context, command))
 
 
-def _adjudicate_convoy_transport(game_map, command_map, command):
+def _adjudicate_convoy_transport_steps(context, command):
     assert isinstance(command, ConvoyTransportCommand)
-    return not _is_dislodged(game_map, command_map, command.unit)
+    return not (yield from _is_dislodged_steps(context, command.unit))
 
 
-def _has_path(game_map, command_map, command):
+def _has_path_steps(context, command):
+    """
+    Searches for a route of successful transports for a convoyed move. Transports found to have
+    RESOLVED successfully are kept in the context's ConvoyRoutes for the move, so that once they
+    connect the source and destination (or it is settled that they never will), later queries are
+    answered without searching.
+    """
     assert isinstance(command, ConvoyMoveCommand)
-    visited     = set()
-    source      = command.unit.position
-    destination = command.destination
-    possible_transports = command_map.get_convoy_transports(source, destination)
-    possible_transport_territories = { transport.unit.position for transport in possible_transports }
-
-    starting_territory = game_map.name_map[source]
-    coastal_adjacencies = reduce(set.__or__, [game_map.adjacency[coast.name] for coast in starting_territory.coasts])
-    coastal_adjacencies = list(filter(lambda t: isinstance(game_map.name_map[t], SeaTerritory), coastal_adjacencies))
-    to_visit = [
-        possible_transport_territory
-        for possible_transport_territory in possible_transport_territories
-        if any(possible_transport_territory in coastal_adjacency for coastal_adjacency in coastal_adjacencies)
-    ]
+    routes = context.get_convoy_routes(command.unit.position, command.destination)
+    if routes is None:
+        return False
+    if routes.connected():
+        return True
+    if routes.blocked:
+        return False
+
+    compiled_map     = context.game_map.get_compiled_map()
+    sea_neighbours   = compiled_map.sea_neighbours
+    destination_seas = compiled_map.coastal_seas[routes.destination]
+    transports       = routes.transports
+    state_map        = context.state_map
 
+    to_visit = deque(transport for transport in compiled_map.coastal_seas[routes.source] if transport in transports)
+    visited  = set(to_visit)
+    settled  = True
     while len(to_visit) > 0:
-        visiting = to_visit.pop()
-        visited.add(visiting)
+        visiting = to_visit.popleft()
+        succeeded = yield context.command_map.get_home_command(visiting)
+        if state_map[visiting] != ResolutionState.RESOLVED:
+            settled = False
         # if the convoy was disrupted, we can't use it as part of our chain
-        if not _resolve(game_map, command_map, command_map.get_home_command(visiting)):
+        if not succeeded:
             continue
+        if state_map[visiting] == ResolutionState.RESOLVED:
+            routes.add_surviving_transport(visiting)
 
-        adjacent = [game_map.name_map[adj] for adj in game_map.adjacency[visiting]]
-
-        adjacent_land = {
-            coast.parent.name for coast in adjacent
-            if isinstance(coast, CoastTerritory)
-        }
-        if destination in adjacent_land:
+        if visiting in destination_seas:
             return True
+        for neighbour in sea_neighbours[visiting]:
+            if neighbour in transports and neighbour not in visited:
+                visited.add(neighbour)
+                to_visit.append(neighbour)
 
-        to_visit = [
-           territory.name for territory in adjacent
-           if (territory.name not in visited and
-               territory.name in possible_transport_territories)
-        ] + to_visit
-
+    if settled:
+        routes.blocked = True
     return False
 
 
 #----------------------
 # move
 #----------------------
-def _adjudicate_move(game_map, command_map, command):
+def _adjudicate_move_steps(context, command):
     assert isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand)
 
-    attack_strength = _attack_strength(game_map, command_map, command)
+    attack_strength = yield from _attack_strength_steps(context, command)
 
-    prevent_combatants     = _get_prevent_combatants(command_map, command)
-    high_prevent_strength = max([_prevent_strength(game_map, command_map, prevent_combatant)
-                                 for prevent_combatant in prevent_combatants] + [0])
+    high_prevent_strength = 0
+    for prevent_combatant in _get_prevent_combatants(context.command_map, command):
+        prevent_strength = yield from _prevent_strength_steps(context, prevent_combatant)
+        high_prevent_strength = max(high_prevent_strength, prevent_strength)
     if attack_strength <= high_prevent_strength:
         return False
 
-    head_to_head_combatant = _get_head_to_head_combatant(game_map, command_map, command)
+    head_to_head_combatant = _get_head_to_head_combatant(context, command)
     if head_to_head_combatant is not None:
-        return attack_strength > _defend_strength(game_map, command_map, head_to_head_combatant)
-    return attack_strength > _hold_strength(game_map, command_map, command.destination)
+        return attack_strength > (yield from _defend_strength_steps(context, head_to_head_combatant))
+    return attack_strength > (yield from _hold_strength_steps(context, command.destination))
 
 
 def _get_prevent_combatants(command_map, command):
@@ -259,211 +461,270 @@ def _get_prevent_combatants(command_map, command):
     return combatants
 
 
-def _get_head_to_head_combatant(game_map, command_map, command):
+def _get_head_to_head_combatant(context, command):
+    """ _find_head_to_head_combatant only reads the CommandMap, so its result is kept for the whole resolution """
+    territory = command.unit.position
+    combatants = context.head_to_head_combatants
+    if territory not in combatants:
+        combatants[territory] = _find_head_to_head_combatant(context, command)
+    return combatants[territory]
+
+
+def _find_head_to_head_combatant(context, command):
     if isinstance(command, ConvoyMoveCommand):
         return None
-    potential_attacker = command_map.get_home_command(command.destination)
+    potential_attacker = context.command_map.get_home_command(command.destination)
     if potential_attacker is not None:
         if isinstance(potential_attacker, MoveCommand):
-            if _same_territory_by_name(game_map, command.unit.position, potential_attacker.destination):
+            if _same_territory_by_name(context.game_map, command.unit.position, potential_attacker.destination):
                 return potential_attacker
     return None
 
 
-def _attack_strength(game_map, command_map, command):
+def _attack_strength_steps(context, command):
     if isinstance(command, ConvoyMoveCommand):
-        if not _has_path(game_map, command_map, command):
+        if not (yield from _has_path_steps(context, command)):
             return 0
-    attacked_command = command_map.get_home_command(command.destination)
-    supporters = command_map.get_supports(command.unit.position, command.destination)
-    supporters = filter(lambda c: _resolve(game_map, command_map, c), supporters)
+    attacked_command = context.command_map.get_home_command(command.destination)
 
     if attacked_command is None:
-        return 1 + len(list(supporters))
-    if _get_head_to_head_combatant(game_map, command_map, command) is None:
+        return 1 + (yield from _support_count_steps(context, command.unit.position, command.destination))
+    if _get_head_to_head_combatant(context, command) is None:
         if isinstance(attacked_command, MoveCommand) or isinstance(attacked_command, ConvoyMoveCommand):
-            if _resolve(game_map, command_map, attacked_command):
-                return 1 + len(list(supporters))
+            if (yield attacked_command):
+                return 1 + (yield from _support_count_steps(context, command.unit.position, command.destination))
     if attacked_command.player.name == command.player.name:
         return 0
 
-    supporters = filter(lambda c: c.player.name != attacked_command.player.name, supporters)
-    return 1 + len(list(supporters))
+    return 1 + (yield from _support_count_steps(
+        context,
+        command.unit.position,
+        command.destination,
+        attacked_command.player.name,
+    ))
 
 
-def _prevent_strength(game_map, command_map, command):
+def _prevent_strength_steps(context, command):
     if isinstance(command, ConvoyMoveCommand):
-        if not _has_path(game_map, command_map, command):
+        if not (yield from _has_path_steps(context, command)):
             return 0
-    head_to_head_combatant = _get_head_to_head_combatant(game_map, command_map, command)
+    head_to_head_combatant = _get_head_to_head_combatant(context, command)
     if head_to_head_combatant is not None:
-        if _resolve(game_map, command_map, head_to_head_combatant):
+        if (yield head_to_head_combatant):
             return 0
 
-    supporters = command_map.get_supports(command.unit.position, command.destination)
-    supporters = filter(lambda c: _resolve(game_map, command_map, c), supporters)
-    return 1 + len(list(supporters))
+    return 1 + (yield from _support_count_steps(context, command.unit.position, command.destination))
 
 
-def _defend_strength(game_map, command_map, command):
-    supporters = command_map.get_supports(command.unit.position, command.destination)
-    supporters = filter(lambda c: _resolve(game_map, command_map, c), supporters)
-    return 1 + len(list(supporters))
+def _defend_strength_steps(context, command):
+    return 1 + (yield from _support_count_steps(context, command.unit.position, command.destination))
 
 
-def _hold_strength(game_map, command_map, territory):
-    home_command = command_map.get_home_command(territory)
+def _hold_strength_steps(context, territory):
+    home_command = context.command_map.get_home_command(territory)
     if home_command is None:
         return 0
     if isinstance(home_command, MoveCommand) or isinstance(home_command, ConvoyMoveCommand):
-        return 0 if _resolve(game_map, command_map, home_command) else 1
-    supporters = command_map.get_supports(territory, territory)
-    supporters = filter(lambda c: _resolve(game_map, command_map, c), supporters)
-    return 1 + len(list(supporters))
+        return 0 if (yield home_command) else 1
+    return 1 + (yield from _support_count_steps(context, territory, territory))
+
+
+def _support_count_steps(context, source, destination, excluded_player_name=None):
+    """
+    Counts successful supports for the move from source to destination, ignoring any given by
+    excluded_player_name. Every support is resolved, whether or not it is excluded. Once all of the
+    supports have been RESOLVED the counts are kept on the context, so further queries are lookups.
+    """
+    key = context.support_key(source, destination)
+    counts = context.support_counts.get(key)
+    if counts is None:
+        counts = yield from _count_supports_steps(context, key)
+    total, player_counts = counts
+    if excluded_player_name is None:
+        return total
+    return total - player_counts.get(excluded_player_name, 0)
+
+
+def _count_supports_steps(context, key):
+    supports = context.command_map.get_supports(*key)
+    total = 0
+    player_counts = dict()
+    for support in supports:
+        if (yield support):
+            total += 1
+            player_name = support.player.name
+            player_counts[player_name] = player_counts.get(player_name, 0) + 1
+
+    counts = total, player_counts
+    if all(context.state_map[support.unit.position] == ResolutionState.RESOLVED for support in supports):
+        context.support_counts[key] = counts
+    return counts
 
 
 #----------------------
 # support
 #----------------------
-def _adjudicate_support(game_map, command_map, command):
+def _adjudicate_support_steps(context, command):
     assert isinstance(command, SupportCommand)
-    if _invalid_support(game_map, command_map, command):
+    if _invalid_support(context, command):
         return False
-    if len(_indirect_non_convoy_attackers(game_map, command_map, command)) > 0:
+    if len(_indirect_non_convoy_attackers(context, command)) > 0:
         return False
-    for convoy_attacker in _indirect_convoy_attackers(game_map, command_map, command):
-        if _has_path(game_map, command_map, convoy_attacker):
+    for convoy_attacker in _indirect_convoy_attackers(context, command):
+        if (yield from _has_path_steps(context, convoy_attacker)):
             return False
-    return not _is_dislodged(game_map, command_map, command.unit)
+    return not (yield from _is_dislodged_steps(context, command.unit))
 
 
-def _invalid_support(game_map, command_map, command):
-    supported_command = command_map.get_home_command(command.supported_unit.position)
+def _invalid_support(context, command):
+    supported_command = context.command_map.get_home_command(command.supported_unit.position)
     if isinstance(supported_command, MoveCommand) or isinstance(supported_command, ConvoyMoveCommand):
-        return not _same_territory_by_name(game_map, supported_command.destination, command.destination)
-    return not _same_territory_by_name(game_map, command.destination, command.supported_unit.position)
+        return not _same_territory_by_name(context.game_map, supported_command.destination, command.destination)
+    return not _same_territory_by_name(context.game_map, command.destination, command.supported_unit.position)
 
 
-def _indirect_non_convoy_attackers(game_map, command_map, command):
-    filtered = command_map.get_attackers(command.unit.position)
+def _indirect_non_convoy_attackers(context, command):
+    game_map = context.game_map
+    filtered = context.command_map.get_attackers(command.unit.position)
     filtered = filter(lambda c: not _same_territory_by_name(game_map, c.unit.position, command.destination), filtered)
     filtered = filter(lambda c: c.player != command.player, filtered)
     return list(filtered)
 
 
-def _indirect_convoy_attackers(game_map, command_map, command):
-    filtered = command_map.get_convoy_attackers(command.unit.position)
+def _indirect_convoy_attackers(context, command):
+    game_map = context.game_map
+    filtered = context.command_map.get_convoy_attackers(command.unit.position)
     filtered = filter(lambda c: not _same_territory_by_name(game_map, c.unit.position, command.destination), filtered)
     filtered = filter(lambda c: c.player.name != command.player.name, filtered)
     return list(filtered)
 
 
-def _is_dislodged(game_map, command_map, unit):
+def _is_dislodged_steps(context, unit):
     """
     Determines if the unit will be dislodged by a different move, assuming it stays in place.
     Please note that this function does not indicate whether the unit _will_ stay in place.
     """
-    return any((_resolve(game_map, command_map, attack) for attack in _attackers(game_map, command_map, unit)))
+    for attack in _attackers(context, unit):
+        if (yield attack):
+            return True
+    return False
 
 
-def _attackers(game_map, command_map, unit):
-    filtered = command_map.get_attackers(unit.position)
+def _attackers(context, unit):
+    filtered = context.command_map.get_attackers(unit.position)
     filtered = filter(
         lambda c: isinstance(c, MoveCommand) or isinstance(c, ConvoyMoveCommand),
         filtered,
     )
     filtered = filter(
-        lambda c: _same_territory_by_name(game_map, c.destination, unit.position),
+        lambda c: _same_territory_by_name(context.game_map, c.destination, unit.position),
         filtered,
     )
 
     return list(filtered)
 
 def _same_territory_by_name(game_map, territory_name_1, territory_name_2):
-    territory_1 = game_map.name_map[territory_name_1]
-    territory_2 = game_map.name_map[territory_name_2]
-    return territory_1.same_territory(territory_2)
+    province_ids = game_map.get_compiled_map().province_ids_by_name
+    return province_ids[territory_name_1] == province_ids[territory_name_2]
+
 
 #----------------------
 # Retreats
 #----------------------
 def compute_retreats(game_map, command_map, commands, resolutions):
+    context = ResolutionContext.from_resolutions(game_map, command_map, resolutions)
     player_results = defaultdict(dict)
-    occupied_territories = _get_occupations(game_map, commands, resolutions)
+    blocked_mask = None
 
     for command in commands:
-        current_position = command.unit.position
-        if resolutions[current_position]:
-            if isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand):
-                moved_unit = Unit(command.unit.unit_type, command.destination)
-                player_results[command.player.name][moved_unit] = None
-            else:
-                player_results[command.player.name][command.unit] = None
-        else:
-            direct_attackers = list(filter(
-                lambda c: resolutions[c.unit.position],
-                command_map.get_attackers(current_position),
-            ))
-            convoy_attackers = list(filter(
-                lambda c: resolutions[c.unit.position],
-                command_map.get_convoy_attackers(current_position),
-            ))
-            attackers = direct_attackers + convoy_attackers
-            if len(attackers) == 0:
-                player_results[command.player.name][command.unit] = None
-            else:
-                retreat_options = game_map.adjacency[current_position]
-                retreat_options = filter(
-                    lambda t: t not in occupied_territories,
-                    retreat_options,
-                )
-                retreat_options = filter(
-                    lambda t: all(t not in _applicable_territories(game_map, attacker.unit.position)
-                                  for attacker in direct_attackers),
-                    retreat_options,
-                )
-                retreat_options = filter(
-                    lambda t: _hold_strength(game_map, command_map, t) == 0,
-                    retreat_options,
-                )
-                retreat_options = filter(
-                    lambda t: all(_prevent_strength(game_map, command_map, attacker) == 0
-                                  for attacker in command_map.get_attackers(t)),
-                    retreat_options,
-                )
-
-                player_results[command.player.name][command.unit] = set(retreat_options)
+        direct_attackers = _dislodging_attackers(context, command)
+        if direct_attackers is None:
+            player_results[command.player.name][_resulting_unit(context, command)] = None
+            continue
+        # Only dislodged units need the blocked provinces, and most turns dislodge none
+        if blocked_mask is None:
+            blocked_mask = _blocked_retreat_mask(context, commands)
+        player_results[command.player.name][command.unit] = _retreat_options(
+            context,
+            command,
+            direct_attackers,
+            blocked_mask,
+        )
 
     return player_results
 
 
-def _applicable_territories(game_map, territory_name):
-    territory = game_map.name_map[territory_name]
-    applicable = { territory_name }
-    if isinstance(territory, LandTerritory):
-        applicable |= { coast.name for coast in territory.coasts }
-    elif isinstance(territory, CoastTerritory):
-        applicable.add(territory.parent.name)
-        applicable |= { coast.name for coast in territory.parent.coasts }
+def _resulting_unit(context, command):
+    """ Returns command's unit where it ends the turn, assuming it is not dislodged """
+    if context.resolution_map[command.unit.position]:
+        if isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand):
+            return Unit(command.unit.unit_type, command.destination)
+    return command.unit
+
+
+def _dislodging_attackers(context, command):
+    """
+    Returns None if command's unit is not dislodged. Otherwise, returns the successful moves against
+    it which were not convoyed, which is empty if it was only dislodged by a convoyed move.
+    """
+    resolution_map = context.resolution_map
+    current_position = command.unit.position
+    if resolution_map[current_position]:
+        return None
+
+    direct_attackers = [
+        attacker for attacker in context.command_map.get_attackers(current_position)
+        if resolution_map[attacker.unit.position]
+    ]
+    if len(direct_attackers) == 0 and not any(
+        resolution_map[attacker.unit.position] for attacker in context.command_map.get_convoy_attackers(current_position)
+    ):
+        return None
+    return direct_attackers
 
-    return applicable
 
+def _blocked_retreat_mask(context, commands):
+    """
+    Returns the bitset (over the CompiledMap's territory ids) of every territory no unit may retreat
+    to this turn, whichever unit is retreating: every province occupied once movement is resolved,
+    which includes every province with a non-zero hold strength, and every province some move
+    (other than a convoyed one) entered with a non-zero prevent strength, as it was contested.
+    """
+    compiled_map   = context.game_map.get_compiled_map()
+    territory_ids  = compiled_map.territory_ids
+    province_masks = compiled_map.province_masks
+    resolution_map = context.resolution_map
 
-def _get_occupations(game_map, commands, resolutions):
-    occupations = set()
+    blocked_mask = 0
     for command in commands:
-        if isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand):
-            if resolutions[command.unit.position]:
-                occupations |= _applicable_territories(game_map, command.destination)
-            else:
-                occupations |= _applicable_territories(game_map, command.unit.position)
+        moves = isinstance(command, MoveCommand) or isinstance(command, ConvoyMoveCommand)
+        if moves and resolution_map[command.unit.position]:
+            blocked_mask |= province_masks[territory_ids[command.destination]]
         else:
-            occupations |= _applicable_territories(game_map, command.unit.position)
+            blocked_mask |= province_masks[territory_ids[command.unit.position]]
 
-    return occupations
+    # A move's prevent strength is only zero if it lost a head-to-head battle, so this is
+    # _prevent_strength_steps(context, command) > 0 without counting supports
+    for command in commands:
+        if isinstance(command, MoveCommand):
+            destination_mask = province_masks[territory_ids[command.destination]]
+            if blocked_mask & destination_mask == 0:
+                opponent = _find_head_to_head_combatant(context, command)
+                if opponent is None or not resolution_map[opponent.unit.position]:
+                    blocked_mask |= destination_mask
+    return blocked_mask
 
 
-def _attacked_by_other_unit(command_map, command, territory):
-    attackers = command_map.get_attackers(territory) + command_map.get_convoy_attackers(territory)
-    attackers = filter(lambda c: c != command, attackers)
-    return len(list(attackers)) > 0
+def _retreat_options(context, command, direct_attackers, blocked_mask):
+    """
+    Returns the set of territories a dislodged unit may retreat to: those adjacent to it, other than
+    those in blocked_mask (from _blocked_retreat_mask) and the provinces its direct attackers came from
+    """
+    compiled_map   = context.game_map.get_compiled_map()
+    territory_ids  = compiled_map.territory_ids
+    province_masks = compiled_map.province_masks
+
+    excluded_mask = blocked_mask
+    for attacker in direct_attackers:
+        excluded_mask |= province_masks[territory_ids[attacker.unit.position]]
+    return compiled_map.names_for_mask(compiled_map.adjacency[territory_ids[command.unit.position]] & ~excluded_mask)
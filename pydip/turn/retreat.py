@@ -1,5 +1,8 @@
+from collections import defaultdict
+
 from pydip.player.command.retreat_command import RetreatCommand, RetreatMoveCommand
 from pydip.player.unit import Unit
+from pydip.turn.player_units import PlayerUnits
 
 
 def resolve_retreats(retreat_map, commands):
@@ -12,32 +15,76 @@ def resolve_retreats(retreat_map, commands):
     case that a retreat is not expected for that unit), or a set of territory
     names (which hold the valid retreat targets).
 
-    Returns a mapping of players to lists of units, representing which units
-    in which locations those players will have after resolving retreats. Will
-    be equivalent to the entries in retreat_map, minus any disbanded units --
-    and, of course, without any retreat requirements.
+    Returns a PlayerUnits, mapping players to frozensets of units, representing
+    which units in which locations those players will have after resolving
+    retreats. Will be equivalent to the entries in retreat_map, minus any
+    disbanded units -- and, of course, without any retreat requirements.
+    """
+    resolver = RetreatResolver(retreat_map)
+    for command in commands:
+        resolver.add_command(command)
+    return resolver.resolve()
+
+
+class RetreatResolver:
+    """
+    Resolves retreats from retreat commands given one at a time, as they arrive, rather than all at
+    once. Each command is checked and counted against its destination as it is added, so resolving
+    is a single pass over the retreating moves. A retreat succeeds unless a different retreat was
+    ordered to the same destination, in which case both units are disbanded.
     """
-    assert all(isinstance(command, RetreatCommand) for command in commands)
-    retreaters = { (command.player.name, command.unit) for command in commands }
-    valid_retreaters = set()
-    for player in retreat_map.keys():
-        valid_retreaters |= {
+
+    """ Player name -> Unit -> optional set of territory names, as passed to resolve_retreats """
+    retreat_map = None
+
+    """ set of (String, Unit), player name and unit of every unit which must retreat """
+    _expected_retreaters = None
+
+    """ set of (String, Unit), player name and unit of every unit given a retreat command so far """
+    _retreaters = None
+
+    """ set of RetreatCommand, every distinct command added so far """
+    _commands = None
+
+    """ RetreatMoveCommand[], every distinct retreating move added so far """
+    _moves = None
+
+    """ String -> int, number of distinct retreating moves to each destination """
+    _destination_counts = None
+
+    def __init__(self, retreat_map):
+        self.retreat_map = retreat_map
+        self._expected_retreaters = {
             (player, unit)
-            for unit in retreat_map[player].keys()
-            if retreat_map[player][unit] is not None
+            for player, units in retreat_map.items()
+            for unit, retreats in units.items()
+            if retreats is not None
         }
-    assert retreaters == valid_retreaters
+        self._retreaters = set()
+        self._commands = set()
+        self._moves = []
+        self._destination_counts = defaultdict(int)
 
-    result_map = { player : set() for player in retreat_map }
-    for player in retreat_map:
-        for unit in retreat_map[player]:
-            if retreat_map[player][unit] is None:
-                result_map[player].add(unit)
+    def add_command(self, command):
+        assert isinstance(command, RetreatCommand)
+        assert (command.player.name, command.unit) in self._expected_retreaters
+        if command in self._commands:
+            return
+        self._commands.add(command)
+        self._retreaters.add((command.player.name, command.unit))
+        if isinstance(command, RetreatMoveCommand):
+            self._moves.append(command)
+            self._destination_counts[command.destination] += 1
 
-    commands = list(filter(lambda c: isinstance(c, RetreatMoveCommand), commands))
-    for command in commands:
-        other_commands = list(filter(lambda c: c != command, commands))
-        if all(command.destination != other_command.destination for other_command in other_commands):
-            result_map[command.player.name].add(Unit(command.unit.unit_type, command.destination))
+    def resolve(self):
+        """ Returns the same result as resolve_retreats, once every unit which must retreat has a command """
+        assert self._retreaters == self._expected_retreaters
 
-    return result_map
+        result_map = {
+            player: { unit for unit, retreats in units.items() if retreats is None }
+            for player, units in self.retreat_map.items()
+        }
+        for command in self._moves:
+            if self._destination_counts[command.destination] == 1:
+                result_map[command.player.name].add(Unit(command.unit.unit_type, command.destination))
+        return PlayerUnits(result_map)
@@ -3,6 +3,7 @@ from setuptools import find_packages
 setup(
     name = 'pydip',
     packages = find_packages(exclude=['pydip.test', 'pydip.test.*']),
+    package_data = { 'pydip.map.predefined': ['*.map'] },
     version = '0.1.8',
     description = 'Adjudication logic engine for Diplomacy board game',
     author = 'Aric Parkinson',